@@ -0,0 +1,28 @@
+"""Add article updated_at for HTTP validators
+
+Revision ID: 7d3f9a1c5e20
+Revises: 2cbc6cede235
+Create Date: 2026-10-19 11:02:14.218305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3f9a1c5e20'
+down_revision: Union[str, None] = '2cbc6cede235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('articles', sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False))
+    # Existing rows were last modified no later than their creation as far as we know
+    op.execute('UPDATE articles SET updated_at = created_at')
+
+
+def downgrade() -> None:
+    op.drop_column('articles', 'updated_at')
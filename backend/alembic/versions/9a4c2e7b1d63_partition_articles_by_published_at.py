@@ -0,0 +1,164 @@
+"""Partition articles by month of published_at
+
+Revision ID: 9a4c2e7b1d63
+Revises: 7d3f9a1c5e20
+Create Date: 2026-10-19 13:40:52.118904
+
+Runs online: rows are copied into the new partitioned table in short
+batches while a trigger mirrors concurrent writes, and the tables are
+swapped at the end under a brief exclusive lock.
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c2e7b1d63'
+down_revision: Union[str, None] = '7d3f9a1c5e20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+PARTITIONS_AHEAD = 3
+
+COLUMNS = (
+    'id, title, content, source, category, url, views, is_deleted, '
+    'deleted_at, published_at, created_at, updated_at'
+)
+INDEXED = ('category', 'source', 'url', 'views', 'deleted_at', 'published_at')
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partition(month: date) -> None:
+    end = _add_months(month, 1)
+    op.execute(
+        f"CREATE TABLE articles_{month:%Y_%m} PARTITION OF articles_partitioned "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+        f"TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # published_at joins the primary key; fill the gaps in small batches
+    with op.get_context().autocommit_block():
+        while conn.execute(sa.text(
+            'UPDATE articles SET published_at = created_at WHERE id IN '
+            '(SELECT id FROM articles WHERE published_at IS NULL LIMIT :n)'
+        ), {'n': BATCH_SIZE}).rowcount:
+            pass
+
+    # Global URL uniqueness, which a partitioned table cannot enforce
+    op.create_table(
+        'article_urls',
+        sa.Column('url', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('url'),
+    )
+
+    op.execute(
+        'CREATE TABLE articles_partitioned (LIKE articles INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (published_at)'
+    )
+    op.execute(
+        'ALTER TABLE articles_partitioned '
+        'ALTER published_at SET DEFAULT CURRENT_TIMESTAMP, '
+        'ALTER published_at SET NOT NULL, '
+        'ADD CONSTRAINT articles_partitioned_pkey PRIMARY KEY (id, published_at)'
+    )
+    for column in INDEXED:
+        op.create_index(f'ix_articles_p_{column}', 'articles_partitioned', [column])
+
+    op.execute('CREATE TABLE articles_default PARTITION OF articles_partitioned DEFAULT')
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    months = {_add_months(current, n) for n in range(PARTITIONS_AHEAD + 1)}
+    months.update(
+        row[0].date() for row in conn.execute(sa.text(
+            "SELECT DISTINCT date_trunc('month', published_at AT TIME ZONE 'UTC') "
+            'FROM articles WHERE published_at IS NOT NULL'
+        ))
+    )
+    for month in sorted(months):
+        _create_partition(month)
+
+    # Mirror writes that happen while the copy runs. AFTER triggers only see
+    # rows that were actually written (not ON CONFLICT proposals)
+    op.execute("""
+        CREATE FUNCTION articles_mirror() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                DELETE FROM articles_partitioned WHERE id = OLD.id;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                NEW.published_at := coalesce(NEW.published_at, NEW.created_at);
+                -- Same column order, as the table was created LIKE articles
+                INSERT INTO articles_partitioned SELECT NEW.* ON CONFLICT DO NOTHING;
+                INSERT INTO article_urls VALUES (NEW.url) ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        'CREATE TRIGGER articles_mirror AFTER INSERT OR UPDATE OR DELETE ON articles '
+        'FOR EACH ROW EXECUTE FUNCTION articles_mirror()'
+    )
+
+    # Copy in id order, one committed batch at a time. FOR SHARE holds off
+    # updates to a batch until it is copied; the trigger then replays them
+    with op.get_context().autocommit_block():
+        last_id = '00000000-0000-0000-0000-000000000000'
+        while True:
+            last_id = conn.execute(sa.text(f"""
+                WITH batch AS (
+                    SELECT {COLUMNS} FROM articles WHERE id > :last_id
+                    ORDER BY id LIMIT :n FOR SHARE
+                ), copied AS (
+                    INSERT INTO articles_partitioned ({COLUMNS})
+                    SELECT id, title, content, source, category, url, views,
+                        is_deleted, deleted_at, coalesce(published_at, created_at),
+                        created_at, updated_at
+                    FROM batch ON CONFLICT DO NOTHING
+                ), urls AS (
+                    INSERT INTO article_urls SELECT url FROM batch ON CONFLICT DO NOTHING
+                )
+                SELECT id FROM batch ORDER BY id DESC LIMIT 1
+            """), {'last_id': last_id, 'n': BATCH_SIZE}).scalar()
+            if last_id is None:
+                break
+
+    # Swap; the lock is held only for renames and the drop
+    op.execute('LOCK TABLE articles IN ACCESS EXCLUSIVE MODE')
+    op.execute('DROP TRIGGER articles_mirror ON articles')
+    op.execute('DROP FUNCTION articles_mirror()')
+    op.execute('DROP TABLE articles')
+    op.rename_table('articles_partitioned', 'articles')
+    op.execute('ALTER TABLE articles RENAME CONSTRAINT articles_partitioned_pkey TO articles_pkey')
+    for column in INDEXED:
+        op.execute(f'ALTER INDEX ix_articles_p_{column} RENAME TO ix_articles_{column}')
+
+
+def downgrade() -> None:
+    op.execute('CREATE TABLE articles_unpartitioned (LIKE articles INCLUDING DEFAULTS)')
+    op.execute(f'INSERT INTO articles_unpartitioned ({COLUMNS}) SELECT {COLUMNS} FROM articles')
+    # Also drops every partition
+    op.execute('DROP TABLE articles')
+    op.rename_table('articles_unpartitioned', 'articles')
+    op.execute(
+        'ALTER TABLE articles '
+        'ALTER published_at DROP DEFAULT, '
+        'ALTER published_at DROP NOT NULL, '
+        'ADD CONSTRAINT articles_pkey PRIMARY KEY (id), '
+        'ADD CONSTRAINT articles_url_key UNIQUE (url)'
+    )
+    for column in INDEXED:
+        if column != 'url':
+            op.create_index(f'ix_articles_{column}', 'articles', [column])
+    op.drop_table('article_urls')
@@ -0,0 +1,57 @@
+"""Partial indexes for live (not soft-deleted) articles
+
+Revision ID: c51e8d2f4a97
+Revises: 9a4c2e7b1d63
+Create Date: 2026-10-19 15:12:06.734120
+
+Non-admin queries always carry `is_deleted = false`, which the planner
+matches against `WHERE NOT is_deleted`. Each index is created on the
+partitioned parent only, built concurrently on every partition and then
+attached, so no partition is write-locked while it builds.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c51e8d2f4a97'
+down_revision: Union[str, None] = '9a4c2e7b1d63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_INDEXES = {
+    # GET /articles/ default ordering
+    'ix_articles_live_published_at': 'published_at DESC, id',
+    # Recommendations: unfiltered, by category and by source
+    'ix_articles_live_popular': 'views DESC, published_at DESC',
+    'ix_articles_live_category_popular': 'category, views DESC, published_at DESC',
+    'ix_articles_live_source_popular': 'source, views DESC, published_at DESC',
+}
+
+
+def upgrade() -> None:
+    partitions = op.get_bind().execute(sa.text(
+        'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+        "WHERE i.inhparent = 'articles'::regclass"
+    )).scalars().all()
+
+    for name, columns in LIVE_INDEXES.items():
+        # Invalid until every partition's index is attached
+        op.execute(f'CREATE INDEX {name} ON ONLY articles ({columns}) WHERE NOT is_deleted')
+        for partition in partitions:
+            child = f'{partition}_{name[len("ix_articles_"):]}'
+            with op.get_context().autocommit_block():
+                op.execute(
+                    f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} '
+                    f'ON {partition} ({columns}) WHERE NOT is_deleted'
+                )
+            op.execute(f'ALTER INDEX {name} ATTACH PARTITION {child}')
+
+
+def downgrade() -> None:
+    for name in LIVE_INDEXES:
+        # Drops the partitions' indexes with it
+        op.execute(f'DROP INDEX {name}')
@@ -0,0 +1,40 @@
+"""Article facets materialized view
+
+Revision ID: e83b6d0f2c14
+Revises: c51e8d2f4a97
+Create Date: 2026-10-19 17:26:44.509317
+
+Live-article counts per category and source for unfiltered searches. The
+unique index allows REFRESH MATERIALIZED VIEW CONCURRENTLY.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e83b6d0f2c14'
+down_revision: Union[str, None] = 'c51e8d2f4a97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW article_facets AS
+        SELECT CASE grouping(category, source)
+                   WHEN 1 THEN 'category' WHEN 2 THEN 'source' ELSE 'total'
+               END AS facet,
+               coalesce(category, source, '') AS value,
+               count(*) AS count
+        FROM articles
+        WHERE NOT is_deleted
+        GROUP BY GROUPING SETS ((category), (source), ())
+        HAVING grouping(category, source) = 3 OR coalesce(category, source) IS NOT NULL
+    """)
+    op.execute('CREATE UNIQUE INDEX ix_article_facets ON article_facets (facet, value)')
+
+
+def downgrade() -> None:
+    op.execute('DROP MATERIALIZED VIEW article_facets')
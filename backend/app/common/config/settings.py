@@ -1,8 +1,26 @@
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     database_url: str
+    # Read replicas for read-only service methods; empty sends everything to
+    # the primary. Replicas lagging more than `db_replica_max_lag` seconds
+    # are skipped, and a client reads from the primary for
+    # `db_read_your_writes_seconds` after one of its requests commits.
+    database_replica_urls: list[str] = []
+    db_replica_max_lag: float = 5.0
+    db_replica_check_interval: float = 5.0
+    db_read_your_writes_seconds: float = 5.0
+
+    # Connection pool sizing per process type ("api" or "celery", see
+    # POOL_PROFILES); the explicit sizes override the profile. With
+    # `db_pgbouncer` the app keeps no pool of its own (NullPool).
+    db_pool_profile: Literal["api", "celery"] = "api"
+    db_pool_size: Optional[int] = None
+    db_max_overflow: Optional[int] = None
+    db_pgbouncer: bool = False
     redis_url: str
     celery_broker_url: str
     celery_result_backend: str
@@ -10,10 +28,72 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 1
+    revocation_bloom_capacity: int = 100_000
+    revocation_bloom_error_rate: float = 0.001
     api_key: str
+    # Key /metrics scrapers present (X-API-Key or Bearer); defaults to api_key
+    metrics_api_key: Optional[str] = None
     environment: str = "production"
     log_level: str = "INFO"
     log_format: str = "json"
+    log_body_max_bytes: int = 64 * 1024  # JSON bodies above this are not kept for logs
+    # Fraction of requests logging request_started/request_completed.
+    # Failures and 5xx responses are always logged.
+    log_request_sample_rate: float = 1.0
+
+    # Seconds shared caches may serve GET /articles/ without revalidating
+    article_list_max_age: int = 30
+
+    # Seconds a search result page (ids and total) stays cached. Writes
+    # retire cached pages at once; this bounds staleness of view ordering.
+    article_search_cache_ttl: int = 60
+
+    # Seconds filtered search facets stay cached (unfiltered ones are read
+    # from a materialized view refreshed after each ingest)
+    article_facet_cache_ttl: int = 300
+
+    # Rows fetched per server-side cursor round trip by GET /articles/export
+    article_export_batch_size: int = 1000
+
+    # Monthly article partitions kept ready beyond the current month, and
+    # months of partitions to keep attached (0 keeps everything)
+    article_partitions_ahead: int = 3
+    article_partition_retention_months: int = 0
+
+    # Response compression: smaller bodies are sent as-is. Cached articles
+    # keep these Content-Encodings precompressed.
+    compression_minimum_size: int = 1024
+    cache_precompress_encodings: list[str] = ["zstd", "gzip"]
+
+    # Cached response encoding: "json" (bodies served as-is) or "msgpack";
+    # bodies at least this large are zstd-compressed
+    cache_codec: str = "json"
+    cache_compress_threshold: int = 1024
+    # Floor on the recompute cost XFetch assumes, in seconds. Measured load
+    # times (a few ms) would leave hot keys no early refresh window at all.
+    cache_xfetch_min_delta: float = 1.0
+
+    # Redis connection pool of each process (every uvicorn worker has one).
+    # Once all connections are busy, commands wait up to `redis_pool_timeout`
+    # seconds for one; connections idle this long are PINGed before reuse.
+    redis_max_connections: int = 32
+    redis_pool_timeout: float = 2.0
+    redis_health_check_interval: int = 15
+
+    # Redis client-side caching (RESP3 tracking), off by default. Only
+    # read-mostly prefixes such as "cache:": every write invalidates all
+    # processes. Not "blacklist:", whose misses must not be served stale.
+    redis_client_cache_prefixes: list[str] = []
+    redis_client_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # Cache statistics (sampled in the background, see /admin/cache-stats)
+    cache_stats_interval: int = 300
+    cache_stats_sample_size: int = 5000
+
+    # Password hashing (bcrypt runs in a dedicated process pool)
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 0  # 0 = derive from the container CPU limit
+    password_hash_max_pending: int = 64
 
     initial_admin_username: str = "admin_user"
     initial_admin_email: str = "admin@email.com"
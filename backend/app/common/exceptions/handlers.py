@@ -6,6 +6,10 @@ from fastapi.responses import JSONResponse
 
 from backend.app.common.exceptions.http import APIError, ServerError
 from backend.app.common.middleware.correlation import correlation_id
+from backend.app.common.middleware.sanitization import (
+    get_redacted_headers,
+    get_sanitized_body,
+)
 
 
 async def handle_validation_error(request: Request, exc: RequestValidationError):
@@ -34,7 +38,9 @@ async def handle_api_error(request: Request, exc: APIError):
     error_content.update(
         {"path": request.url.path, "correlation_id": correlation_id.get()}
     )
-    return JSONResponse(status_code=exc.status_code, content=error_content)
+    return JSONResponse(
+        status_code=exc.status_code, content=error_content, headers=exc.headers
+    )
 
 
 async def global_exception_handler(request: Request, exc: Exception):
@@ -46,6 +52,9 @@ async def global_exception_handler(request: Request, exc: Exception):
             "path": request.url.path,
             "method": request.method,
             "correlation_id": correlation_id.get() or "none",
+            # Redacted lazily, only now that something went wrong
+            "request_headers": get_redacted_headers(request),
+            "request_body": get_sanitized_body(request),
         },
     )
     server_error = ServerError(
@@ -19,11 +19,14 @@ class APIError(Exception):
         message (str): Human-readable error message.
         detail (Optional[str]): Detailed error explanation.
         extra (Dict[str, Any]): Additional error context.
+        headers (Dict[str, str]): HTTP headers to send with the error response.
     """
 
     status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
     error_code: str = "internal_server_error"
     message: str = "An unexpected error occurred"
+    # Level server errors are logged at
+    log_level: int = logging.ERROR
 
     def __init__(
         self,
@@ -36,10 +39,12 @@ class APIError(Exception):
         self.detail = detail
         self.extra = extra or {}
         self.log_context = log_context or {}
+        self.headers: Dict[str, str] = {}
 
         # Automatically log server errors
         if 500 <= self.status_code < 600:
-            logger.error(
+            logger.log(
+                self.log_level,
                 f"{self.__class__.__name__}: {self.message}",
                 extra={
                     "status_code": self.status_code,
@@ -276,3 +281,29 @@ class ThirdPartyServiceError(ServerError):
         computed_detail = detail or f"Service '{service_name}' failed to respond"
         extra = {"service_name": service_name}
         super().__init__(message=message, detail=computed_detail, extra=extra, **kwargs)
+
+
+class ServiceUnavailableError(ServerError):
+    """Error raised when the server is temporarily overloaded and sheds load.
+
+    Shedding is expected under load, so it is logged as a warning. The
+    retry delay is also sent as a `Retry-After` header.
+    """
+
+    status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE
+    error_code: str = "service_unavailable"
+    message: str = "Service temporarily unavailable"
+    log_level: int = logging.WARNING
+
+    def __init__(
+        self,
+        retry_after: Optional[int] = None,
+        message: Optional[str] = None,
+        detail: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        computed_detail = detail or "Server is busy, please retry shortly"
+        extra = {"retry_after": retry_after}
+        super().__init__(message=message, detail=computed_detail, extra=extra, **kwargs)
+        if retry_after is not None:
+            self.headers["Retry-After"] = str(retry_after)
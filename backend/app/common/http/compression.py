@@ -0,0 +1,152 @@
+"""Content-Encoding negotiation and compressors (zstd, br, gzip).
+
+Levels favour speed: responses are compressed on the request path, where a
+few extra percent of ratio is not worth the CPU. Bodies that are compressed
+once and served many times (cached articles) use `compress_prefix` and
+`complete_prefix` instead, which let a fixed, precompressed prefix be
+followed by a short tail added per request, in the same gzip member or zstd
+frame.
+"""
+
+import struct
+import zlib
+from typing import Iterable, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Server preference when the client accepts several with equal q-values
+PREFERENCE = tuple(
+    encoding
+    for encoding, available in (
+        ("zstd", zstandard is not None),
+        ("br", brotli is not None),
+        ("gzip", True),
+    )
+    if available
+)
+
+GZIP_LEVEL = 4
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+# Minimal gzip member header: no name, no mtime, unknown OS
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+_GZIP_PREFIX_META = struct.Struct("<II")  # CRC-32 and length of the prefix
+_ZSTD_MAX_BLOCK = 128 * 1024
+
+
+def negotiate(accept_encoding: str, available: Iterable[str] = PREFERENCE) -> Optional[str]:
+    """Best encoding from an Accept-Encoding header, or None for identity."""
+    if not accept_encoding:
+        return None
+
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip()] = q
+
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in PREFERENCE:
+        if encoding not in available:
+            continue
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class StreamCompressor:
+    """Incremental compressor; each `compress` call flushes a decodable chunk."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._zstd = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        elif encoding == "br":
+            self._br = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._gzip = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "zstd":
+            return self._zstd.compress(data) + self._zstd.flush(
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "zstd":
+            return self._zstd.flush()
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gzip.flush()
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """One-shot compression of a complete body."""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return zlib.compress(data, GZIP_LEVEL, wbits=31)
+
+
+def compress_prefix(prefix: bytes, encoding: str, level: int = 6) -> bytes:
+    """Compress the fixed start of a body for `complete_prefix`.
+
+    gzip: the member header and a sync-flushed (byte-aligned, unterminated)
+    deflate stream, preceded by the prefix's CRC-32 and length so the
+    trailer can be computed without decompressing.
+    zstd: a frame left open, its blocks flushed but none marked last. It
+    declares no content size or checksum, which would depend on the tail.
+    """
+    if encoding == "zstd":
+        stream = zstandard.ZstdCompressor(
+            level=level, write_content_size=False, write_checksum=False
+        ).compressobj()
+        return stream.compress(prefix) + stream.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+    if encoding == "gzip":
+        deflate = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        stream = deflate.compress(prefix) + deflate.flush(zlib.Z_SYNC_FLUSH)
+        meta = _GZIP_PREFIX_META.pack(zlib.crc32(prefix), len(prefix))
+        return meta + _GZIP_HEADER + stream
+    raise ValueError(f"Encoding {encoding!r} cannot be precompressed")
+
+
+def complete_prefix(compressed_prefix: bytes, tail: bytes, encoding: str) -> bytes:
+    """Append `tail` to a body precompressed with `compress_prefix`."""
+    if encoding == "zstd":
+        # A last raw (stored) block closes the frame; it needs none of the
+        # prefix's compression state. Header: size << 3 | type 0 << 1 | last
+        if len(tail) > _ZSTD_MAX_BLOCK:
+            raise ValueError("Tail too long for a single zstd block")
+        return compressed_prefix + (len(tail) << 3 | 1).to_bytes(3, "little") + tail
+
+    crc, size = _GZIP_PREFIX_META.unpack_from(compressed_prefix)
+    # Raw deflate blocks can follow the byte-aligned prefix; this one is final
+    deflate = zlib.compressobj(1, zlib.DEFLATED, -zlib.MAX_WBITS)
+    stream = deflate.compress(tail) + deflate.flush()
+    trailer = struct.pack(
+        "<II", zlib.crc32(tail, crc), (size + len(tail)) & 0xFFFFFFFF
+    )
+    return compressed_prefix[_GZIP_PREFIX_META.size :] + stream + trailer
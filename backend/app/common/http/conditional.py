@@ -0,0 +1,61 @@
+"""HTTP validators and conditional request evaluation (RFC 9110, section 13)."""
+
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def format_etag(digest: bytes, weak: bool = False) -> str:
+    tag = f'"{digest.hex()}"'
+    return f"W/{tag}" if weak else tag
+
+
+def http_date(timestamp: float) -> str:
+    return formatdate(timestamp, usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison: W/ prefixes are ignored
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str, last_modified: float) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have one-second resolution
+    return int(last_modified) <= since.timestamp()
+
+
+def is_not_modified(
+    request: Request, etag: Optional[str] = None, last_modified: Optional[float] = None
+) -> bool:
+    """Whether a GET can be answered with 304 Not Modified.
+
+    If-None-Match takes precedence: If-Modified-Since is only evaluated when
+    the request carries no If-None-Match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified:
+        return _not_modified_since(if_modified_since, last_modified)
+    return False
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """304 response carrying the validators and caching headers of the 200."""
+    return Response(status_code=304, headers=headers)
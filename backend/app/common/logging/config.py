@@ -1,15 +1,27 @@
+import atexit
 import logging
 import os
+import queue
+import sys
 from datetime import datetime, timezone
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-from pythonjsonlogger import jsonlogger
+import orjson
 
 from backend.app.common.config.settings import settings
 from backend.app.common.middleware.correlation import correlation_id
 
+# Attributes every LogRecord has; anything else was passed through `extra=`.
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+    | {"message", "asctime", "correlation_id"}
+)
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Single-line JSON formatter serialising records (and extras) with orjson."""
 
-class CustomJsonFormatter(jsonlogger.JsonFormatter):
     def formatTime(self, record, datefmt=None):
         # Convert the created timestamp to a timezone-aware datetime (UTC)
         dt = datetime.fromtimestamp(record.created, tz=timezone.utc)
@@ -17,95 +29,141 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
             return dt.strftime(datefmt)
         return dt.isoformat()
 
-    def add_fields(self, log_record, record, message_dict):
-        super().add_fields(log_record, record, message_dict)
-
-        # Add correlation ID
-        log_record["correlation_id"] = correlation_id.get() or ""
-
-        # Standard fields
-        log_record.update(
-            {
-                "timestamp": self.formatTime(record, self.datefmt),
-                "level": record.levelname,
-                "logger": record.name,
-                "module": record.module,
-                "function": record.funcName,
-                "line": record.lineno,
-                "process": record.process,
-                "thread": record.threadName,
-            }
-        )
+    def format(self, record: logging.LogRecord) -> str:
+        log_record = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+            "correlation_id": getattr(record, "correlation_id", None) or "",
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                log_record[key] = value
+        if record.exc_info:
+            log_record["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            log_record["stack_info"] = self.formatStack(record.stack_info)
+        return orjson.dumps(log_record, default=str).decode()
+
+
+class AsyncQueueHandler(QueueHandler):
+    """Queue handler that defers all formatting and I/O to the listener thread.
+
+    Only the cheap, context-dependent parts are resolved on the caller's
+    thread: the message arguments and the correlation id (a contextvar that
+    the listener thread cannot see). The record is updated in place since this
+    is the only handler it passes through.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if not hasattr(record, "correlation_id"):
+            record.correlation_id = correlation_id.get() or ""
+        return record
+
+
+_listener: QueueListener | None = None
+
+
+def _stop_listener():
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+
+def _restart_listener_in_child():
+    """The listener thread does not survive fork (e.g. Celery prefork)."""
+    if _listener is None:
+        return
+    fresh_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener.queue = fresh_queue
+    _listener._thread = None
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, AsyncQueueHandler):
+            handler.queue = fresh_queue
+    _listener.start()
 
 
 def setup_logging():
+    global _listener
+
     log_dir = "logs"
 
     log_format = settings.log_format.lower()
     log_level = settings.log_level.upper()
 
-    # Define the console handler (always used)
-    handlers = {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "json" if log_format == "json" else "simple",
-            "stream": "ext://sys.stdout",
-        },
-    }
+    formatter = (
+        OrjsonFormatter()
+        if log_format == "json"
+        else logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S %z",
+        )
+    )
+
+    # The console handler is always used
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(formatter)
+    targets: list[logging.Handler] = [console]
 
     if settings.environment != "production":
         # Ensure the directory exists
         os.makedirs(log_dir, exist_ok=True)
 
         # Add file handler for non-production environments
-        handlers["file"] = {
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": os.path.join(log_dir, "backend.app.log"),
-            "maxBytes": 10 * 1024 * 1024,  # 10MB
-            "backupCount": 5,
-            "formatter": "json" if log_format == "json" else "simple",
-            "encoding": "utf8",
-        }
+        file_handler = RotatingFileHandler(
+            os.path.join(log_dir, "backend.app.log"),
+            maxBytes=10 * 1024 * 1024,  # 10MB
+            backupCount=5,
+            encoding="utf8",
+        )
+        file_handler.setFormatter(formatter)
+        targets.append(file_handler)
+
+    # Formatting and writing happen on the listener thread, never on the
+    # event loop; callers only pay for an enqueue.
+    _stop_listener()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *targets, respect_handler_level=True)
+    _listener.start()
 
     LOGGING_CONFIG = {
         "version": 1,
         "disable_existing_loggers": False,
-        "formatters": {
-            "json": {
-                "()": CustomJsonFormatter,
-                "format": "%(timestamp)s %(level)s %(name)s %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S %z",
-            },
-            "simple": {
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S %z",
-            },
+        "handlers": {
+            "queue": {"()": AsyncQueueHandler, "queue": log_queue},
         },
-        "handlers": handlers,
         "loggers": {
             "app": {
-                "handlers": list(handlers.keys()),
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": False,
             },
             "uvicorn": {
-                "handlers": list(handlers.keys()),
+                "handlers": ["queue"],
                 "level": "WARNING",
                 "propagate": False,
             },
             "uvicorn.access": {
-                "handlers": list(handlers.keys()),
+                "handlers": ["queue"],
                 "level": "WARNING",
                 "propagate": False,
             },
             "uvicorn.error": {
-                "handlers": list(handlers.keys()),
+                "handlers": ["queue"],
                 "level": "WARNING",
                 "propagate": False,
             },
         },
         "root": {
-            "handlers": list(handlers.keys()),
+            "handlers": ["queue"],
             "level": log_level,
         },
     }
@@ -115,4 +173,6 @@ def setup_logging():
 
 # Initialize logging when the module is imported.
 setup_logging()
+atexit.register(_stop_listener)
+os.register_at_fork(after_in_child=_restart_listener_in_child)
 logger = logging.getLogger("app")
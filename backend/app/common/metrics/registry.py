@@ -0,0 +1,202 @@
+"""Prometheus metrics shared by the API, background loops and Celery workers.
+
+When PROMETHEUS_MULTIPROC_DIR is set (it must be, before this module is
+imported, whenever uvicorn runs more than one worker) every process writes
+its samples to mmap-backed files in that directory and `/metrics` aggregates
+them, so a scrape sees the whole container rather than a single worker.
+Celery workers writing to the same directory are aggregated as well. The
+directory should be emptied before the processes start.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Sub-millisecond resolution for Redis and in-process work
+FAST_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from each SQLAlchemy pool",
+    ["pool"],
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections checked out of each SQLAlchemy pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond pool_size (QueuePool only)",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_CONNECTION_AGE = Histogram(
+    "db_connection_age_seconds",
+    "Age of connections when checked out; low values mean connection churn",
+    ["pool"],
+    buckets=(1, 10, 60, 300, 900, 1800, 3600, 7200),
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Cursor execution time by statement type",
+    ["statement"],
+)
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replay lag of each read replica at the last health check (-1 = unreachable)",
+    ["replica"],
+    multiprocess_mode="max",
+)
+DB_READS = Counter(
+    "db_reads",
+    "Replica-eligible SELECTs by where they were routed (replica or primary)",
+    ["target"],
+)
+
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis round-trip latency by command (PIPELINE for batched calls)",
+    ["command"],
+    buckets=FAST_BUCKETS,
+)
+
+REDIS_ROUND_TRIPS = Histogram(
+    "redis_round_trips_per_request",
+    "Redis round trips (commands or pipelines) made while serving a request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 4, 6, 8, 12, 16, 32),
+)
+
+REDIS_CLIENT_CACHE_LOOKUPS = Counter(
+    "redis_client_cache_lookups",
+    "Reads of tracked key prefixes served from process memory (hit) or Redis",
+    ["result"],
+)
+REDIS_CLIENT_CACHE_INVALIDATIONS = Counter(
+    "redis_client_cache_invalidations",
+    "Keys invalidated by Redis tracking push messages (flushes count once)",
+)
+REDIS_CLIENT_CACHE_BYTES = Gauge(
+    "redis_client_cache_bytes",
+    "Estimated memory held by the client-side Redis cache",
+    multiprocess_mode="livesum",
+)
+
+# Bloom filter false positive rate (among tokens that are not revoked):
+#   rate(revocation_false_positives_total[5m])
+#   / (rate(revocation_lookups_total{filtered="true"}[5m])
+#      - (rate(revocation_filter_hits_total[5m])
+#         - rate(revocation_false_positives_total[5m])))
+REVOCATION_LOOKUPS = Counter(
+    "revocation_lookups",
+    "Refresh token revocation checks, by whether the Bloom filter was loaded",
+    ["filtered"],
+)
+REVOCATION_FILTER_HITS = Counter(
+    "revocation_filter_hits",
+    "Revocation checks the Bloom filter could not rule out (confirmed in Redis)",
+)
+REVOCATION_FALSE_POSITIVES = Counter(
+    "revocation_false_positives",
+    "Bloom filter hits for tokens Redis reports as not revoked",
+)
+
+# Hit ratio: sum(rate(cache_lookups_total{result="hit"}[5m]))
+#            / sum(rate(cache_lookups_total[5m]))
+CACHE_LOOKUPS = Counter(
+    "cache_lookups",
+    "Response cache reads by namespace and result (hit, miss, early_refresh)",
+    ["cache", "result"],
+)
+CACHE_REFRESHES = Counter(
+    "cache_refreshes",
+    "Background cache recomputations by namespace and outcome",
+    ["cache", "outcome"],
+)
+
+ARTICLE_CACHE_READ_DURATION = Histogram(
+    "article_cache_read_seconds",
+    "GET /articles/{id} time spent counting the view and reading the cache "
+    "entry with its pending views (one Redis round trip), by cache result",
+    ["result"],
+    buckets=FAST_BUCKETS,
+)
+
+VIEW_BUFFER_SIZE = Gauge(
+    "view_tracker_buffer_articles",
+    "Articles with buffered, unflushed view increments",
+    multiprocess_mode="livesum",
+)
+VIEW_FLUSH_DURATION = Histogram(
+    "view_tracker_flush_duration_seconds",
+    "Time to flush buffered view increments to Redis",
+    buckets=FAST_BUCKETS,
+)
+
+VIEW_SYNC_DURATION = Histogram(
+    "view_sync_duration_seconds",
+    "Time to move Redis view counters into PostgreSQL",
+)
+VIEW_SYNC_LAST_SUCCESS = Gauge(
+    "view_sync_last_success_timestamp_seconds",
+    "Unix time of the last completed view sync (lag = time() - value)",
+    multiprocess_mode="max",
+)
+VIEW_SYNC_PENDING_KEYS = Gauge(
+    "view_sync_pending_keys",
+    "Redis view counters found by the last sync run",
+    multiprocess_mode="liveall",
+)
+
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task run time by task and final state",
+    ["task", "state"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+CELERY_TASKS = Counter(
+    "celery_tasks",
+    "Celery task executions by task and final state",
+    ["task", "state"],
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Serialize all metrics in the Prometheus text format."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,16 +1,30 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request
 import uuid
 from contextvars import ContextVar
 
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
 correlation_id: ContextVar[str] = ContextVar("correlation_id", default=None)
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Get or generate correlation ID
-        cid = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
+
+class CorrelationMiddleware:
+    """Pure ASGI middleware binding a correlation id to the request context."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        # Get or generate correlation ID. Not reset afterwards on purpose: the
+        # outermost error handler runs after us and still needs it.
+        cid = Headers(scope=scope).get("x-correlation-id") or str(uuid.uuid4())
         correlation_id.set(cid)
-        
-        response = await call_next(request)
-        response.headers["X-Correlation-ID"] = cid
-        return response
\ No newline at end of file
+
+        async def send_with_correlation(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Correlation-ID"] = cid
+            await send(message)
+
+        await self.app(scope, receive, send_with_correlation)
@@ -0,0 +1,52 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.app.common.metrics.registry import (
+    HTTP_REQUEST_DURATION,
+    REDIS_ROUND_TRIPS,
+)
+from backend.app.shared.infrastructure.redis.client import (
+    RoundTrips,
+    redis_round_trips,
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request latency per route template,
+    and the number of Redis round trips each request made.
+
+    Labels use the matched route path (e.g. `/api/v1/articles/{id}`) so the
+    series count stays bounded regardless of the ids requested.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start_time = time.perf_counter()
+        status_code = 500
+        round_trips = RoundTrips()
+        token = redis_round_trips.set(round_trips)
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            redis_round_trips.reset(token)
+            # The router stores the matched route in the (shared) scope
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=route,
+                status=str(status_code),
+            ).observe(time.perf_counter() - start_time)
+            REDIS_ROUND_TRIPS.labels(route=route).observe(round_trips.count)
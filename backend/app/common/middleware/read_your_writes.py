@@ -0,0 +1,68 @@
+import math
+import time
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.app.shared.db.routing import ReadYourWrites, read_your_writes
+
+STICKY_COOKIE = "db_sticky"
+STICKY_HEADER = "X-DB-Sticky"
+
+
+class ReadYourWritesMiddleware:
+    """Pin a client's reads to the primary for `window` seconds after a write.
+
+    A request whose session commits a write is answered with a deadline,
+    both as a short-lived cookie and as an `X-DB-Sticky` header for clients
+    that keep no cookies (bearer-token API clients echo it back on their
+    next requests). Until then, replica-eligible reads of that client's
+    requests use the primary, so it never reads a replica that has not
+    replayed its write. Clients sending neither get no such guarantee.
+
+    Deadlines are client-supplied, so ones further away than `window` are
+    ignored rather than pinning a client to the primary indefinitely.
+    """
+
+    def __init__(self, app: ASGIApp, window: float):
+        self.app = app
+        self.window = window
+
+    def _sticky(self, deadline: Optional[str]) -> bool:
+        try:
+            remaining = float(deadline or 0) - time.time()
+        except ValueError:
+            return False
+        return 0 < remaining <= self.window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = Headers(scope=scope)
+        cookies = cookie_parser(headers.get("cookie", ""))
+        sticky = self._sticky(headers.get(STICKY_HEADER)) or self._sticky(
+            cookies.get(STICKY_COOKIE)
+        )
+        # Mutated, not replaced, by sessions (sync routes run in a copied context)
+        state = ReadYourWrites(sticky=sticky)
+        token = read_your_writes.set(state)
+
+        async def send_with_deadline(message: Message):
+            if message["type"] == "http.response.start" and state.committed:
+                deadline = f"{time.time() + self.window:.3f}"
+                response_headers = MutableHeaders(scope=message)
+                response_headers.append(
+                    "Set-Cookie",
+                    f"{STICKY_COOKIE}={deadline}; Max-Age={math.ceil(self.window)}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+                response_headers[STICKY_HEADER] = deadline
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_deadline)
+        finally:
+            read_your_writes.reset(token)
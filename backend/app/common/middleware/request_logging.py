@@ -1,72 +1,104 @@
 import logging
+import random
 import time
 from http import HTTPStatus
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from backend.app.common.config.settings import settings
 from backend.app.common.middleware.correlation import correlation_id
+from backend.app.common.middleware.sanitization import get_sanitized_body
 
 logger = logging.getLogger("app.request")
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    def get_status_message(self, status_code: int) -> str:
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware emitting request start/complete/failure events.
+
+    Start/complete events are sampled at `sample_rate`; failures and 5xx
+    completions are always logged.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float | None = None):
+        self.app = app
+        self.sample_rate = (
+            settings.log_request_sample_rate if sample_rate is None else sample_rate
+        )
+
+    @staticmethod
+    def get_status_message(status_code: int) -> str:
         """Get a descriptive message for HTTP status codes"""
         try:
             return f"{HTTPStatus(status_code).phrase}: {HTTPStatus(status_code).description}"
         except ValueError:
             return "Unknown Status"
 
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path == "/health":
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in ("/health", "/metrics"):
+            return await self.app(scope, receive, send)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        method, path = scope["method"], scope["path"]
+        client = scope.get("client")
         # Add critical request metadata to all logs
         record_attrs = {
-            "path": request.url.path,
-            "method": request.method,
-            "client_ip": request.client.host if request.client else None,
+            "path": path,
+            "method": method,
+            "client_ip": client[0] if client else None,
             "correlation_id": correlation_id.get() or "none",
         }
+        response_start: dict = {}
 
-        try:
-            # Request started
-            logger.info(
-                f"{request.method} request to {request.url.path}",
-                extra={"event_type": "request_started", **record_attrs},
-            )
-            response = await call_next(request)
+        async def send_with_capture(message: Message):
+            if message["type"] == "http.response.start":
+                response_start.update(message)
+            await send(message)
 
-            # Get readable message
-            status_message = self.get_status_message(response.status_code)
+        sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
 
-            # Request Completed
-            logger.info(
-                f"{request.method} {request.url.path} completed: {status_message}",
-                extra={
-                    "event_type": "request_completed",
-                    "status_code": response.status_code,
-                    "status_phrase": HTTPStatus(response.status_code).phrase,
-                    "processing_time": f"{time.time() - start_time:.4f}s",
-                    "response_headers": dict(response.headers),
-                    **record_attrs,
-                },
-            )
+        try:
+            # Request started
+            if sampled:
+                logger.info(
+                    f"{method} request to {path}",
+                    extra={"event_type": "request_started", **record_attrs},
+                )
+            await self.app(scope, receive, send_with_capture)
 
         except Exception as e:
             # Error logging
             logger.error(
-                f"{request.method} {request.url.path} failed: {str(e)}",
+                f"{method} {path} failed: {str(e)}",
                 exc_info=True,
                 extra={
                     "event_type": "request_failed",
                     "error_type": e.__class__.__name__,
-                    "processing_time": f"{time.time() - start_time:.4f}s",
+                    "processing_time": f"{time.perf_counter() - start_time:.4f}s",
+                    "request_body": get_sanitized_body(Request(scope)),
                     **record_attrs,
                 },
             )
             raise
 
-        return response
+        # Request Completed
+        status_code = response_start.get("status", 500)
+        if not sampled and status_code < 500:
+            return
+
+        extra = {
+            "event_type": "request_completed",
+            "status_code": status_code,
+            "status_phrase": HTTPStatus(status_code).phrase,
+            "processing_time": f"{time.perf_counter() - start_time:.4f}s",
+            **record_attrs,
+        }
+        if logger.isEnabledFor(logging.DEBUG):
+            extra["response_headers"] = dict(
+                Headers(raw=response_start.get("headers", []))
+            )
+        logger.info(
+            f"{method} {path} completed: {self.get_status_message(status_code)}",
+            extra=extra,
+        )
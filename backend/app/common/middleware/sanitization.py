@@ -1,7 +1,11 @@
 import json
+from typing import Optional
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.app.common.config.settings import settings
 
 SENSITIVE_KEYS = {
     "password",
@@ -12,6 +16,8 @@ SENSITIVE_KEYS = {
     "credit_card",
 }
 
+REDACTED = "***REDACTED***"
+
 
 def sanitize(data):
     """Recursively sanitize sensitive keys in JSON data."""
@@ -19,7 +25,7 @@ def sanitize(data):
         new_data = {}
         for key, value in data.items():
             if key in SENSITIVE_KEYS:
-                new_data[key] = "***REDACTED***"
+                new_data[key] = REDACTED
             else:
                 new_data[key] = sanitize(value)
         return new_data
@@ -29,26 +35,107 @@ def sanitize(data):
         return data
 
 
-class SanitizationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Redact headers (Note: request.headers is immutable,
-        # so you might log redacted values or store them in request.state)
-        redacted_headers = {
-            key: ("***REDACTED***" if key.lower() in SENSITIVE_KEYS else value)
-            for key, value in request.headers.items()
-        }
-        # Save redacted headers to request.state for logging later
-        request.state.redacted_headers = redacted_headers
-
-        # Try to sanitize JSON body for logging purposes.
-        try:
-            body = await request.body()
-            if body:
-                body_json = json.loads(body)
-                sanitized_body = sanitize(body_json)  # Recursively sanitize payload.
-                request.state.sanitized_body = json.dumps(sanitized_body)
-        except Exception:
-            request.state.sanitized_body = None
-
-        response = await call_next(request)
-        return response
+def _is_json(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+class SanitizedRequestData:
+    """Lazily redacted view of a request's headers and body.
+
+    Body chunks are kept by reference as the application reads them, and only
+    for JSON payloads up to `max_body_bytes`. Nothing is decoded or redacted
+    until a logger or error handler asks for it.
+    """
+
+    def __init__(self, scope: Scope, max_body_bytes: int):
+        self._scope = scope
+        self._chunks: list[bytes] = []
+        self._size = 0
+        self._max_body_bytes = max_body_bytes
+        self._capture = _is_json(Headers(scope=scope).get("content-type", ""))
+        self.truncated = False
+        self._headers: Optional[dict] = None
+        self._body: Optional[str] = None
+        self._body_ready = False
+
+    def feed(self, chunk: bytes):
+        if not self._capture or not chunk:
+            return
+        self._size += len(chunk)
+        if self._size > self._max_body_bytes:
+            # Never hold more than the cap for logging purposes
+            self._capture = False
+            self.truncated = True
+            self._chunks.clear()
+            return
+        self._chunks.append(chunk)
+
+    def headers(self) -> dict:
+        if self._headers is None:
+            self._headers = {
+                key: (REDACTED if key in SENSITIVE_KEYS else value)
+                for key, value in (
+                    (k.decode("latin-1").lower(), v.decode("latin-1"))
+                    for k, v in self._scope["headers"]
+                )
+            }
+        return self._headers
+
+    def body(self) -> Optional[str]:
+        """Redacted JSON body, or None if absent, non-JSON or over the cap."""
+        if not self._body_ready:
+            self._body_ready = True
+            if self._chunks:
+                try:
+                    self._body = json.dumps(
+                        sanitize(json.loads(b"".join(self._chunks)))
+                    )
+                except ValueError:
+                    self._body = None
+                self._chunks.clear()
+        return self._body
+
+
+def _get_sanitized(request: Request) -> Optional[SanitizedRequestData]:
+    return request.scope.get("state", {}).get("sanitized_request")
+
+
+def get_redacted_headers(request: Request) -> dict:
+    data = _get_sanitized(request)
+    return data.headers() if data else {}
+
+
+def get_sanitized_body(request: Request) -> Optional[str]:
+    data = _get_sanitized(request)
+    return data.body() if data else None
+
+
+class SanitizationMiddleware:
+    """Pure ASGI middleware attaching a lazy redacted view of the request.
+
+    The body is observed as the application consumes it; it is never read
+    ahead of the app or buffered beyond the configured cap.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: Optional[int] = None):
+        self.app = app
+        self.max_body_bytes = (
+            settings.log_body_max_bytes if max_body_bytes is None else max_body_bytes
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        data = SanitizedRequestData(scope, self.max_body_bytes)
+        # `request.state` is backed by scope["state"]
+        scope.setdefault("state", {})["sanitized_request"] = data
+
+        async def receive_with_capture() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                data.feed(message.get("body", b""))
+            return message
+
+        await self.app(scope, receive_with_capture, send)
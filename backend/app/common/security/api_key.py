@@ -0,0 +1,29 @@
+import secrets
+from typing import Optional
+
+from fastapi import Header
+
+from backend.app.common.config.settings import settings
+from backend.app.common.exceptions.http import UnauthorizedError
+
+
+def require_api_key(
+    x_api_key: Optional[str] = Header(None),
+    authorization: Optional[str] = Header(None),
+) -> None:
+    """Admit internal callers (e.g. the Prometheus scraper) holding the API key.
+
+    The key is read from `X-API-Key` or an `Authorization: Bearer` header,
+    whichever the caller can set.
+    """
+    expected = settings.metrics_api_key or settings.api_key
+    supplied = x_api_key
+    if supplied is None and authorization:
+        scheme, _, credentials = authorization.partition(" ")
+        if scheme.lower() == "bearer":
+            supplied = credentials.strip()
+
+    if not supplied or not secrets.compare_digest(
+        supplied.encode(), expected.encode()
+    ):
+        raise UnauthorizedError(detail="Invalid or missing API key")
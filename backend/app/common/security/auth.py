@@ -3,11 +3,12 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import jwt
-from passlib.context import CryptContext
+from anyio import from_thread
 
 from backend.app.common.config.settings import settings
+from backend.app.common.security.hashing import build_crypt_context, password_hasher
+from backend.app.common.security.revocation import revocation_list
 from backend.app.modules.auth.schemas.token import TokenData
-from backend.app.shared.infrastructure.redis.client import RedisManager
 
 # JWT configuration
 SECRET_KEY = settings.jwt_secret_key
@@ -15,19 +16,43 @@ ALGORITHM = settings.jwt_algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.jwt_access_token_expire_minutes
 REFRESH_TOKEN_EXPIRE_DAYS = settings.jwt_refresh_token_expire_days
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = build_crypt_context(settings.bcrypt_rounds)
 
 
-# Hash password
+# Hash password (blocking; for scripts and other non-async callers)
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-# verify hashed passwords
+# verify hashed passwords (blocking; for scripts and other non-async callers)
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# Hash password off the event loop
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.hash(password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """Verify off the event loop; also returns a rehash if the cost changed."""
+    return await password_hasher.verify_and_update(plain_password, hashed_password)
+
+
+# The same, for sync routes: they run in worker threads, which hand the call
+# back to the event loop instead of blocking it on queries
+def hash_password_in_pool(password: str) -> str:
+    return from_thread.run(hash_password_async, password)
+
+
+def verify_and_update_password_in_pool(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    return from_thread.run(verify_and_update_password, plain_password, hashed_password)
+
+
 # Create JWT access token
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -65,8 +90,6 @@ def verify_access_token(token: str, credentials_exception):
 
 
 async def verify_refresh_token(token: str, credentials_exception):
-    if await RedisManager.is_token_blacklisted(token):
-        raise credentials_exception
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         if payload.get("type") != "refresh":
@@ -75,10 +98,14 @@ async def verify_refresh_token(token: str, credentials_exception):
         role: str = payload.get("role")
         jti: str = payload.get("jti")
 
-        if not username:
+        if not username or not jti:
             raise credentials_exception
 
         token_data = TokenData(jti=jti, username=username, role=role)
     except jwt.InvalidTokenError:
         raise credentials_exception
+
+    # Revocation is keyed by jti; most lookups are answered by the local filter
+    if await revocation_list.is_revoked(jti):
+        raise credentials_exception
     return token_data
@@ -0,0 +1,132 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from passlib.context import CryptContext
+
+from backend.app.common.config.settings import settings
+from backend.app.common.exceptions.http import ServiceUnavailableError
+
+
+@lru_cache(maxsize=None)
+def build_crypt_context(rounds: int) -> CryptContext:
+    """Bcrypt context pinned to `rounds`.
+
+    Hashes created with a different cost are reported as needing an update,
+    which lets logins transparently migrate them to the tuned cost.
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+# Worker entry points: module-level so they can be pickled into the pool.
+def _hash(password: str, rounds: int) -> str:
+    return build_crypt_context(rounds).hash(password)
+
+
+def _verify_and_update(
+    password: str, hashed_password: str, rounds: int
+) -> tuple[bool, Optional[str]]:
+    return build_crypt_context(rounds).verify_and_update(password, hashed_password)
+
+
+def cpu_limit() -> int:
+    """Number of CPUs this container may use (cgroup quota aware)."""
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, int(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        # cgroup v1
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        if quota > 0:
+            return max(1, quota // period)
+    except (OSError, ValueError):
+        pass
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class PasswordHasher:
+    """Runs bcrypt in a bounded process pool so it never blocks the event loop.
+
+    At most `max_pending` operations may be queued or running at once; beyond
+    that callers get a 503 immediately instead of piling up behind the pool.
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        max_pending: int = 64,
+        rounds: int = 12,
+    ):
+        self.workers = workers or cpu_limit()
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self):
+        if self._executor is None:
+            # "spawn" avoids forking a process that owns an event loop and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _submit(self, fn, *args):
+        if self._pending >= self.max_pending:
+            raise ServiceUnavailableError(
+                retry_after=1,
+                detail="Too many concurrent authentication requests",
+            )
+        self.start()
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(_hash, password, self.rounds)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """Verify a password; returns a new hash when the stored one is outdated."""
+        return await self._submit(
+            _verify_and_update, password, hashed_password, self.rounds
+        )
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+    rounds=settings.bcrypt_rounds,
+)
@@ -0,0 +1,192 @@
+import asyncio
+import hashlib
+import math
+from contextlib import suppress
+from typing import Optional
+
+from backend.app.common.config.settings import settings
+from backend.app.common.logging.config import logger
+from backend.app.common.metrics.registry import (
+    REVOCATION_FALSE_POSITIVES,
+    REVOCATION_FILTER_HITS,
+    REVOCATION_LOOKUPS,
+)
+from backend.app.shared.infrastructure.redis.client import RedisManager
+
+REVOCATION_CHANNEL = "revocations"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # Kirsch-Mitzenmacher double hashing from a single 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class TokenRevocationList:
+    """Per-replica view of revoked refresh token ids.
+
+    Revoked jtis live in Redis (`blacklist:{jti}`, expiring with the token).
+    Each replica mirrors them in a Bloom filter kept current through a pub/sub
+    channel, so the common case (token not revoked) never touches Redis. Only a
+    filter hit is confirmed against Redis. Until the filter is loaded, or while
+    the subscription is down, every lookup goes to Redis.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        rebuild_interval: int = 3600,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.filter = BloomFilter(capacity, error_rate)
+        self.ready = False
+        self._listener: Optional[asyncio.Task] = None
+        self._rebuild_buffer: Optional[set[str]] = None
+
+        self.lookups = 0
+        self.redis_lookups = 0
+        self.filter_hits = 0
+        self.false_positives = 0
+
+    async def start(self):
+        """Start the pub/sub listener (which also loads the filter)."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self.ready = False
+
+    async def revoke(self, jti: str, token: str):
+        """Blacklist a refresh token and notify every replica."""
+        await RedisManager.add_to_blacklist(jti, token)
+        self._add(jti)
+        redis = await RedisManager.get_redis()
+        await redis.publish(REVOCATION_CHANNEL, jti)
+
+    async def is_revoked(self, jti: str) -> bool:
+        filtered = self.ready
+        self.lookups += 1
+        REVOCATION_LOOKUPS.labels(filtered=str(filtered).lower()).inc()
+        if filtered:
+            if jti not in self.filter:
+                return False
+            self.filter_hits += 1
+            REVOCATION_FILTER_HITS.inc()
+
+        self.redis_lookups += 1
+        revoked = await RedisManager.is_token_blacklisted(jti)
+        if filtered and not revoked:
+            self.false_positives += 1
+            REVOCATION_FALSE_POSITIVES.inc()
+        return revoked
+
+    def stats(self) -> dict:
+        # Filtered lookups of tokens that are not revoked: those the filter
+        # ruled out (lookups that skipped Redis) plus its false positives
+        negatives = self.lookups - self.redis_lookups + self.false_positives
+        return {
+            "ready": self.ready,
+            "filter_entries": self.filter.count,
+            "filter_bits": self.filter.size,
+            "hash_functions": self.filter.hash_count,
+            "lookups": self.lookups,
+            "redis_lookups": self.redis_lookups,
+            "filter_hits": self.filter_hits,
+            "false_positives": self.false_positives,
+            "false_positive_rate": (
+                self.false_positives / negatives if negatives else 0.0
+            ),
+        }
+
+    def _add(self, jti: str):
+        self.filter.add(jti)
+        if self._rebuild_buffer is not None:
+            self._rebuild_buffer.add(jti)
+
+    async def _rebuild(self):
+        """Reload the filter from Redis, dropping jtis that have since expired."""
+        redis = await RedisManager.get_redis()
+        self._rebuild_buffer = set()
+        try:
+            fresh = BloomFilter(self.capacity, self.error_rate)
+            async for key in redis.scan_iter(match="blacklist:*", count=1000):
+                fresh.add(key.split(":", 1)[1])
+            # Revocations received while scanning
+            for jti in self._rebuild_buffer:
+                fresh.add(jti)
+            self.filter = fresh
+        finally:
+            self._rebuild_buffer = None
+
+        if self.filter.count > self.capacity:
+            logger.warning(
+                "Revocation filter over capacity, false positive rate will rise",
+                extra={"entries": self.filter.count, "capacity": self.capacity},
+            )
+
+    async def _listen(self):
+        while True:
+            pubsub = None
+            try:
+                redis = await RedisManager.get_redis()
+                pubsub = redis.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(REVOCATION_CHANNEL)
+                # Subscribe first so nothing published during the load is missed
+                await self._rebuild()
+                self.ready = True
+                loop = asyncio.get_running_loop()
+                next_rebuild = loop.time() + self.rebuild_interval
+
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message:
+                        self._add(message["data"])
+                    if loop.time() >= next_rebuild:
+                        await self._rebuild()
+                        next_rebuild = loop.time() + self.rebuild_interval
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.ready = False
+                logger.error("Revocation listener failed, retrying", exc_info=e)
+                await asyncio.sleep(5)
+            finally:
+                if pubsub is not None:
+                    with suppress(Exception):
+                        await pubsub.aclose()
+
+
+revocation_list = TokenRevocationList(
+    capacity=settings.revocation_bloom_capacity,
+    error_rate=settings.revocation_bloom_error_rate,
+)
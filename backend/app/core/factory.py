@@ -1,6 +1,8 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 
 from backend.app.common.config.settings import settings
+from backend.app.common.metrics.registry import render_metrics
+from backend.app.common.security.api_key import require_api_key
 from backend.app.core.exceptions import register_exception_handlers
 from backend.app.core.lifespan import lifespan
 from backend.app.core.middleware import register_middleware
@@ -38,4 +40,12 @@ def create_app() -> FastAPI:
             "environment": settings.environment,
         }
 
+    # Labels name routes, pools and tasks: internal scrapers only
+    @app.get(
+        "/metrics", include_in_schema=False, dependencies=[Depends(require_api_key)]
+    )
+    def metrics() -> Response:
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
+
     return app
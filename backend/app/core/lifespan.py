@@ -5,10 +5,17 @@ from fastapi import FastAPI
 
 from backend.app.common.config.settings import settings
 from backend.app.common.logging.config import logger
+from backend.app.common.security.hashing import password_hasher
 from backend.app.common.security.rate_limiting import init_limiter
+from backend.app.common.security.revocation import revocation_list
+from backend.app.modules.admin.services.cache_stats_service import (
+    cache_stats_service,
+)
 from backend.app.modules.articles.utils.view_utils.view_sync import ViewSynchronizer
 from backend.app.modules.articles.utils.view_utils.view_tracker import view_tracker
+from backend.app.shared.db.routing import replicas
 from backend.app.shared.infrastructure.redis.client import RedisManager
+from backend.app.shared.infrastructure.redis.client_cache import client_cache
 
 
 @asynccontextmanager
@@ -20,6 +27,11 @@ async def lifespan(app: FastAPI):
       - View tracking periodic flush
       - Background sync task
       - Redis connection
+      - Password hashing process pool
+      - Refresh token revocation filter
+      - Cache statistics sampling
+      - Redis client-side caching
+      - Read replica health checks
 
     Ensures graceful shutdown and task cancellation.
     """
@@ -29,16 +41,26 @@ async def lifespan(app: FastAPI):
         await init_limiter(is_test=(settings.environment == "test"), enabled=True)
         logger.info("Rate limiter initialized.")
 
+    password_hasher.start()
+
     tracker = view_tracker
     sync = ViewSynchronizer()
 
     # Start periodic flush task
     await tracker.start_periodic_flush()
     app.state.view_syncer = asyncio.create_task(_run_sync(sync))
+    app.state.cache_stats = asyncio.create_task(cache_stats_service.run_periodic())
+    app.state.replica_health = (
+        asyncio.create_task(replicas.run_periodic()) if replicas.engines else None
+    )
 
     try:
         await RedisManager.get_redis(is_test=(settings.environment == "test"))
         logger.info("Connected to Redis.")
+        await revocation_list.start()
+        await client_cache.start(
+            RedisManager.redis_url(is_test=(settings.environment == "test"))
+        )
         logger.info("View sync task started.")
         yield
     except Exception as e:
@@ -46,9 +68,19 @@ async def lifespan(app: FastAPI):
         raise
     finally:
         await tracker.stop_periodic_flush()
-        app.state.view_syncer.cancel()
-        with suppress(asyncio.CancelledError):
-            await app.state.view_syncer
+        await revocation_list.stop()
+        await client_cache.stop()
+        for task in (
+            app.state.view_syncer,
+            app.state.cache_stats,
+            app.state.replica_health,
+        ):
+            if task is None:
+                continue
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await asyncio.to_thread(password_hasher.shutdown)
         try:
             await RedisManager.close_redis()
             logger.info("Redis connection closed.")
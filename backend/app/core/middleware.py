@@ -1,6 +1,10 @@
 from fastapi import FastAPI
 
+from backend.app.common.config.settings import settings
+from backend.app.common.middleware.compression import CompressionMiddleware
 from backend.app.common.middleware.correlation import CorrelationMiddleware
+from backend.app.common.middleware.metrics import MetricsMiddleware
+from backend.app.common.middleware.read_your_writes import ReadYourWritesMiddleware
 from backend.app.common.middleware.request_logging import RequestLoggingMiddleware
 from backend.app.common.middleware.sanitization import SanitizationMiddleware
 
@@ -10,7 +14,17 @@ def register_middleware(app: FastAPI) -> None:
 
     Order matters: first added is outermost -> executes first on request.
     We want correlation early so every subsequent log has the ID.
+    Metrics sit just outside compression so latency includes it.
+    Read-your-writes stickiness only matters when replicas are configured.
     """
+    if settings.database_replica_urls:
+        app.add_middleware(
+            ReadYourWritesMiddleware, window=settings.db_read_your_writes_seconds
+        )
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=settings.compression_minimum_size
+    )
+    app.add_middleware(MetricsMiddleware)
     app.add_middleware(RequestLoggingMiddleware)
     app.add_middleware(SanitizationMiddleware)
     app.add_middleware(CorrelationMiddleware)
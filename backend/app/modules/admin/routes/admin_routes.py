@@ -1,18 +1,21 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 from backend.app.common.dependencies.auth import required_roles
 from backend.app.common.exceptions.http import ConflictError, NotFoundError
+from backend.app.common.security.revocation import revocation_list
 from backend.app.modules.admin.models.permission import Permission
 from backend.app.modules.admin.models.role import Role
 from backend.app.modules.admin.schemas.permission import PermissionCreate
 from backend.app.modules.admin.schemas.role import RoleUpdate
+from backend.app.modules.admin.services.cache_stats_service import (
+    cache_stats_service,
+)
 from backend.app.modules.users.models.user import User
 from backend.app.modules.users.schemas.user import UserResponse
 from backend.app.shared.db.database import get_db
-from backend.app.shared.infrastructure.redis.client import RedisManager
 
 router = APIRouter()
 
@@ -77,11 +80,27 @@ def create_permission(
 
 
 @router.get("/cache-stats")
-async def get_cache_stats():
-    redis = await RedisManager.get_redis()
-    data = {
-        "total_keys": await redis.dbsize(),
-        "all_keys": await redis.keys("*"),
-        "article_keys": await redis.keys("cache:article:*"),
+async def get_cache_stats(
+    skip: int = Query(0, ge=0, description="Number of key prefixes to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Key prefixes to return"),
+    current_user: User = Depends(required_roles(["admin"])),
+):
+    """Sampled cache statistics, largest key prefixes first.
+
+    Served from a snapshot refreshed in the background; never lists keys.
+    """
+    stats = await cache_stats_service.get_stats()
+    prefixes = stats.pop("prefixes")
+    return {
+        **stats,
+        "prefix_count": len(prefixes),
+        "prefixes": prefixes[skip : skip + limit],
     }
-    return data
+
+
+@router.get("/revocation-stats")
+async def get_revocation_stats(
+    current_user: User = Depends(required_roles(["admin"])),
+):
+    """Bloom filter effectiveness for the refresh token blacklist."""
+    return revocation_list.stats()
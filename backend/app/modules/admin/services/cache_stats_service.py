@@ -0,0 +1,162 @@
+import asyncio
+import math
+import time
+from collections import defaultdict
+from typing import Optional
+
+import orjson
+
+from backend.app.common.config.settings import settings
+from backend.app.common.exceptions.http import ServiceUnavailableError
+from backend.app.common.logging.config import logger
+from backend.app.shared.infrastructure.redis.client import RedisManager
+
+STATS_KEY = "stats:cache"
+LOCK_KEY = "stats:cache:lock"
+
+
+def key_prefix(key: str) -> str:
+    """Group keys by everything before their last segment (`cache:article:<id>`)."""
+    head, sep, _ = key.rpartition(":")
+    return head if sep else "(no prefix)"
+
+
+class CacheStatsService:
+    """Bounded Redis cache statistics built from SCAN samples and INFO.
+
+    Never issues KEYS or returns key names: a run samples at most
+    `sample_size` keys with incremental SCAN, estimates per-prefix key counts
+    and memory (MEMORY USAGE) from that sample, and reads the server-wide
+    hit/miss/eviction counters from INFO. Results are stored in Redis so every
+    replica serves the same snapshot and only one of them recomputes it.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 5000,
+        scan_count: int = 500,
+        interval: int = 300,
+    ):
+        self.sample_size = sample_size
+        self.scan_count = scan_count
+        self.interval = interval
+
+    async def collect(self) -> dict:
+        redis = await RedisManager.get_redis()
+        started = time.perf_counter()
+
+        sampled: list[str] = []
+        cursor = 0
+        while len(sampled) < self.sample_size:
+            cursor, batch = await redis.scan(cursor=cursor, count=self.scan_count)
+            sampled.extend(batch[: self.sample_size - len(sampled)])
+            if cursor == 0:
+                break
+
+        # Sampled memory usage, one pipelined round trip per scan batch
+        usage: list[Optional[int]] = []
+        for i in range(0, len(sampled), self.scan_count):
+            async with redis.pipeline(transaction=False) as pipe:
+                for key in sampled[i : i + self.scan_count]:
+                    pipe.memory_usage(key, samples=0)
+                usage.extend(await pipe.execute())
+
+        total_keys = await redis.dbsize()
+        scale = total_keys / len(sampled) if sampled else 0.0
+
+        prefixes: dict[str, dict] = defaultdict(lambda: {"sampled": 0, "bytes": 0})
+        for key, size in zip(sampled, usage):
+            entry = prefixes[key_prefix(key)]
+            entry["sampled"] += 1
+            entry["bytes"] += size or 0
+
+        by_prefix = sorted(
+            (
+                {
+                    "prefix": prefix,
+                    "sampled_keys": entry["sampled"],
+                    "estimated_keys": round(entry["sampled"] * scale),
+                    "avg_bytes": round(entry["bytes"] / entry["sampled"]),
+                    "estimated_bytes": round(entry["bytes"] * scale),
+                }
+                for prefix, entry in prefixes.items()
+            ),
+            key=lambda p: p["estimated_bytes"],
+            reverse=True,
+        )
+
+        stats = await redis.info("stats")
+        memory = await redis.info("memory")
+        hits, misses = stats.get("keyspace_hits", 0), stats.get("keyspace_misses", 0)
+
+        return {
+            "generated_at": time.time(),
+            "collection_seconds": round(time.perf_counter() - started, 4),
+            "total_keys": total_keys,
+            "sampled_keys": len(sampled),
+            "complete_scan": cursor == 0,
+            "keyspace": {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else None,
+                "evicted_keys": stats.get("evicted_keys", 0),
+                "expired_keys": stats.get("expired_keys", 0),
+            },
+            "memory": {
+                "used_bytes": memory.get("used_memory"),
+                "max_bytes": memory.get("maxmemory"),
+                "eviction_policy": memory.get("maxmemory_policy"),
+            },
+            "prefixes": by_prefix,
+        }
+
+    async def refresh(self) -> Optional[dict]:
+        """Recompute and store the snapshot unless another replica holds the lock."""
+        redis = await RedisManager.get_redis()
+        if not await redis.set(LOCK_KEY, "1", nx=True, ex=self.interval):
+            return None
+        result = await self.collect()
+        await redis.set(STATS_KEY, orjson.dumps(result), ex=self.interval * 3)
+        return result
+
+    async def get_stats(self, wait: float = 5.0) -> dict:
+        """Latest snapshot, computing one if none has been stored yet.
+
+        When another replica is already computing it, waits up to `wait`
+        seconds for its result, then gives up with a 503 rather than
+        running a second sweep.
+        """
+        redis = await RedisManager.get_redis()
+        cached = await redis.get(STATS_KEY)
+        if cached:
+            return orjson.loads(cached)
+
+        result = await self.refresh()
+        if result is not None:
+            return result
+
+        deadline = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.25)
+            cached = await redis.get(STATS_KEY)
+            if cached:
+                return orjson.loads(cached)
+        raise ServiceUnavailableError(
+            retry_after=math.ceil(wait),
+            detail="Cache statistics are being collected, retry shortly",
+        )
+
+    async def run_periodic(self):
+        """Background refresh loop with crash protection."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error("Cache stats collection failed", exc_info=e)
+            await asyncio.sleep(self.interval)
+
+
+cache_stats_service = CacheStatsService(
+    sample_size=settings.cache_stats_sample_size,
+    interval=settings.cache_stats_interval,
+)
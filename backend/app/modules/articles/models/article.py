@@ -1,4 +1,17 @@
-from sqlalchemy import TIMESTAMP, Boolean, Column, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    TIMESTAMP,
+    Boolean,
+    Column,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    column,
+    event,
+    table,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql.expression import text
 from sqlalchemy.sql.sqltypes import TIMESTAMP
@@ -10,25 +23,127 @@ from backend.app.shared.db.base import Base
 
 
 class Article(Base):
+    """Range-partitioned by month of `published_at` (see PartitionService).
+
+    The partition key must be part of every unique constraint, so the
+    primary key is (id, published_at) and URL uniqueness lives in
+    `ArticleUrl`. The ORM still identifies articles by `id` alone.
+    """
+
     __tablename__ = "articles"
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "published_at"),
+        {"postgresql_partition_by": "RANGE (published_at)"},
+    )
 
     id = Column(
-        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+        UUID(as_uuid=True), nullable=False, server_default=text("gen_random_uuid()")
     )
     title = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     source = Column(String(100), index=True)
     category = Column(String(50), index=True)
-    url = Column(String, nullable=False, unique=True)
+    url = Column(String, nullable=False, index=True)
 
     views = Column(Integer, server_default="0", nullable=False, index=True)
 
     is_deleted = Column(Boolean, server_default="FALSE")
     deleted_at = Column(TIMESTAMP(timezone=True), nullable=True, index=True)
 
-    published_at = Column(TIMESTAMP(timezone=True), index=True, nullable=True)
+    published_at = Column(
+        TIMESTAMP(timezone=True),
+        index=True,
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
     created_at = Column(
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
     )
+    # Content changes only (not view counts); drives ETag/Last-Modified
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
+
+    __mapper_args__ = {"primary_key": [id]}
+
+
+class ArticleUrl(Base):
+    """Global URL uniqueness for the partitioned `articles` table."""
+
+    __tablename__ = "article_urls"
+
+    url = Column(String, primary_key=True)
+
+
+# Partial indexes for the live-article access paths; the soft-delete filter's
+# `is_deleted = false` lets the planner match `WHERE NOT is_deleted`
+_LIVE = ~Article.is_deleted
+Index(
+    "ix_articles_live_published_at",
+    Article.published_at.desc(),
+    Article.id,
+    postgresql_where=_LIVE,
+)
+Index(
+    "ix_articles_live_popular",
+    Article.views.desc(),
+    Article.published_at.desc(),
+    postgresql_where=_LIVE,
+)
+Index(
+    "ix_articles_live_category_popular",
+    Article.category,
+    Article.views.desc(),
+    Article.published_at.desc(),
+    postgresql_where=_LIVE,
+)
+Index(
+    "ix_articles_live_source_popular",
+    Article.source,
+    Article.views.desc(),
+    Article.published_at.desc(),
+    postgresql_where=_LIVE,
+)
+
+# Catch-all for rows outside the monthly partitions (and for metadata.create_all)
+event.listen(
+    Article.__table__,
+    "after_create",
+    DDL("CREATE TABLE articles_default PARTITION OF articles DEFAULT"),
+)
+
+# Live-article counts per category and source, plus the total: the facets of
+# an unfiltered search. Refreshed concurrently after each ingest (see
+# FacetService), which needs the unique index.
+ARTICLE_FACETS_QUERY = """
+    SELECT CASE grouping(category, source)
+               WHEN 1 THEN 'category' WHEN 2 THEN 'source' ELSE 'total'
+           END AS facet,
+           coalesce(category, source, '') AS value,
+           count(*) AS count
+    FROM articles
+    WHERE NOT is_deleted
+    GROUP BY GROUPING SETS ((category), (source), ())
+    HAVING grouping(category, source) = 3 OR coalesce(category, source) IS NOT NULL
+"""
+article_facets = table("article_facets", column("facet"), column("value"), column("count"))
+
+event.listen(
+    Article.__table__,
+    "after_create",
+    DDL(f"CREATE MATERIALIZED VIEW article_facets AS {ARTICLE_FACETS_QUERY}"),
+)
+event.listen(
+    Article.__table__,
+    "after_create",
+    DDL("CREATE UNIQUE INDEX ix_article_facets ON article_facets (facet, value)"),
+)
+event.listen(
+    Article.__table__,
+    "before_drop",
+    DDL("DROP MATERIALIZED VIEW IF EXISTS article_facets"),
+)
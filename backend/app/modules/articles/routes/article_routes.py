@@ -1,12 +1,34 @@
-from typing import List
+import asyncio
+import time
+from hashlib import blake2b
+from typing import Iterator, List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response, status
-from fastapi.encoders import jsonable_encoder
+import orjson
+from anyio import from_thread
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from backend.app.common.config.settings import settings
 from backend.app.common.dependencies.auth import get_current_user, required_roles
+from backend.app.common.exceptions.http import NotFoundError
+from backend.app.common.http.conditional import (
+    format_etag,
+    http_date,
+    is_not_modified,
+    not_modified,
+)
 from backend.app.common.logging.config import logger
+from backend.app.common.metrics.registry import ARTICLE_CACHE_READ_DURATION
 from backend.app.modules.articles.schemas.article import (
     ArticleCreate,
     ArticleFilters,
@@ -14,42 +36,214 @@ from backend.app.modules.articles.schemas.article import (
     ArticleUpdate,
 )
 from backend.app.modules.articles.services.article_service import ArticleService
+from backend.app.modules.articles.services.facet_service import FacetService
 from backend.app.modules.articles.services.recommendation_service import (
     get_personalized_recommendation,
 )
 from backend.app.modules.articles.tasks.scraping import scrape_articles_task
+from backend.app.modules.articles.utils.article_cache import (
+    ARTICLE_CACHE_TTL,
+    article_cache_entry,
+    hydrate_articles,
+    render_article,
+)
+from backend.app.modules.articles.utils.article_export import (
+    CURSOR_FIELDS,
+    EXPORT_MEDIA_TYPES,
+    encode_export,
+    parse_cursor,
+)
+from backend.app.modules.articles.utils.search_cache import (
+    bump_search_generation,
+    search_cache_key,
+    search_generation,
+)
 from backend.app.modules.articles.utils.view_utils.view_tracker import (
     ViewTracker,
     view_tracker,
 )
 from backend.app.modules.users.models.user import User
-from backend.app.shared.db.database import get_db
+from backend.app.shared.db.database import SessionLocal, get_db
+from backend.app.shared.db.routing import reads_from_primary
 from backend.app.shared.infrastructure.redis.client import RedisManager
+from backend.app.shared.infrastructure.redis.codec import CacheEntry
 
 router = APIRouter()
 
 
+def _load_article(id: UUID) -> Optional[CacheEntry]:
+    """Fresh serialized article for background cache refreshes."""
+    db = SessionLocal()
+    try:
+        return article_cache_entry(ArticleService.get_article_by_id(db, id))
+    except NotFoundError:
+        return None
+    finally:
+        db.close()
+
+
+async def _get_facets(db: Session, filters: ArticleFilters, generation: int) -> dict:
+    if not filters.criteria():
+        return FacetService.global_facets(db)
+
+    key = FacetService.cache_key(filters, generation)
+    facets = await RedisManager.get_cached_response(
+        key, expire=settings.article_facet_cache_ttl
+    )
+    if facets is None:
+        start = time.perf_counter()
+        with reads_from_primary(db):
+            facets = FacetService.filtered_facets(db, filters)
+        await RedisManager.cache_response(
+            key,
+            facets,
+            expire=settings.article_facet_cache_ttl,
+            delta=time.perf_counter() - start,
+        )
+    return facets
+
+
 @router.get(
     "/",
     response_model=List[ArticleResponse],
     summary="Search Articles",
-    description="Fetch articles with filters and pagination.",
+    description=(
+        "Fetch articles with filters and pagination. `fields` narrows each "
+        "returned object to the listed fields. With `facets`, the body is "
+        '`{"items": [...], "facets": {"total": n, "category": {...}, '
+        '"source": {...}}}`, counting every match per category and source.'
+    ),
+    responses={304: {"description": "Not modified (If-None-Match)."}},
 )
 async def get_articles(
-    response: Response,
+    request: Request,
     filters: ArticleFilters = Depends(),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(
         10, ge=1, le=100, description="Maximum number of records to return"
     ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return, or `summary` (no content)",
+        examples=["summary", "id,title,published_at"],
+    ),
+    facets: bool = Query(False, description="Include category and source counts"),
     db: Session = Depends(get_db),
 ):
-    articles, article_count = ArticleService.search_articles(
-        db, filters=filters, skip=skip, limit=limit
+    projection = ArticleService.resolve_fields(fields)
+    generation = await search_generation()
+    # Unfiltered facets may lag writes; the page total never comes from them
+    facet_counts = await _get_facets(db, filters, generation) if facets else None
+
+    # Full pages are cached as ids and hydrated from the article cache;
+    # projected pages as their rows, so no article body is ever loaded
+    key = search_cache_key(generation, filters, skip, limit, projection)
+    page = await RedisManager.get_cached_response(
+        key, expire=settings.article_search_cache_ttl
+    )
+    if page is None:
+        start = time.perf_counter()
+        # Filled from the primary: a lagging replica's results would be
+        # served for the whole TTL under the new generation
+        with reads_from_primary(db):
+            rows, total = ArticleService.search_articles(
+                db,
+                filters=filters,
+                skip=skip,
+                limit=limit,
+                fields=projection or ("id",),
+            )
+        if projection:
+            # JSON-ready, so hits serialize exactly like this miss
+            page = {
+                "items": orjson.loads(orjson.dumps(rows, option=orjson.OPT_UTC_Z)),
+                "total": int(total),
+            }
+        else:
+            page = {"ids": [str(row["id"]) for row in rows], "total": int(total)}
+        await RedisManager.cache_response(
+            key,
+            page,
+            expire=settings.article_search_cache_ttl,
+            delta=time.perf_counter() - start,
+        )
+
+    # Serialized here so the strong ETag covers the exact bytes sent
+    if projection:
+        body = orjson.dumps(page["items"])
+    else:
+        # Cached article bodies are spliced as-is; articles deleted since the
+        # page was cached are left out
+        entries = await hydrate_articles(db, page["ids"])
+        body = b"[%s]" % b",".join(entry.json() for entry in entries if entry)
+    if facet_counts is not None:
+        body = b'{"items":%s,"facets":%s}' % (body, orjson.dumps(facet_counts))
+    headers = {
+        "X-Total-Count": str(page["total"]),
+        "ETag": format_etag(blake2b(body, digest_size=16).digest()),
+        "Cache-Control": f"public, max-age={settings.article_list_max_age}",
+    }
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _export_batches(
+    filters: ArticleFilters, fields: tuple[str, ...], after
+) -> Iterator[list[dict]]:
+    # The request's session is closed before the body streams; use our own
+    db = SessionLocal()
+    try:
+        yield from ArticleService.export_articles(
+            db,
+            filters,
+            fields,
+            after=after,
+            batch_size=settings.article_export_batch_size,
+        )
+    finally:
+        db.close()
+
+
+@router.get(
+    "/export",
+    tags=["Admin Operations"],
+    summary="Export Articles",
+    description=(
+        "Streams every article matching the filters as NDJSON or CSV, ordered "
+        "by `created_at, id`. Pass the `created_at,id` of the last row received "
+        "as `after` to resume an interrupted export. **Requires Admin privileges.**"
+    ),
+    response_class=StreamingResponse,
+    dependencies=[Depends(required_roles(["admin"]))],
+)
+def export_articles(
+    filters: ArticleFilters = Depends(),
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Output format"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to export, or `summary`"
+    ),
+    after: Optional[str] = Query(
+        None,
+        description="Resume after this `created_at,id` keyset position",
+        examples=["2025-03-01T12:00:00Z,0b6f5c1e-8f7a-4e4c-9a53-5b1a6c8e2d10"],
+    ),
+    gzip: bool = Query(False, description="Download as a gzip file"),
+):
+    projection = ArticleService.resolve_fields(fields) or tuple(
+        ArticleResponse.model_fields
     )
+    projection += tuple(name for name in CURSOR_FIELDS if name not in projection)
+    cursor = parse_cursor(after)
 
-    response.headers["X-Total-Count"] = str(article_count)
-    return articles
+    filename = f"articles.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        encode_export(
+            _export_batches(filters, projection, cursor), projection, format, gzip
+        ),
+        media_type="application/gzip" if gzip else EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get(
@@ -62,7 +256,7 @@ async def get_articles(
 def get_recommendations(
     current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
-    return get_personalized_recommendation(db, current_user.id).all()
+    return get_personalized_recommendation(db, current_user.id)
 
 
 @router.post(
@@ -78,7 +272,10 @@ def create_article(
     db: Session = Depends(get_db),
     current_user: User = Depends(required_roles(["admin", "moderator"])),
 ):
-    return ArticleService.create_article(db, article)
+    created = ArticleService.create_article(db, article)
+    # Sync route: the insert runs in the threadpool, off the event loop
+    from_thread.run(bump_search_generation)
+    return created
 
 
 @router.get(
@@ -86,36 +283,76 @@ def create_article(
     response_model=ArticleResponse,
     summary="Get Article by ID",
     description="Fetch a single article by its ID. Returns a 404 if not found.",
-    responses={404: {"description": "Article not found."}},
+    responses={
+        304: {"description": "Not modified (If-None-Match / If-Modified-Since)."},
+        404: {"description": "Article not found."},
+    },
 )
 async def get_article(
     id: UUID,
+    request: Request,
     view_tracker: ViewTracker = Depends(lambda: view_tracker),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     cache_key = f"article:{id}"
 
-    # Track view first to prioritize responsiveness
+    # Count the view in process memory; it reaches Redis in a later batch
+    start = time.perf_counter()
     await view_tracker.increment(id)
 
-    # Check cache first
-    cached_article = await RedisManager.get_cached_response(cache_key)
+    # Check cache first, reading the views already in Redis in the same round
+    # trip; hot entries are refreshed in the background before they expire
+    entry, live_views = await RedisManager.get_cached_entry_and_counter(
+        cache_key,
+        f"views:{id}",
+        expire=ARTICLE_CACHE_TTL,
+        refresh=lambda: asyncio.to_thread(_load_article, id),
+    )
+    cache_hit = entry is not None
+    ARTICLE_CACHE_READ_DURATION.labels(result="hit" if cache_hit else "miss").observe(
+        time.perf_counter() - start
+    )
 
-    if cached_article:
-        # Add approximate views to cached response
-        current_views = await RedisManager.get_counter(f"views:{id}")
-        return {**cached_article, "views": cached_article["views"] + int(current_views)}
+    if not cache_hit:
+        # Fetch from DB if not found in cache
+        start = time.perf_counter()
+        article = ArticleService.get_article_by_id(db, id)
+        entry = article_cache_entry(article)
 
-    # Fetch from DB if not found in cache
-    article = ArticleService.get_article_by_id(db, id)
-    article_dict = jsonable_encoder(article)
+        # Cache if not deleted
+        if not article.is_deleted:
+            await RedisManager.cache_entry(
+                cache_key,
+                entry,
+                expire=ARTICLE_CACHE_TTL,
+                delta=time.perf_counter() - start,
+            )
 
-    # Convert to serializable format and cache if not deleted
-    if not article.is_deleted:
-        await RedisManager.cache_response(cache_key, article_dict, expire=600)
+    # Revalidate on every request (the view above must be counted) and keep
+    # the per-user response out of shared caches
+    headers = {
+        "ETag": format_etag(entry.etag, weak=True),
+        "Last-Modified": http_date(entry.last_modified),
+        "Cache-Control": "private, no-cache",
+    }
+    if is_not_modified(request, headers["ETag"], entry.last_modified):
+        return not_modified(headers)
 
-    return article_dict
+    # Splice approximate live views into the cached body; no (de)serialization,
+    # and no recompression when a precompressed variant is accepted
+    if cache_hit:
+        live_views += view_tracker.pending(id)
+    else:
+        live_views = 0
+    body, encoding = render_article(
+        entry, live_views, request.headers.get("accept-encoding", "")
+    )
+    if entry.variants:
+        headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @router.delete(
@@ -136,6 +373,7 @@ async def delete_article(
 ):
     await RedisManager.delete_cache(f"article:{id}")
     ArticleService.delete_article(db, id)
+    await bump_search_generation()
 
 
 @router.patch(
@@ -152,7 +390,9 @@ async def update_article(
     db: Session = Depends(get_db),
 ):
     await RedisManager.delete_cache(f"article:{id}")
-    return ArticleService.update_article(db, id, new_article)
+    article = ArticleService.update_article(db, id, new_article)
+    await bump_search_generation()
+    return article
 
 
 @router.post(
@@ -30,6 +30,12 @@ class ArticleResponse(ArticleBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Named projections for `fields=`; list views need no article bodies
+ARTICLE_FIELD_PRESETS = {
+    "summary": ("id", "title", "source", "category", "url", "published_at", "views"),
+}
+
+
 class ArticleUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
@@ -45,3 +51,10 @@ class ArticleFilters(BaseModel):
     end_date: Optional[datetime] = None
     sort_by: Optional[str] = "published_at"
     order: Optional[str] = "desc"
+
+    def criteria(self) -> dict:
+        """The filters that narrow the result set (not its order), JSON-ready."""
+        return self.model_dump(
+            exclude={"sort_by", "order"}, exclude_none=True, mode="json"
+        )
+
@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
+from typing import Iterator, Optional, Union
 from uuid import UUID
 
 from pydantic import ValidationError
-from sqlalchemy import func, select, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import any_, bindparam, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -14,20 +16,86 @@ from backend.app.common.exceptions.http import (
     ServerError,
 )
 from backend.app.common.logging.config import logger
-from backend.app.modules.articles.models.article import Article
-from backend.app.modules.articles.schemas.article import ArticleCreate, ArticleFilters
+from backend.app.modules.articles.models.article import Article, ArticleUrl
+from backend.app.modules.articles.schemas.article import (
+    ARTICLE_FIELD_PRESETS,
+    ArticleCreate,
+    ArticleFilters,
+    ArticleResponse,
+)
+from backend.app.shared.db.routing import reads_from_replica
 
 
 class ArticleService:
     @staticmethod
-    def search_articles(
-        db: Session, filters: ArticleFilters, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Article], str]:
+    def resolve_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+        """Parse a `fields=` projection (names or a preset) in response order."""
+        if not fields:
+            return None
+
+        requested: set[str] = set()
+        for name in fields.split(","):
+            name = name.strip()
+            requested.update(ARTICLE_FIELD_PRESETS.get(name, (name,)))
+
+        unknown = requested - ArticleResponse.model_fields.keys()
+        if unknown:
+            raise BadRequestError(
+                message="Invalid field",
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        return tuple(name for name in ArticleResponse.model_fields if name in requested)
 
+    @staticmethod
+    @reads_from_replica
+    def search_articles(
+        db: Session,
+        filters: ArticleFilters,
+        skip: int = 0,
+        limit: int = 10,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> tuple[Union[list[Article], list[dict]], str]:
+        """Filtered, sorted page of articles and the total match count.
+
+        With `fields`, only those columns are selected and each result is a
+        dict of them instead of an `Article`.
+        """
         allowed_sort_fields = {"category", "views", "published_at"}
-        stmt = select(Article)
+        if fields:
+            stmt = select(*(getattr(Article, name) for name in fields))
+        else:
+            stmt = select(Article)
+        stmt = ArticleService._apply_filters(stmt, filters)
+
+        # Sorting
+        # Verify column existence
+        if filters.sort_by not in allowed_sort_fields:
+            raise BadRequestError(
+                message="Invalid field", detail=f"Invalid sort field: {filters.sort_by}"
+            )
+
+        sort_column = getattr(Article, filters.sort_by, None)
+        if sort_column:
+            stmt = stmt.order_by(
+                sort_column.desc() if filters.order == "desc" else sort_column.asc()
+            )
+
+        # Get total count
+        total_count = db.execute(
+            select(func.count()).select_from(stmt.subquery())
+        ).scalar()
+
+        # Apply pagination
+        result = db.execute(stmt.limit(limit).offset(skip))
+        if fields:
+            articles = [dict(row) for row in result.mappings()]
+        else:
+            articles = result.scalars().all()
 
-        # Apply filters
+        return articles, str(total_count)
+
+    @staticmethod
+    def _apply_filters(stmt, filters: ArticleFilters):
         if filters.category:
             stmt = stmt.where(Article.category.ilike(f"%{filters.category}%"))
         if filters.source:
@@ -47,44 +115,69 @@ class ArticleService:
         elif filters.end_date:
             stmt = stmt.where(Article.published_at <= filters.end_date)
 
-        # Sorting
-        # Verify column existence
-        if filters.sort_by not in allowed_sort_fields:
-            raise BadRequestError(
-                message="Invalid field", detail=f"Invalid sort field: {filters.sort_by}"
-            )
+        return stmt
 
-        sort_column = getattr(Article, filters.sort_by, None)
-        if sort_column:
-            stmt = stmt.order_by(
-                sort_column.desc() if filters.order == "desc" else sort_column.asc()
-            )
+    @staticmethod
+    def export_articles(
+        db: Session,
+        filters: ArticleFilters,
+        fields: tuple[str, ...],
+        after: Optional[tuple[datetime, UUID]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[dict]]:
+        """Stream filtered articles in (created_at, id) order, batch by batch.
+
+        Rows are fetched through a server-side cursor, so memory use depends
+        on `batch_size` only. `after` resumes behind the given keyset
+        position; `fields` always includes `created_at` and `id` for that.
+        """
+        stmt = ArticleService._apply_filters(
+            select(*(getattr(Article, name) for name in fields)), filters
+        )
+        if after:
+            stmt = stmt.where(tuple_(Article.created_at, Article.id) > after)
+        stmt = stmt.order_by(Article.created_at, Article.id).execution_options(
+            yield_per=batch_size
+        )
 
-        # Get total count
-        total_count = db.execute(
-            select(func.count()).select_from(stmt.subquery())
-        ).scalar()
+        result = db.execute(stmt)
+        try:
+            for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+        finally:
+            result.close()
 
-        # Apply pagination
-        articles = db.execute(stmt.limit(limit).offset(skip)).scalars().all()
+    @staticmethod
+    def _claim_urls(db: Session, urls: list[str]) -> set[str]:
+        """Register URLs in `article_urls`; returns the ones not seen before.
 
-        return articles, str(total_count)
+        The partitioned `articles` table cannot enforce a global unique URL,
+        so inserts claim it here first. Concurrent claims of the same URL
+        wait on the registry's primary key until the first one commits.
+        """
+        stmt = (
+            insert(ArticleUrl)
+            .values([{"url": url} for url in urls])
+            .on_conflict_do_nothing()
+            .returning(ArticleUrl.url)
+        )
+        return set(db.execute(stmt).scalars())
 
     @staticmethod
     def create_article(db: Session, article_data: ArticleCreate) -> Article:
+        if not ArticleService._claim_urls(db, [article_data.url]):
+            db.rollback()
+            raise ConflictError("Article with this URL already exists")
+
+        # published_at is the partition key; omitted, it defaults to now
         stmt = (
             insert(Article)
-            .values(**article_data.model_dump())
-            .on_conflict_do_nothing(index_elements=["url"])
+            .values(**article_data.model_dump(exclude_none=True))
             .returning(Article)
         )
-
-        article = db.execute(stmt).scalar_one_or_none()
+        article = db.execute(stmt).scalar_one()
         db.commit()
 
-        if not article:
-            raise ConflictError("Article with this URL already exists")
-
         return article
 
     @staticmethod
@@ -97,6 +190,19 @@ class ArticleService:
 
         return article
 
+    @staticmethod
+    def get_articles_by_ids(db: Session, article_ids: list[UUID]) -> list[Article]:
+        """The articles among `article_ids` that exist, in no particular order.
+
+        The ids are bound as one array (`id = ANY(:ids)`), so every batch size
+        shares a statement.
+        """
+        if not article_ids:
+            return []
+        ids = bindparam("ids", article_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+        stmt = select(Article).where(Article.id == any_(ids))
+        return list(db.execute(stmt).scalars())
+
     @staticmethod
     def delete_article(db: Session, article_id: UUID) -> None:
         current_time = datetime.now(timezone.utc)
@@ -119,10 +225,15 @@ class ArticleService:
     ) -> Article:
         # Update the model instance with the fields provided in new_data
         # Only include fields that are set
+        values = new_data.model_dump(exclude_unset=True)
+        # The partition key can move an article but never be cleared
+        if "published_at" in values and values["published_at"] is None:
+            del values["published_at"]
+
         stmt = (
             update(Article)
             .where(Article.id == article_id)
-            .values(**new_data.model_dump(exclude_unset=True))
+            .values(**values, updated_at=func.now())
             .returning(Article)
         )
 
@@ -168,18 +279,47 @@ class ArticleService:
             logger.info("No valid articles to save")
             return {"saved": 0, "errors": validation_errors}
 
+        # Last one wins for URLs repeated within a batch
+        valid_articles = list({a["url"]: a for a in valid_articles}.values())
+
         try:
-            stmt = insert(Article).values(valid_articles)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["url"],
-                set_={
-                    "title": stmt.excluded.title,
-                    "content": stmt.excluded.content,
-                    "published_at": stmt.excluded.published_at,
-                },
+            new_urls = ArticleService._claim_urls(
+                db, [article["url"] for article in valid_articles]
             )
-
-            result = db.execute(stmt)
+            new_articles = [a for a in valid_articles if a["url"] in new_urls]
+            if new_articles:
+                db.execute(insert(Article).values(new_articles))
+
+            existing = [a for a in valid_articles if a["url"] not in new_urls]
+            if existing:
+                articles = Article.__table__
+                db.execute(
+                    update(articles)
+                    .where(articles.c.url == bindparam("b_url"))
+                    # Unchanged re-scrapes keep their Last-Modified
+                    .where(
+                        articles.c.title.is_distinct_from(bindparam("b_title"))
+                        | articles.c.content.is_distinct_from(bindparam("b_content"))
+                        | articles.c.published_at.is_distinct_from(
+                            bindparam("b_published_at")
+                        )
+                    )
+                    .values(
+                        title=bindparam("b_title"),
+                        content=bindparam("b_content"),
+                        published_at=bindparam("b_published_at"),
+                        updated_at=func.now(),
+                    ),
+                    [
+                        {
+                            "b_url": a["url"],
+                            "b_title": a["title"],
+                            "b_content": a["content"],
+                            "b_published_at": a["published_at"],
+                        }
+                        for a in existing
+                    ],
+                )
             db.commit()
 
             logger.info(
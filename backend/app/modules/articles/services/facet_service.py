@@ -0,0 +1,79 @@
+from hashlib import blake2b
+
+import orjson
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.orm import Session
+
+from backend.app.common.logging.config import logger
+from backend.app.modules.articles.models.article import Article, article_facets
+from backend.app.modules.articles.schemas.article import ArticleFilters
+from backend.app.modules.articles.services.article_service import ArticleService
+from backend.app.shared.db.routing import reads_from_replica
+
+FACETS = ("category", "source")
+
+
+def _facet_counts(rows) -> dict:
+    """`{"total": n, "category": {...}, "source": {...}}` from (facet, value, count)."""
+    facets = {"total": 0, **{facet: {} for facet in FACETS}}
+    for facet, value, count in sorted(rows, key=lambda row: -row[2]):
+        if facet == "total":
+            facets["total"] = count
+        else:
+            facets[facet][value] = count
+    return facets
+
+
+class FacetService:
+    """Category and source counts for article searches.
+
+    Unfiltered counts are read from the `article_facets` materialized view,
+    as of its last refresh. Filtered counts come from one GROUPING SETS
+    query. Either way they only describe the facets: the page total of a
+    search is always counted live.
+    """
+
+    @staticmethod
+    def cache_key(filters: ArticleFilters, generation: int) -> str:
+        """Key of the filtered counts; a new search generation retires it."""
+        criteria = orjson.dumps(filters.criteria(), option=orjson.OPT_SORT_KEYS)
+        digest = blake2b(criteria, digest_size=16).hexdigest()
+        return f"facets:{generation}:{digest}"
+
+    @staticmethod
+    @reads_from_replica
+    def global_facets(db: Session) -> dict:
+        """Counts over all live articles, as of the last refresh."""
+        return _facet_counts(db.execute(select(article_facets)).all())
+
+    @staticmethod
+    @reads_from_replica
+    def filtered_facets(db: Session, filters: ArticleFilters) -> dict:
+        """Counts over the live articles matching `filters`."""
+        level = func.grouping(Article.category, Article.source)
+        stmt = ArticleService._apply_filters(
+            select(level, Article.category, Article.source, func.count()),
+            filters,
+        ).group_by(
+            func.grouping_sets(
+                tuple_(Article.category), tuple_(Article.source), tuple_()
+            )
+        )
+
+        rows = []
+        for grouping, category, source, count in db.execute(stmt):
+            # grouping() sets a bit per column aggregated away
+            if grouping == 3:
+                rows.append(("total", "", count))
+            elif grouping == 1 and category is not None:
+                rows.append(("category", category, count))
+            elif grouping == 2 and source is not None:
+                rows.append(("source", source, count))
+        return _facet_counts(rows)
+
+    @staticmethod
+    def refresh(db: Session) -> None:
+        """Recompute `article_facets` without blocking readers."""
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY article_facets"))
+        db.commit()
+        logger.info("Refreshed article facets")
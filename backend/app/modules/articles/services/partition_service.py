@@ -0,0 +1,140 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.app.common.logging.config import logger
+
+DEFAULT_PARTITION = "articles_default"
+
+# Serializes partition DDL between overlapping maintenance runs
+_LOCK_ID = 0x61727469  # "arti"
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"articles_{month:%Y_%m}"
+
+
+def _bound(month: date) -> str:
+    # Partition bounds are literals; pin them to UTC like the stored values
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+class PartitionService:
+    """Monthly range partitions of `articles` by `published_at`.
+
+    Partitions are created ahead of time by a beat task. Rows whose month
+    has no partition yet land in `articles_default`; creating that month's
+    partition later moves them out of it.
+    """
+
+    @staticmethod
+    def list_partitions(db: Session) -> list[str]:
+        return list(
+            db.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = 'articles'::regclass ORDER BY c.relname"
+                )
+            ).scalars()
+        )
+
+    @staticmethod
+    def create_partition(db: Session, month: date) -> None:
+        """Create and attach the partition for `month`.
+
+        The table is built detached, filled with any rows of that month
+        parked in the default partition, then attached. Its CHECK constraint
+        matches the partition bounds, so attaching does not scan it. It is
+        dropped once attached, when the bounds enforce the same thing.
+
+        Attaching still takes an ACCESS EXCLUSIVE lock on `articles_default`
+        while it is scanned for rows in the new range. That lock is held
+        until the caller commits. Until then, queries that cannot prune the
+        default partition wait. Partitions are created months ahead, so the
+        default partition is normally empty and the scan is short.
+        """
+        name, start, end = partition_name(month), month, add_months(month, 1)
+        db.execute(
+            text(
+                f"CREATE TABLE {name} "
+                "(LIKE articles INCLUDING DEFAULTS INCLUDING CONSTRAINTS, "
+                f"CONSTRAINT {name}_bounds CHECK (published_at >= {_bound(start)} "
+                f"AND published_at < {_bound(end)}))"
+            )
+        )
+        db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                "WHERE published_at >= :start AND published_at < :end RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            {
+                "start": datetime(start.year, start.month, 1, tzinfo=timezone.utc),
+                "end": datetime(end.year, end.month, 1, tzinfo=timezone.utc),
+            },
+        )
+        db.execute(
+            text(
+                f"ALTER TABLE articles ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ({_bound(start)}) TO ({_bound(end)})"
+            )
+        )
+        db.execute(text(f"ALTER TABLE {name} DROP CONSTRAINT {name}_bounds"))
+
+    @staticmethod
+    def detach_partition(db: Session, name: str) -> None:
+        """Detach a monthly partition, keeping it as a standalone table.
+
+        Its URLs are released so the articles can be scraped again. Dropping
+        or archiving the detached table is left to the operator.
+        """
+        db.execute(text(f"ALTER TABLE articles DETACH PARTITION {name}"))
+        db.execute(
+            text(f"DELETE FROM article_urls u USING {name} a WHERE u.url = a.url")
+        )
+
+    @staticmethod
+    def maintain(
+        db: Session, today: date, months_ahead: int, retention_months: int = 0
+    ) -> dict:
+        """Ensure partitions through `months_ahead` and detach expired ones.
+
+        Idempotent. With `retention_months`, partitions wholly older than
+        that many months before the current one are detached.
+        """
+        db.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": _LOCK_ID})
+        existing = set(PartitionService.list_partitions(db))
+        current = month_start(today)
+
+        created = []
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if partition_name(month) not in existing:
+                PartitionService.create_partition(db, month)
+                created.append(partition_name(month))
+
+        detached = []
+        if retention_months:
+            cutoff = partition_name(add_months(current, -retention_months))
+            for name in sorted(existing - {DEFAULT_PARTITION}):
+                if name < cutoff:
+                    PartitionService.detach_partition(db, name)
+                    detached.append(name)
+
+        db.commit()
+        if created or detached:
+            logger.info(
+                "Article partitions created=%s detached=%s", created, detached
+            )
+        return {"created": created, "detached": detached}
@@ -2,9 +2,11 @@ from sqlalchemy.orm import Session
 
 from backend.app.modules.articles.models.article import Article
 from backend.app.modules.users.services.preference_service import PreferenceService
+from backend.app.shared.db.routing import reads_from_replica
 
 
-def get_personalized_recommendation(db: Session, user_id: str):
+@reads_from_replica
+def get_personalized_recommendation(db: Session, user_id: str) -> list[Article]:
     prefs = PreferenceService.get_preferences(db, user_id)
     saved_articles = prefs.saved_articles if prefs else []
 
@@ -38,6 +40,8 @@ def get_personalized_recommendation(db: Session, user_id: str):
         base_query = base_query.filter(Article.source.in_(sources))
 
     # Order by popularity (views) and recency
-    return base_query.order_by(Article.views.desc(), Article.published_at.desc()).limit(
-        20
+    return (
+        base_query.order_by(Article.views.desc(), Article.published_at.desc())
+        .limit(20)
+        .all()
     )
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+from typing import Dict
+
+from sqlalchemy.orm import Session
+
+from backend.app.common.config.settings import settings
+from backend.app.common.logging.config import logger
+from backend.app.modules.articles.services.partition_service import PartitionService
+from backend.app.modules.articles.utils.search_cache import bump_search_generation_sync
+from backend.app.shared.db.database import get_db
+from backend.app.shared.infrastructure.celery.config import celery
+
+
+@celery.task(queue="high_priority")
+def maintain_article_partitions() -> Dict:
+    """Create upcoming monthly article partitions and detach expired ones"""
+    db: Session = next(get_db())
+    try:
+        result = PartitionService.maintain(
+            db,
+            today=datetime.now(timezone.utc).date(),
+            months_ahead=settings.article_partitions_ahead,
+            retention_months=settings.article_partition_retention_months,
+        )
+        if result["detached"]:
+            # Detached articles must drop out of cached search pages
+            bump_search_generation_sync()
+        return result
+    except Exception:
+        logger.exception("Article partition maintenance failed")
+        db.rollback()
+        raise
+    finally:
+        db.close()
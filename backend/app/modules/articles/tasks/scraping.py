@@ -10,6 +10,8 @@ from sqlalchemy.orm import Session
 from backend.app.common.config.settings import settings
 from backend.app.common.logging.config import logger
 from backend.app.modules.articles.services.article_service import ArticleService
+from backend.app.modules.articles.services.facet_service import FacetService
+from backend.app.modules.articles.utils.search_cache import bump_search_generation_sync
 from backend.app.shared.db.database import get_db
 from backend.app.shared.infrastructure.celery.config import celery
 
@@ -101,6 +103,17 @@ def scrape_articles_task(self: Task) -> Dict:
         result = ArticleService.save_articles_to_db(db, articles_data)
         db.commit()
         logger.info(f"Successfully saved {result.get('saved', 0)} articles")
+
+        # Stale facets and search pages are not worth re-scraping for
+        try:
+            FacetService.refresh(db)
+        except Exception:
+            logger.exception("Article facet refresh failed")
+            db.rollback()
+        try:
+            bump_search_generation_sync()
+        except Exception:
+            logger.exception("Search cache invalidation failed")
         return result
 
     except ScrapingError as e:
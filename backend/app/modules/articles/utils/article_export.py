@@ -0,0 +1,82 @@
+import csv
+import io
+import zlib
+from datetime import datetime
+from itertools import chain
+from typing import Iterable, Iterator, Optional
+from uuid import UUID
+
+import orjson
+
+from backend.app.common.exceptions.http import BadRequestError
+
+# Keyset columns; always exported so the last row can resume the export
+CURSOR_FIELDS = ("created_at", "id")
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def parse_cursor(after: Optional[str]) -> Optional[tuple[datetime, UUID]]:
+    """`<created_at>,<id>` of the last row received, as a keyset position."""
+    if not after:
+        return None
+    try:
+        created_at, _, id = after.partition(",")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except ValueError:
+        raise BadRequestError(
+            message="Invalid cursor",
+            detail="Expected `<created_at>,<id>` of the last exported row",
+        )
+
+
+def _ndjson(batch: list[dict]) -> bytes:
+    return b"".join(
+        orjson.dumps(row, option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
+        for row in batch
+    )
+
+
+def _csv(batch: list[dict], fields: tuple[str, ...], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(fields)
+    for row in batch:
+        writer.writerow(
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in (row[name] for name in fields)
+        )
+    return buffer.getvalue().encode()
+
+
+def encode_export(
+    batches: Iterable[list[dict]],
+    fields: tuple[str, ...],
+    format: str,
+    gzip: bool = False,
+) -> Iterator[bytes]:
+    """Serialize export batches to NDJSON or CSV, one chunk per batch.
+
+    With `gzip`, the chunks form a single gzip file (for downloads stored
+    as-is); without it, transport compression is left to the middleware.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzip else None
+    header = format == "csv"
+    # The trailing empty batch writes the CSV header when nothing matched
+    for batch in chain(batches, [[]]):
+        if format == "csv":
+            chunk = _csv(batch, fields, header)
+            header = False
+        else:
+            chunk = _ndjson(batch)
+        if compressor is not None:
+            chunk = compressor.compress(chunk)
+        if chunk:
+            yield chunk
+
+    if compressor is not None:
+        yield compressor.flush()
@@ -0,0 +1,61 @@
+"""Generation-keyed cache of article search results.
+
+A cached page of full articles holds only the matching ids and the total;
+the articles themselves are hydrated from the per-article cache. Pages with
+a `fields` projection hold the projected rows instead, so they never load
+article bodies. Pages are filled from the primary, and their total is
+always the live count (never a facet total), so faceted and plain requests
+for the same page share it. Every key embeds the current search
+generation, which article writes and ingests bump, so pages from before a
+write are never read again and simply expire: nothing has to be found
+(SCAN) and deleted.
+"""
+
+from hashlib import blake2b
+from typing import Optional
+
+import orjson
+from redis import Redis
+
+from backend.app.modules.articles.schemas.article import ArticleFilters
+from backend.app.shared.infrastructure.redis.client import RedisManager
+
+GENERATION_KEY = "search:generation"
+
+
+async def search_generation() -> int:
+    return await RedisManager.get_counter(GENERATION_KEY)
+
+
+async def bump_search_generation() -> None:
+    """Retire every cached search page (and filtered facets)."""
+    await RedisManager.increment_counter(GENERATION_KEY)
+
+
+def bump_search_generation_sync() -> None:
+    """`bump_search_generation` for Celery tasks, which have no event loop."""
+    redis = Redis.from_url(RedisManager.redis_url(), socket_connect_timeout=2)
+    try:
+        redis.incr(GENERATION_KEY)
+    finally:
+        redis.close()
+
+
+def search_cache_key(
+    generation: int,
+    filters: ArticleFilters,
+    skip: int,
+    limit: int,
+    fields: Optional[tuple[str, ...]] = None,
+) -> str:
+    """Key of one result page; equal queries hash equally whatever their order."""
+    query = orjson.dumps(
+        {
+            "filters": filters.model_dump(mode="json"),
+            "skip": skip,
+            "limit": limit,
+            "fields": fields,
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return f"search:{generation}:{blake2b(query, digest_size=16).hexdigest()}"
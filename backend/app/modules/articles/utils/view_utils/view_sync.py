@@ -1,9 +1,15 @@
 import asyncio
+import time
 
 from sqlalchemy.sql import update
 from sqlalchemy.sql.expression import bindparam
 
 from backend.app.common.logging.config import logger
+from backend.app.common.metrics.registry import (
+    VIEW_SYNC_DURATION,
+    VIEW_SYNC_LAST_SUCCESS,
+    VIEW_SYNC_PENDING_KEYS,
+)
 from backend.app.modules.articles.models.article import Article
 from backend.app.shared.db.database import get_db
 from backend.app.shared.infrastructure.redis.client import RedisManager
@@ -17,13 +23,18 @@ class ViewSynchronizer:
 
     async def sync(self):
         """Atomic sync with get-and-reset pattern"""
+        start = time.perf_counter()
         redis = await RedisManager.get_redis()
         keys = await redis.keys("views:*")
+        VIEW_SYNC_PENDING_KEYS.set(len(keys))
 
         # Process in chuncks to prevent memomry issues
         for chunck in self._chuncked(keys, self.batch_size):
             await self._process_chunck(chunck)
 
+        VIEW_SYNC_DURATION.observe(time.perf_counter() - start)
+        VIEW_SYNC_LAST_SUCCESS.set(time.time())
+
     def _chuncked(self, list, n):
         """Yield successive n-sized chuncks from lst"""
         for i in range(0, len(list), n):
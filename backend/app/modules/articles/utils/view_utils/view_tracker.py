@@ -1,9 +1,12 @@
 import asyncio
+import time
 from collections import defaultdict
 from contextlib import suppress
+from typing import Optional
 from uuid import UUID
 
 from backend.app.common.logging.config import logger
+from backend.app.common.metrics.registry import VIEW_BUFFER_SIZE, VIEW_FLUSH_DURATION
 from backend.app.shared.infrastructure.redis.client import RedisManager
 
 
@@ -21,18 +24,29 @@ class ViewTracker:
             return
         self.__initialized = True
         self.buffer: dict[str, int] = defaultdict(int)
+        # Views taken out of the buffer by a flush that has not completed
+        self.in_flight: dict[str, int] = {}
         self.lock = asyncio.Lock()
         self.batch_size = 500
         self.timeout = 60  # Seconds before forcing a flush
         self._flush_task = None
+        self._threshold_flush: Optional[asyncio.Task] = None
 
     async def increment(self, article_id: UUID):
-        async with self.lock:
-            self.buffer[str(article_id)] += 1
+        """Count a view in process memory; never waits on Redis."""
+        self.buffer[str(article_id)] += 1
+        VIEW_BUFFER_SIZE.set(len(self.buffer))
+
+        # Flush in the background when threshold is reached
+        if len(self.buffer) >= self.batch_size and (
+            self._threshold_flush is None or self._threshold_flush.done()
+        ):
+            self._threshold_flush = asyncio.create_task(self._flush())
 
-            # Flush when threshold is reached
-            if len(self.buffer) >= self.batch_size:
-                await self._flush()
+    def pending(self, article_id: UUID) -> int:
+        """Views of `article_id` counted here but not yet in Redis."""
+        key = str(article_id)
+        return self.buffer.get(key, 0) + self.in_flight.get(key, 0)
 
     async def start_periodic_flush(self):
         """Start background flushing task"""
@@ -44,6 +58,8 @@ class ViewTracker:
             self._flush_task.cancel()
             with suppress(asyncio.CancelledError):
                 await self._flush_task
+        if self._threshold_flush:
+            await self._threshold_flush
 
     async def _periodic_flush(self):
         """Ensure eventual consistency even during low traffic"""
@@ -52,19 +68,30 @@ class ViewTracker:
             await self._flush()
 
     async def _flush(self):
-        if not self.buffer:
-            return
-        try:
-            redis = await RedisManager.get_redis()
-            async with redis.pipeline() as pipe:
-                for aid, count in self.buffer.items():
-                    pipe.incrby(f"views:{aid}", count)
-                await pipe.execute()
+        async with self.lock:
+            if not self.buffer:
+                return
+            start = time.perf_counter()
+            # Views counted while the pipeline runs go to a fresh buffer
+            flushing = self.in_flight = self.buffer
+            self.buffer = defaultdict(int)
+            try:
+                async with RedisManager.batch() as batch:
+                    for aid, count in flushing.items():
+                        batch.incrby(f"views:{aid}", count)
+                # In Redis now; pending() must stop adding them on top
+                self.in_flight = {}
 
-            logger.info(f"Flushed {len(self.buffer)} view increments")
-            self.buffer.clear()
-        except Exception as e:
-            logger.error("Error flushing view increments", exc_info=e)
+                logger.info(f"Flushed {len(flushing)} view increments")
+                VIEW_FLUSH_DURATION.observe(time.perf_counter() - start)
+            except Exception as e:
+                logger.error("Error flushing view increments", exc_info=e)
+                # Keep them for the next flush
+                self.in_flight = {}
+                for aid, count in flushing.items():
+                    self.buffer[aid] += count
+            finally:
+                VIEW_BUFFER_SIZE.set(len(self.buffer))
 
 
 view_tracker = ViewTracker()
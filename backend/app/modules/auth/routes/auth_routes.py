@@ -6,12 +6,12 @@ from sqlalchemy.orm import Session
 import backend.app.common.security.auth as auth
 from backend.app.common.exceptions.http import UnauthorizedError
 from backend.app.common.security.rate_limiting import rate_limiter
+from backend.app.common.security.revocation import revocation_list
 from backend.app.modules.auth.schemas.token import Token
 from backend.app.modules.users.models.user import User
 from backend.app.modules.users.schemas.user import UserCreate, UserResponse
 from backend.app.modules.users.services.user_service import UserService
 from backend.app.shared.db.database import get_db
-from backend.app.shared.infrastructure.redis.client import RedisManager
 
 router = APIRouter()
 
@@ -121,6 +121,7 @@ def signup(user: UserCreate, db: Session = Depends(get_db)):
 
     ### Possible Errors:
     - `401 Unauthorized`: Invalid username or password.
+    - `503 Service Unavailable`: Password hashing capacity exhausted, retry shortly.
     """,
     responses={
         200: {
@@ -145,6 +146,7 @@ def signup(user: UserCreate, db: Session = Depends(get_db)):
                 }
             },
         },
+        503: {"description": "Too many concurrent logins, retry shortly"},
     },
     dependencies=[Depends(rate_limiter(5, 60))],
 )
@@ -158,10 +160,21 @@ def login(
     # Find user by username
     user = db.query(User).filter(User.username == user_credentials.username).first()
 
-    # Validate credentials
-    if not (user and auth.verify_password(user_credentials.password, user.password)):
+    if not user:
         raise UnauthorizedError(detail="Invalid username or password")
 
+    # Validate credentials (bcrypt runs in the password hashing pool)
+    is_valid, new_hash = auth.verify_and_update_password_in_pool(
+        user_credentials.password, user.password
+    )
+    if not is_valid:
+        raise UnauthorizedError(detail="Invalid username or password")
+
+    # Transparently migrate hashes created with an outdated cost
+    if new_hash:
+        user.password = new_hash
+        db.commit()
+
     # Generate access token
     access_token = auth.create_access_token(
         data={"username": user.username, "role": user.role.name}
@@ -194,8 +207,7 @@ async def logout(refresh_token: str = Cookie(None)):
         token_data = await auth.verify_refresh_token(
             refresh_token, UnauthorizedError(detail="Could not validate refresh token")
         )
-        jti = token_data.jti
-        await RedisManager.add_to_blacklist(jti, refresh_token)
+        await revocation_list.revoke(token_data.jti, refresh_token)
 
     response = JSONResponse(content={"message": "Logged out successfully"})
     response.delete_cookie(key="refresh_token")
@@ -210,15 +222,10 @@ async def refresh_token(
     if not refresh_token:
         raise UnauthorizedError(detail="Missing refresh token")
 
-    # Validate refresh token
+    # Validate refresh token (also rejects revoked tokens)
     token_data = await auth.verify_refresh_token(
         refresh_token, UnauthorizedError(detail="Could not validate refresh token")
     )
-    jti = token_data.jti
-
-    # Check if the refresh token is blacklisted
-    if await RedisManager.is_token_blacklisted(jti):
-        raise UnauthorizedError(detail="Token revoked")
 
     # Generate new access token
     new_access_token = auth.create_access_token(
@@ -226,7 +233,7 @@ async def refresh_token(
     )
 
     # Issue a new refresh token and revoke old one
-    await RedisManager.add_to_blacklist(jti, refresh_token)
+    await revocation_list.revoke(token_data.jti, refresh_token)
 
     new_refresh_token = auth.create_refresh_token(
         data={"username": token_data.username, "role": token_data.role}
@@ -1,10 +1,12 @@
 from sqlalchemy.orm import Session
 
 from backend.app.modules.users.models.preference import UserPreference
+from backend.app.shared.db.routing import reads_from_replica
 
 
 class PreferenceService:
     @staticmethod
+    @reads_from_replica
     def get_preferences(db: Session, user_id: str):
         return (
             db.query(UserPreference).filter(UserPreference.user_id == user_id).first()
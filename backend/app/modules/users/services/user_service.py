@@ -14,10 +14,12 @@ from backend.app.common.exceptions.http import (
 from backend.app.common.security import auth
 from backend.app.modules.users.models.user import User
 from backend.app.modules.users.schemas.user import UserCreate, UserUpdate
+from backend.app.shared.db.routing import reads_from_replica
 
 
 class UserService:
     @staticmethod
+    @reads_from_replica
     def get_all_users(
         db: Session,
         limit: int = 10,
@@ -46,6 +48,7 @@ class UserService:
         return db.execute(stmt).scalars().all()
 
     @staticmethod
+    @reads_from_replica
     def search_users(
         db: Session,
         email: Optional[str] = None,
@@ -66,6 +69,7 @@ class UserService:
         return users
 
     @staticmethod
+    @reads_from_replica
     def get_user_by_id(db: Session, user_id: UUID) -> User:
         stmt = select(User).where(User.id == user_id)
         user = db.execute(stmt).scalar_one_or_none()
@@ -77,8 +81,8 @@ class UserService:
 
     @staticmethod
     def create_user(db: Session, user_data: UserCreate) -> User:
+        user_data.password = auth.hash_password_in_pool(user_data.password)
         try:
-            user_data.password = auth.get_password_hash(user_data.password)
             stmt = (
                 insert(User)
                 .values(**user_data.model_dump(), role_name="regular")
@@ -140,7 +144,9 @@ class UserService:
         update_dict = new_data.model_dump(exclude_unset=True)
 
         if "password" in update_dict:
-            update_dict["password"] = auth.get_password_hash(update_dict["password"])
+            update_dict["password"] = auth.hash_password_in_pool(
+                update_dict["password"]
+            )
 
         # Case-insensitive check and update in single operation
         stmt = (
@@ -1,13 +1,56 @@
 from sqlalchemy import create_engine
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
 
 from backend.app.common.config.settings import settings
+from backend.app.shared.db.instrumentation import (
+    InstrumentedQueuePool,
+    instrument_engine,
+)
 
 SQLALCHEMY_DATABASE_URL = settings.database_url
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=20,
-    max_overflow=10,
-    pool_timeout=30
-)
+
+# Per-process pool sizing, chosen with DB_POOL_PROFILE. Each uvicorn worker
+# and each Celery worker process holds its own pool, so totals multiply by
+# replicas x processes; keep them well under Postgres' max_connections.
+# Celery's greenlets mostly wait on HTTP, so a few connections serve them.
+POOL_PROFILES = {
+    "api": {"pool_size": 10, "max_overflow": 5, "pool_timeout": 10},
+    "celery": {"pool_size": 4, "max_overflow": 2, "pool_timeout": 30},
+}
+
+
+def _pool_options(url: str) -> dict:
+    if settings.db_pgbouncer:
+        # pgbouncer (transaction pooling) owns the pool. psycopg 3 would
+        # prepare statements on connections it no longer owns after COMMIT;
+        # psycopg2 never uses server-side prepared statements.
+        options = {"poolclass": NullPool}
+        if make_url(url).get_driver_name() == "psycopg":
+            options["connect_args"] = {"prepare_threshold": None}
+        return options
+
+    profile = dict(POOL_PROFILES[settings.db_pool_profile])
+    if settings.db_pool_size is not None:
+        profile["pool_size"] = settings.db_pool_size
+    if settings.db_max_overflow is not None:
+        profile["max_overflow"] = settings.db_max_overflow
+    return {
+        "poolclass": InstrumentedQueuePool,
+        # Drop connections a restarted server or idle timeout already closed
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        **profile,
+    }
+
+
+def _create_engine(url: str, name: str):
+    return instrument_engine(create_engine(url, **_pool_options(url)), name)
+
+
+# The primary; all writes and anything not explicitly replica-eligible
+engine = _create_engine(SQLALCHEMY_DATABASE_URL, "primary")
+reader_engines = [
+    _create_engine(url, f"replica{index}")
+    for index, url in enumerate(settings.database_replica_urls)
+]
@@ -3,33 +3,51 @@ from sqlalchemy import event
 from backend.app.modules.articles.models.article import Article
 from backend.app.modules.users.models.user import User
 from backend.app.shared.db.connection import engine
+from backend.app.shared.db.routing import RoutingSession, mark_committed
 
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
-    class_=Session,
+    class_=RoutingSession,
 )
+event.listen(SessionLocal, "after_commit", mark_committed)
+
+# Built once rather than per execution. The lambdas have no closure variables
+# to track, so each option's cache key is fixed and compiled SQL is reused.
+_SOFT_DELETE_CRITERIA = (
+    with_loader_criteria(
+        Article,
+        lambda cls: cls.is_deleted == False,
+        include_aliases=True,
+        track_closure_variables=False,
+    ),
+    with_loader_criteria(
+        User,
+        lambda cls: cls.is_deleted == False,
+        include_aliases=True,
+        track_closure_variables=False,
+    ),
+)
+
 
 @event.listens_for(SessionLocal, "do_orm_execute")
 def _add_soft_delete_filter(execute_state):
-    session = execute_state.session
-    is_admin = session.info.get("is_admin", False)
-    
-    if not is_admin:
-        # Apply to ALL operations (SELECT/UPDATE/DELETE)
-        execute_state.statement = execute_state.statement.options(
-            with_loader_criteria(
-                Article,
-                lambda cls: cls.is_deleted == False,
-                include_aliases=True
-            ),
-            with_loader_criteria(
-                User,
-                lambda cls: cls.is_deleted == False,
-                include_aliases=True
-            )
-        )
+    if execute_state.session.info.get("is_admin", False):
+        return
+    # Lazy/deferred loads inherit the criteria from the query that loaded the
+    # parent; plain Core statements have no entities to filter
+    if (
+        not execute_state.is_orm_statement
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+    ):
+        return
+
+    # Apply to ALL operations (SELECT/UPDATE/DELETE)
+    execute_state.statement = execute_state.statement.options(
+        *_SOFT_DELETE_CRITERIA
+    )
 
 def get_db():
     db = SessionLocal()
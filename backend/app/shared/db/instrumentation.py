@@ -0,0 +1,99 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from backend.app.common.metrics.registry import (
+    DB_CONNECTION_AGE,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_IN_USE,
+    DB_POOL_OVERFLOW,
+    DB_QUERY_DURATION,
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool recording how long callers wait for a connection.
+
+    Pool events fire only once a connection has been handed out, so the wait
+    itself is timed around the pool's own checkout. `instrument_engine` names
+    the pool; the name survives `engine.dispose()`, which recreates it.
+    """
+
+    checkout_wait = DB_POOL_CHECKOUT_WAIT.labels(pool="unnamed")
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.checkout_wait.observe(time.perf_counter() - start)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.checkout_wait = self.checkout_wait
+        return pool
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    verb = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+    DB_QUERY_DURATION.labels(statement=verb).observe(elapsed)
+
+
+def _handle_error(context):
+    # Failed statements never reach after_cursor_execute
+    if context.connection is not None:
+        starts = context.connection.info.get("query_start_time")
+        if starts:
+            starts.pop()
+
+
+def _instrument_pool(engine: Engine, name: str) -> None:
+    pool = engine.pool
+    in_use = DB_POOL_IN_USE.labels(pool=name)
+    overflow = DB_POOL_OVERFLOW.labels(pool=name)
+    age = DB_CONNECTION_AGE.labels(pool=name)
+    if isinstance(pool, InstrumentedQueuePool):
+        pool.checkout_wait = DB_POOL_CHECKOUT_WAIT.labels(pool=name)
+    # QueuePool's own overflow count lags: checkin fires before it is updated
+    pool_size = pool.size() if isinstance(pool, QueuePool) else None
+    checked_out = 0
+    lock = threading.Lock()
+
+    def update(delta: int):
+        nonlocal checked_out
+        with lock:
+            checked_out += delta
+            in_use.set(checked_out)
+            if pool_size is not None:
+                overflow.set(max(checked_out - pool_size, 0))
+
+    def on_connect(dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.monotonic()
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        update(1)
+        age.observe(time.monotonic() - connection_record.info["connected_at"])
+
+    def on_checkin(dbapi_connection, connection_record):
+        update(-1)
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+
+
+def instrument_engine(engine: Engine, name: str = "primary") -> Engine:
+    """Attach query timing and pool usage listeners to `engine`."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    _instrument_pool(engine, name)
+    return engine
@@ -0,0 +1,174 @@
+"""Read-replica routing for ORM sessions.
+
+Only SELECTs issued inside service methods marked `@reads_from_replica` may
+go to a replica, and only while:
+
+  - the session has not written anything (its own writes are on the primary)
+    and is not inside `reads_from_primary`,
+  - the current request is not sticky (a recent request from the same client
+    committed; see `ReadYourWritesMiddleware`), and
+  - a replica within `db_replica_max_lag` seconds is available.
+
+Everything else, including SELECT ... FOR UPDATE and raw SQL, uses the
+primary. Replica health is only checked by the API's lifespan loop, so other
+processes (Celery workers) always read from the primary.
+"""
+
+import asyncio
+import functools
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, TypeVar
+
+from sqlalchemy import Select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from backend.app.common.config.settings import settings
+from backend.app.common.logging.config import logger
+from backend.app.common.metrics.registry import DB_READS, DB_REPLICA_LAG
+from backend.app.shared.db.connection import reader_engines
+
+F = TypeVar("F", bound=Callable)
+
+# Seconds behind the primary; 0 when everything received has been replayed
+# (an idle primary leaves the last replay timestamp arbitrarily old)
+_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+@dataclass
+class ReadYourWrites:
+    """Per-request stickiness, shared by the sessions a request opens."""
+
+    sticky: bool = False
+    committed: bool = False
+
+
+read_your_writes: ContextVar[Optional[ReadYourWrites]] = ContextVar(
+    "read_your_writes", default=None
+)
+
+
+class ReplicaSet:
+    """Round-robin over the replicas that passed the last lag check."""
+
+    def __init__(self, engines: list[Engine], max_lag: float, interval: float):
+        self.engines = engines
+        self.max_lag = max_lag
+        self.interval = interval
+        # Nothing is trusted until checked
+        self._healthy: list[Engine] = []
+        self._counter = itertools.count()
+
+    def pick(self) -> Optional[Engine]:
+        healthy = self._healthy
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def check(self) -> list[Engine]:
+        """Measure every replica's lag and update the rotation."""
+        healthy = []
+        for index, engine in enumerate(self.engines):
+            try:
+                with engine.connect() as conn:
+                    lag = float(conn.execute(_LAG_SQL).scalar())
+            except SQLAlchemyError as e:
+                logger.warning("Read replica %d unreachable: %s", index, e)
+                DB_REPLICA_LAG.labels(replica=str(index)).set(-1)
+                continue
+
+            DB_REPLICA_LAG.labels(replica=str(index)).set(lag)
+            if lag <= self.max_lag:
+                healthy.append(engine)
+            else:
+                logger.warning(
+                    "Read replica %d is %.1fs behind; out of rotation", index, lag
+                )
+        self._healthy = healthy
+        return healthy
+
+    async def run_periodic(self):
+        """Background health check loop with crash protection."""
+        while True:
+            try:
+                await asyncio.to_thread(self.check)
+            except Exception as e:
+                logger.error("Read replica health check failed", exc_info=e)
+            await asyncio.sleep(self.interval)
+
+
+replicas = ReplicaSet(
+    reader_engines,
+    max_lag=settings.db_replica_max_lag,
+    interval=settings.db_replica_check_interval,
+)
+
+
+class RoutingSession(Session):
+    """Session sending replica-eligible SELECTs to a healthy read replica."""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not (isinstance(clause, Select) and clause._for_update_arg is None):
+            # Writes, flushes, locking reads and raw SQL; later reads in this
+            # session must see them, so stay on the primary from here on
+            self.info["wrote"] = True
+        elif self.info.get("use_replica"):
+            engine = self._replica()
+            DB_READS.labels(target="primary" if engine is None else "replica").inc()
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _replica(self) -> Optional[Engine]:
+        if self.info.get("wrote") or self.info.get("primary") or self._flushing:
+            return None
+        state = read_your_writes.get()
+        if state is not None and state.sticky:
+            return None
+        return replicas.pick()
+
+
+def reads_from_replica(func: F) -> F:
+    """Let the SELECTs of `func(db, ...)` be served by a read replica."""
+
+    @functools.wraps(func)
+    def wrapper(db: Session, *args, **kwargs):
+        previous = db.info.get("use_replica", False)
+        db.info["use_replica"] = True
+        try:
+            return func(db, *args, **kwargs)
+        finally:
+            db.info["use_replica"] = previous
+
+    return wrapper
+
+
+@contextmanager
+def reads_from_primary(db: Session) -> Iterator[Session]:
+    """Keep every read of `db` on the primary, `@reads_from_replica` ones too.
+
+    For results that outlive the request (shared caches): a lagging replica
+    would otherwise have them served long after it caught up.
+    """
+    previous = db.info.get("primary", False)
+    db.info["primary"] = True
+    try:
+        yield db
+    finally:
+        db.info["primary"] = previous
+
+
+def mark_committed(session: Session) -> None:
+    """`after_commit` hook: make the client sticky if this session wrote."""
+    if session.info.get("wrote"):
+        state = read_your_writes.get()
+        if state is not None:
+            state.committed = True
@@ -1,15 +1,23 @@
 # from gevent import monkey
 # monkey.patch_all(ssl=False, aggressive=True, select=True)
 
+import time
+
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import task_postrun, task_prerun
 
 from backend.app.common.config.settings import settings
+from backend.app.common.metrics.registry import CELERY_TASK_DURATION, CELERY_TASKS
 
 celery = Celery(__name__)
 celery.conf.update(
     broker_url=settings.celery_broker_url,
     result_backend=settings.celery_result_backend,
-    imports=["backend.app.modules.articles.tasks.scraping"],  # Better task organization
+    imports=[
+        "backend.app.modules.articles.tasks.scraping",
+        "backend.app.modules.articles.tasks.partitions",
+    ],  # Better task organization
     task_serializer="json",
     event_serializer="json",
     accept_content=["json"],
@@ -32,6 +40,13 @@ celery.conf.update(
             "routing_key": "high_priority",
         },
     },
+    beat_schedule={
+        # Idempotent; daily so a missed run never leaves a month unpartitioned
+        "maintain-article-partitions": {
+            "task": "backend.app.modules.articles.tasks.partitions.maintain_article_partitions",
+            "schedule": crontab(hour=3, minute=0),
+        },
+    },
     task_annotations={
         "backend.app.modules.articles.tasks.scraping.scrape_articles_task": {
             "rate_limit": "10/m",
@@ -42,3 +57,21 @@ celery.conf.update(
         }
     },
 )
+
+
+_task_start_times: dict[str, float] = {}
+
+
+@task_prerun.connect
+def _record_task_start(task_id=None, **kwargs):
+    _task_start_times[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _record_task_duration(task_id=None, task=None, state=None, **kwargs):
+    start = _task_start_times.pop(task_id, None)
+    if start is None or task is None:
+        return
+    labels = {"task": task.name, "state": state or "UNKNOWN"}
+    CELERY_TASK_DURATION.labels(**labels).observe(time.perf_counter() - start)
+    CELERY_TASKS.labels(**labels).inc()
@@ -1,17 +1,132 @@
+import asyncio
+import math
+import random
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Union
 
 import jwt
-import orjson
-from redis.asyncio import Redis
+from redis._parsers import _AsyncHiredisParser, _AsyncRESP2Parser
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.client import NEVER_DECODE
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from redis.utils import HIREDIS_AVAILABLE
 
 from backend.app.common.config.settings import settings
+from backend.app.common.logging.config import logger
+from backend.app.common.metrics.registry import (
+    CACHE_LOOKUPS,
+    CACHE_REFRESHES,
+    REDIS_COMMAND_DURATION,
+)
+from backend.app.shared.infrastructure.redis.client_cache import client_cache
+from backend.app.shared.infrastructure.redis.codec import (
+    CacheEntry,
+    cache_serializer,
+)
+
+_NOT_READ = object()
+
+# hiredis parses replies in C; the pure-Python parser is the fallback
+_PARSER = _AsyncHiredisParser if HIREDIS_AVAILABLE else _AsyncRESP2Parser
+
+# Recomputes a cached value (a dict, or a CacheEntry holding a serialized JSON
+# body); returns None when it no longer exists
+CacheLoader = Callable[[], Awaitable[Optional[Union[dict, CacheEntry]]]]
+
+
+def xfetch_due(
+    expires_at: float, delta: float, beta: float = 1.0, now: Optional[float] = None
+) -> bool:
+    """Probabilistic early expiration (XFetch).
+
+    Returns True increasingly often as `expires_at` approaches, scaled by how
+    long the value took to compute (`delta`), so that a single reader of a hot
+    key recomputes it shortly before it goes stale instead of every reader
+    missing at once afterwards. `beta` > 1 favours earlier refreshes.
+    """
+    now = time.time() if now is None else now
+    # 1 - random() lies in (0, 1], keeping log() finite
+    return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+def _recompute_cost(entry: CacheEntry) -> float:
+    """XFetch `delta` of an entry: its measured load time, floored."""
+    return max(entry.delta, settings.cache_xfetch_min_delta)
+
+
+@dataclass
+class RoundTrips:
+    """Redis round trips made while serving one request."""
+
+    count: int = 0
+
+
+# Set per request by MetricsMiddleware
+redis_round_trips: ContextVar[Optional[RoundTrips]] = ContextVar(
+    "redis_round_trips", default=None
+)
+
+
+def _record_round_trip(command: str, start: float):
+    REDIS_COMMAND_DURATION.labels(command=command).observe(time.perf_counter() - start)
+    round_trips = redis_round_trips.get()
+    if round_trips is not None:
+        round_trips.count += 1
+
+
+class InstrumentedPipeline(Pipeline):
+    """Pipeline timing each batch as a single PIPELINE round trip.
+
+    The replies of the last `execute()` are kept in `results` (empty before
+    it runs or when it fails).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.results: list = []
+
+    async def execute(self, raise_on_error: bool = True):
+        start = time.perf_counter()
+        self.results = []
+        try:
+            self.results = await super().execute(raise_on_error)
+            return self.results
+        finally:
+            _record_round_trip("PIPELINE", start)
+
+
+class InstrumentedRedis(Redis):
+    """Redis client recording per-command round-trip latency."""
+
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            _record_round_trip(str(args[0]).upper(), start)
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: Optional[str] = None
+    ) -> InstrumentedPipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
 
 
 class RedisManager:
     """Manages separate Redis connections for different environments (production & testing)."""
 
     _connections: dict[str, Optional[Redis]] = {}
+    # Strong references to in-flight background refreshes
+    _refresh_tasks: set[asyncio.Task] = set()
 
     @classmethod
     async def get_redis(cls, is_test: bool = False) -> Redis:
@@ -19,15 +134,9 @@ class RedisManager:
         environment = "test" if is_test else "prod"
 
         if not cls._connections.get(environment):
-            redis_url = (
-                f"{settings.redis_url}/1" if is_test else f"{settings.redis_url}/0"
-            )
             try:
-                cls._connections[environment] = Redis.from_url(
-                    redis_url,
-                    decode_responses=True,
-                    socket_connect_timeout=2,
-                    retry_on_timeout=True,
+                cls._connections[environment] = InstrumentedRedis.from_pool(
+                    cls.connection_pool(cls.redis_url(is_test))
                 )
             except Exception as e:
                 raise ConnectionError(
@@ -36,6 +145,49 @@ class RedisManager:
 
         return cls._connections[environment]
 
+    @staticmethod
+    def connection_pool(url: str) -> BlockingConnectionPool:
+        """This process's connection pool.
+
+        When all `redis_max_connections` are busy, commands wait up to
+        `redis_pool_timeout` for one instead of opening more. Connections
+        idle for `redis_health_check_interval` are PINGed before reuse, and
+        commands failing on a dropped connection are retried on a new one.
+        """
+        return BlockingConnectionPool.from_url(
+            url,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            parser_class=_PARSER,
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_keepalive=True,
+            retry=Retry(ExponentialBackoff(cap=0.5, base=0.05), retries=2),
+            retry_on_error=[RedisConnectionError, RedisTimeoutError],
+        )
+
+    @classmethod
+    @asynccontextmanager
+    async def batch(cls) -> AsyncIterator[InstrumentedPipeline]:
+        """Queue related commands and send them in one round trip on exit.
+
+            async with RedisManager.batch() as batch:
+                batch.get("a")
+                batch.incr("b")
+            a, b = batch.results
+
+        Not a transaction (no MULTI/EXEC); nothing is sent if the block raises.
+        """
+        redis = await cls.get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            yield pipe
+            await pipe.execute()
+
+    @staticmethod
+    def redis_url(is_test: bool = False) -> str:
+        return f"{settings.redis_url}/1" if is_test else f"{settings.redis_url}/0"
+
     @classmethod
     async def close_redis(cls):
         """Gracefully close all Redis connections on shutdown."""
@@ -45,26 +197,234 @@ class RedisManager:
                 cls._connections[key] = None  # Ensures safe reinitialization later
 
     @classmethod
-    async def cache_response(cls, key: str, data: dict, expire: int = 300):
+    async def cache_response(
+        cls, key: str, data: dict, expire: int = 300, delta: float = 0.0
+    ):
+        """Cache `data` as fresh for `expire` seconds.
+
+        `delta` is the time it took to compute `data`; it sizes the early
+        refresh window used by `get_cached_response`.
+        """
+        redis = await cls.get_redis()
+        await redis.set(
+            f"cache:{key}",
+            cache_serializer.dumps(data, time.time() + expire, delta),
+            ex=expire,
+        )
+
+    @classmethod
+    async def cache_entry(
+        cls, key: str, entry: CacheEntry, expire: int = 300, delta: float = 0.0
+    ):
+        """Cache a pre-serialized JSON entry, served as-is by `get_cached_entry`.
+
+        The entry's validators (etag, last_modified) and precompressed
+        variants are stored with the body.
+        """
         redis = await cls.get_redis()
-        await redis.setex(
+        await redis.set(
             f"cache:{key}",
-            expire,
-            orjson.dumps(data, option=orjson.OPT_SERIALIZE_DATACLASS),
+            cache_serializer.dumps_entry(entry, time.time() + expire, delta),
+            ex=expire,
         )
 
     @classmethod
-    async def get_cached_response(cls, key: str):
+    async def cache_entries(
+        cls, entries: dict[str, CacheEntry], expire: int = 300, delta: float = 0.0
+    ):
+        """`cache_entry` for several keys, written in one pipelined round trip."""
+        if not entries:
+            return
+        redis = await cls.get_redis()
+        expires_at = time.time() + expire
+        async with redis.pipeline(transaction=False) as pipe:
+            for key, entry in entries.items():
+                pipe.set(
+                    f"cache:{key}",
+                    cache_serializer.dumps_entry(entry, expires_at, delta),
+                    ex=expire,
+                )
+            await pipe.execute()
+
+    @classmethod
+    async def get_cached_response(
+        cls,
+        key: str,
+        expire: int = 600,
+        refresh: Optional[CacheLoader] = None,
+        beta: float = 1.0,
+    ) -> Optional[dict]:
+        """Decoded value of `get_cached_entry`."""
+        entry = await cls.get_cached_entry(key, expire, refresh, beta)
+        return entry.value if entry else None
+
+    @classmethod
+    async def get_cached_entry(
+        cls,
+        key: str,
+        expire: int = 600,
+        refresh: Optional[CacheLoader] = None,
+        beta: float = 1.0,
+    ) -> Optional[CacheEntry]:
+        """Read a cached entry in a single round trip.
+
+        Entries expire `expire` seconds after they were written. Hot entries
+        are kept warm by XFetch instead: shortly before expiry a read is
+        likely to find the entry due, and `refresh` then recomputes it in the
+        background while the entry is still returned. Without a loader the
+        read is reported as a miss so the caller recomputes inline.
+
+        The entry body is not decoded here: `entry.json()` is ready to send.
+        """
+        entry, _ = await cls._read_entry(key)
+        return cls._check_entry(key, entry, expire, refresh, beta)
+
+    @classmethod
+    async def get_cached_entry_and_counter(
+        cls,
+        key: str,
+        counter: str,
+        expire: int = 600,
+        refresh: Optional[CacheLoader] = None,
+        beta: float = 1.0,
+    ) -> tuple[Optional[CacheEntry], int]:
+        """`get_cached_entry` and the `counter` key's value, in one round trip."""
+        entry, value = await cls._read_entry(key, counter)
+        if value is _NOT_READ:
+            # The entry came from process memory; only the counter is needed
+            redis = await cls.get_redis()
+            value = await redis.get(counter)
+        return cls._check_entry(key, entry, expire, refresh, beta), int(value or 0)
+
+    @classmethod
+    async def _read_entry(
+        cls, key: str, counter: Optional[str] = None
+    ) -> tuple[Optional[CacheEntry], Any]:
+        """Fetch one entry, and `counter` in the same round trip when Redis is
+        asked; the counter is `_NOT_READ` if the entry came from memory."""
         redis = await cls.get_redis()
-        data = await redis.get(f"cache:{key}")
-        if data:
-            # Auto-refresh cache if < 5min left
-            ttl = await redis.ttl(f"cache:{key}")
-            if ttl < 300:
-                await redis.expire(f"cache:{key}", 600)  # Reset TTL
-            return orjson.loads(data)
+        cache_key = f"cache:{key}"
+        value = _NOT_READ
+
+        async def fetch() -> Optional[CacheEntry]:
+            nonlocal value
+            if counter is None:
+                raw = await redis.execute_command(
+                    "GET", cache_key, **{NEVER_DECODE: []}
+                )
+            else:
+                async with cls.batch() as batch:
+                    batch.execute_command("GET", cache_key, **{NEVER_DECODE: []})
+                    batch.get(counter)
+                raw, value = batch.results
+            # Entries in an unknown format are treated as misses
+            return cache_serializer.loads(raw)
 
-        return None
+        if not client_cache.tracks(cache_key):
+            return await fetch(), value
+        entry = await client_cache.read(
+            cache_key,
+            fetch,
+            size=lambda entry: entry.memory_size() if entry else 64,
+        )
+        return entry, value
+
+    @classmethod
+    def _check_entry(
+        cls,
+        key: str,
+        entry: Optional[CacheEntry],
+        expire: int,
+        refresh: Optional[CacheLoader],
+        beta: float,
+    ) -> Optional[CacheEntry]:
+        """Apply expiry and XFetch to a fetched entry, recording the lookup."""
+        namespace = key.split(":", 1)[0]
+        now = time.time()
+        if entry is None or now >= entry.expires_at:
+            CACHE_LOOKUPS.labels(cache=namespace, result="miss").inc()
+            return None
+
+        if not xfetch_due(entry.expires_at, _recompute_cost(entry), beta, now):
+            CACHE_LOOKUPS.labels(cache=namespace, result="hit").inc()
+            return entry
+
+        CACHE_LOOKUPS.labels(cache=namespace, result="early_refresh").inc()
+        if refresh is None:
+            return None
+
+        task = asyncio.create_task(cls._refresh_cache(key, expire, refresh))
+        cls._refresh_tasks.add(task)
+        task.add_done_callback(cls._refresh_tasks.discard)
+        return entry
+
+    @classmethod
+    async def get_cached_entries(
+        cls, keys: list[str], beta: float = 1.0
+    ) -> list[Optional[CacheEntry]]:
+        """Bulk `get_cached_entry`: one MGET, results in the order of `keys`.
+
+        Entries due for an early refresh are reported as misses: the caller
+        reloads them together with the other misses.
+        """
+        if not keys:
+            return []
+        redis = await cls.get_redis()
+
+        async def fetch_many(cache_keys: list[str]) -> list[Optional[CacheEntry]]:
+            raws = await redis.execute_command(
+                "MGET", *cache_keys, **{NEVER_DECODE: []}
+            )
+            return [cache_serializer.loads(raw) for raw in raws]
+
+        entries = await client_cache.read_many(
+            [f"cache:{key}" for key in keys],
+            fetch_many,
+            size=lambda entry: entry.memory_size() if entry else 64,
+        )
+
+        now = time.time()
+        results = []
+        for key, entry in zip(keys, entries):
+            namespace = key.split(":", 1)[0]
+            if entry is None or now >= entry.expires_at:
+                result = "miss"
+            elif xfetch_due(entry.expires_at, _recompute_cost(entry), beta, now):
+                result = "early_refresh"
+            else:
+                result = "hit"
+            CACHE_LOOKUPS.labels(cache=namespace, result=result).inc()
+            results.append(entry if result == "hit" else None)
+        return results
+
+    @classmethod
+    async def _refresh_cache(cls, key: str, expire: int, refresh: CacheLoader):
+        """Recompute one entry; a short lock keeps replicas from duplicating work."""
+        redis = await cls.get_redis()
+        namespace = key.split(":", 1)[0]
+        lock_key = f"lock:cache:{key}"
+        if not await redis.set(lock_key, "1", nx=True, ex=30):
+            return
+
+        start = time.perf_counter()
+        try:
+            data = await refresh()
+            if data is None:
+                await redis.unlink(f"cache:{key}")
+                outcome = "removed"
+            else:
+                delta = time.perf_counter() - start
+                if isinstance(data, CacheEntry):
+                    await cls.cache_entry(key, data, expire, delta)
+                else:
+                    await cls.cache_response(key, data, expire, delta)
+                outcome = "success"
+        except Exception as e:
+            logger.warning(f"Background refresh of cache:{key} failed", exc_info=e)
+            outcome = "failure"
+        finally:
+            await redis.delete(lock_key)
+        CACHE_REFRESHES.labels(cache=namespace, outcome=outcome).inc()
 
     @classmethod
     async def delete_cache(cls, pattern: str):
@@ -97,9 +457,9 @@ class RedisManager:
 
     @classmethod
     async def get_counter(cls, key: str) -> int:
-        """Get a counter value from Redis."""
+        """Get a counter value from Redis (or process memory, if tracked)."""
         redis = await cls.get_redis()
-        value = await redis.get(key)
+        value = await client_cache.read(key, lambda: redis.get(key))
         return int(value) if value else 0
 
     @classmethod
@@ -114,7 +474,9 @@ class RedisManager:
     async def is_token_blacklisted(cls, jti: str, is_test: bool = False) -> bool:
         """Checks if a JWT is blacklisted in Redis."""
         conn = await cls.get_redis(is_test)
-        return await conn.exists(f"blacklist:{jti}") > 0
+        key = f"blacklist:{jti}"
+        # Absent keys are cached locally too; revoking invalidates them
+        return await client_cache.read(key, lambda: conn.exists(key)) > 0
 
     @staticmethod
     def get_token_expiration(token: str) -> int:
@@ -0,0 +1,282 @@
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Optional
+
+import redis
+from redis.asyncio import ConnectionPool
+
+try:
+    # Private redis-py API: the pure-Python RESP3 parser dispatches pushes
+    from redis._parsers import _AsyncRESP3Parser
+except ImportError:
+    _AsyncRESP3Parser = None
+
+from backend.app.common.config.settings import settings
+from backend.app.common.logging.config import logger
+from backend.app.common.metrics.registry import (
+    REDIS_CLIENT_CACHE_BYTES,
+    REDIS_CLIENT_CACHE_INVALIDATIONS,
+    REDIS_CLIENT_CACHE_LOOKUPS,
+)
+
+_MISSING = object()
+
+# redis-py releases whose private push API (above) this module was checked
+# against; others are refused at startup rather than silently serving
+# values whose invalidations may never arrive
+TESTED_REDIS_PY = ("5.3.",)
+
+
+def check_support():
+    """Raise unless this redis-py delivers invalidation pushes as expected."""
+    if not redis.__version__.startswith(TESTED_REDIS_PY):
+        raise RuntimeError(
+            f"Redis client-side caching is untested with redis-py "
+            f"{redis.__version__}; set REDIS_CLIENT_CACHE_PREFIXES=[] to disable it"
+        )
+    if _AsyncRESP3Parser is None or not hasattr(
+        _AsyncRESP3Parser, "set_invalidation_push_handler"
+    ):
+        raise RuntimeError(
+            "This redis-py has no RESP3 invalidation push handler; "
+            "set REDIS_CLIENT_CACHE_PREFIXES=[] to disable client-side caching"
+        )
+
+
+class LocalCache:
+    """LRU of decoded Redis values, bounded by an estimate of their size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: str, value: Any, size: int):
+        self.discard(key)
+        # Key, tuple and dict slot overhead on top of the payload
+        size += sys.getsizeof(key) + 64
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+    def discard(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+
+class ClientSideCache:
+    """Serves hot Redis keys from process memory (Redis 6+ client tracking).
+
+    A dedicated RESP3 connection enables `CLIENT TRACKING ON BCAST` for the
+    configured key prefixes, so the server pushes an invalidation message
+    whenever any client modifies, expires or evicts a matching key, whichever
+    connection it was read from. Values are only served locally while that
+    connection is up; on disconnect the cache is dropped and reads fall
+    through to Redis until tracking is re-established.
+
+    Off unless prefixes are configured. Because every write to a tracked
+    prefix invalidates all processes, only read-mostly prefixes (article
+    cache entries) belong here; constantly incremented counters do not.
+    Nor do security checks such as the token blacklist: a locally cached
+    "not revoked" is only as fresh as the invalidation stream.
+    """
+
+    def __init__(self, prefixes: list[str], max_bytes: int, ping_interval: int = 5):
+        self.prefixes = tuple(prefixes)
+        self.local = LocalCache(max_bytes)
+        self.ping_interval = ping_interval
+        self.ready = False
+        self._listener: Optional[asyncio.Task] = None
+        # Bumped on every invalidation; fills racing one are not stored
+        self._epoch = 0
+        self._last_reply = 0.0
+
+    def tracks(self, key: str) -> bool:
+        return self.ready and key.startswith(self.prefixes)
+
+    async def start(self, redis_url: str):
+        if self.prefixes and self._listener is None:
+            check_support()
+            self._listener = asyncio.create_task(self._listen(redis_url))
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._reset()
+
+    async def read(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        size: Callable[[Any], int] = lambda value: 64,
+    ) -> Any:
+        """Return `key` from process memory, loading it with `fetch` on a miss.
+
+        Missing keys (None) are cached too: creating the key invalidates them.
+        """
+        if not self.tracks(key):
+            return await fetch()
+
+        value = self.local.get(key)
+        if value is not _MISSING:
+            REDIS_CLIENT_CACHE_LOOKUPS.labels(result="hit").inc()
+            return value
+
+        REDIS_CLIENT_CACHE_LOOKUPS.labels(result="miss").inc()
+        epoch = self._epoch
+        value = await fetch()
+        if epoch == self._epoch and self.ready:
+            self.local.put(key, value, size(value))
+            REDIS_CLIENT_CACHE_BYTES.set(self.local.size)
+        return value
+
+    async def read_many(
+        self,
+        keys: list[str],
+        fetch_many: Callable[[list[str]], Awaitable[list[Any]]],
+        size: Callable[[Any], int] = lambda value: 64,
+    ) -> list[Any]:
+        """`read` for several keys; those not held locally are fetched together."""
+        values = [_MISSING] * len(keys)
+        for index, key in enumerate(keys):
+            if self.tracks(key):
+                values[index] = self.local.get(key)
+        missing = [index for index, value in enumerate(values) if value is _MISSING]
+
+        hits = len(keys) - len(missing)
+        if hits:
+            REDIS_CLIENT_CACHE_LOOKUPS.labels(result="hit").inc(hits)
+        if not missing:
+            return values
+
+        epoch = self._epoch
+        fetched = await fetch_many([keys[index] for index in missing])
+        store = epoch == self._epoch and self.ready
+        for index, value in zip(missing, fetched):
+            values[index] = value
+            if self.tracks(keys[index]):
+                REDIS_CLIENT_CACHE_LOOKUPS.labels(result="miss").inc()
+                if store:
+                    self.local.put(keys[index], value, size(value))
+        if store:
+            REDIS_CLIENT_CACHE_BYTES.set(self.local.size)
+        return values
+
+    def _reset(self):
+        self.ready = False
+        self._epoch += 1
+        self.local.clear()
+        REDIS_CLIENT_CACHE_BYTES.set(0)
+
+    async def _invalidate(self, message: list):
+        # ["invalidate", [key, ...]], or ["invalidate", None] after FLUSHALL/FLUSHDB
+        self._epoch += 1
+        keys = message[1]
+        if keys is None:
+            self.local.clear()
+            REDIS_CLIENT_CACHE_INVALIDATIONS.inc()
+        else:
+            for key in keys:
+                self.local.discard(key)
+            REDIS_CLIENT_CACHE_INVALIDATIONS.inc(len(keys))
+        REDIS_CLIENT_CACHE_BYTES.set(self.local.size)
+
+    async def _read(self, conn):
+        # The parser passes invalidations to `_invalidate` as it meets them,
+        # whether or not redis-py returns them here (it does not with hiredis
+        # installed); what is returned is mostly PING replies
+        while True:
+            await conn.read_response(push_request=True)
+            self._last_reply = time.monotonic()
+
+    async def _keepalive(self, conn):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            if time.monotonic() - self._last_reply > 3 * self.ping_interval:
+                raise ConnectionError("Redis tracking connection stopped replying")
+            await conn.send_command("PING", check_health=False)
+
+    async def _listen(self, redis_url: str):
+        while True:
+            pool = None
+            try:
+                # Pure-Python RESP3 parser: it is the one that dispatches pushes
+                pool = ConnectionPool.from_url(
+                    redis_url,
+                    protocol=3,
+                    parser_class=_AsyncRESP3Parser,
+                    decode_responses=True,
+                    socket_connect_timeout=2,
+                )
+                conn = await pool.get_connection("CLIENT")
+                conn._parser.set_invalidation_push_handler(self._invalidate)
+
+                tracking = ["CLIENT", "TRACKING", "ON", "BCAST"]
+                for prefix in self.prefixes:
+                    tracking += ["PREFIX", prefix]
+                await conn.send_command(*tracking)
+                await conn.read_response()
+                self.ready = True
+                logger.info(
+                    "Redis client-side caching enabled",
+                    extra={"prefixes": list(self.prefixes)},
+                )
+
+                # Reads never time out: cancelling one mid-message would
+                # desynchronize the connection. Liveness is checked by PINGs.
+                self._last_reply = time.monotonic()
+                tasks = {
+                    asyncio.create_task(self._read(conn)),
+                    asyncio.create_task(self._keepalive(conn)),
+                }
+                try:
+                    done, _ = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                finally:
+                    for task in tasks:
+                        task.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Redis tracking connection failed, retrying", exc_info=e)
+                await asyncio.sleep(5)
+            finally:
+                # Invalidations may have been lost: nothing local can be trusted
+                self._reset()
+                if pool is not None:
+                    with suppress(Exception):
+                        await pool.disconnect()
+
+
+client_cache = ClientSideCache(
+    prefixes=settings.redis_client_cache_prefixes,
+    max_bytes=settings.redis_client_cache_max_bytes,
+)
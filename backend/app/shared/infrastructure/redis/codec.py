@@ -0,0 +1,246 @@
+"""Binary format for cached responses.
+
+An entry is a fixed header, the (optionally compressed) body and any
+precompressed HTTP variants:
+
+    format | codec id | compression id   (1 byte each)
+    expires_at | delta | last_modified   (f64 each)
+    etag                                 (16 bytes, zeros when unset)
+    body length (u32) | variant count (u8)
+    body
+    variant: encoding id (u8) | length (u32) | bytes     (repeated)
+
+The etag and last_modified validators are stored with the entry so that
+conditional requests can be answered from the cache alone. Variants hold the
+body (or a fixed prefix of it) already in a Content-Encoding, so hits are
+sent without recompressing.
+
+The body is the value encoded with the configured codec. With the default
+JSON codec it is exactly the response body, so a cache hit can be written to
+the client without being parsed and serialized again.
+"""
+
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import orjson
+
+from backend.app.common.config.settings import settings
+
+try:
+    import zstandard
+except ImportError:  # zlib is always available
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_HEADER = struct.Struct("!BBBddd16sIB")
+_VARIANT = struct.Struct("!BI")
+# Layouts: codec id first (1, 2), then validators (3), then variants (4);
+# 5: zstd variants are an open frame, not a complete one
+_FORMAT = 5
+
+VARIANT_ENCODINGS = {"gzip": 1, "zstd": 2}
+_VARIANTS_BY_ID = {id: name for name, id in VARIANT_ENCODINGS.items()}
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZSTD = 1
+COMPRESSION_ZLIB = 2
+
+
+class JsonCodec:
+    id = 1
+    name = "json"
+
+    @staticmethod
+    def encode(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_DATACLASS)
+
+    @staticmethod
+    def decode(body: bytes) -> Any:
+        return orjson.loads(body)
+
+
+class MsgpackCodec:
+    """Smaller than JSON for numeric-heavy values; hits are re-encoded to JSON."""
+
+    id = 2
+    name = "msgpack"
+
+    @staticmethod
+    def encode(value: Any) -> bytes:
+        # Values are JSON-ready already; stringify the odd UUID or datetime
+        return msgpack.packb(value, default=str)
+
+    @staticmethod
+    def decode(body: bytes) -> Any:
+        return msgpack.unpackb(body)
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec, MsgpackCodec)}
+_CODECS_BY_ID = {codec.id: codec for codec in CODECS.values()}
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    expires_at: float = 0.0
+    delta: float = 0.0
+    codec: type = JsonCodec
+    etag: bytes = b""
+    last_modified: float = 0.0
+    variants: dict[str, bytes] = field(default_factory=dict)
+    _value: Any = field(default=None, repr=False)
+    _decoded: bool = field(default=False, repr=False)
+
+    @property
+    def value(self) -> Any:
+        """Decoded value, parsed once per entry."""
+        if not self._decoded:
+            self._value = self.codec.decode(self.body)
+            self._decoded = True
+        return self._value
+
+    def json(self) -> bytes:
+        """The value as a JSON response body."""
+        if self.codec is JsonCodec:
+            return self.body
+        return orjson.dumps(self.value)
+
+    def memory_size(self) -> int:
+        """Rough in-process footprint, counting a decoded copy of the body."""
+        variants = sum(len(variant) for variant in self.variants.values())
+        return len(self.body) * (3 if self._decoded else 1) + variants + 128
+
+
+class CacheSerializer:
+    """Encodes cache entries, compressing bodies above `compress_threshold` bytes."""
+
+    def __init__(
+        self, codec: type = JsonCodec, compress_threshold: int = 1024, level: int = 3
+    ):
+        if codec is MsgpackCodec and msgpack is None:
+            raise RuntimeError("The msgpack cache codec requires the msgpack package")
+        self.codec = codec
+        self.compress_threshold = compress_threshold
+        self.level = level
+        self.compression = (
+            COMPRESSION_ZSTD if zstandard is not None else COMPRESSION_ZLIB
+        )
+        if zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=level)
+            self._decompressor = zstandard.ZstdDecompressor()
+
+    def dumps(self, value: Any, expires_at: float, delta: float) -> bytes:
+        return self._pack(self.codec, self.codec.encode(value), expires_at, delta)
+
+    def dumps_entry(self, entry: CacheEntry, expires_at: float, delta: float) -> bytes:
+        """Store a pre-serialized JSON entry with its validators and variants."""
+        return self._pack(
+            JsonCodec,
+            entry.json(),
+            expires_at,
+            delta,
+            entry.etag,
+            entry.last_modified,
+            entry.variants,
+        )
+
+    def _pack(
+        self,
+        codec: type,
+        body: bytes,
+        expires_at: float,
+        delta: float,
+        etag: bytes = b"",
+        last_modified: float = 0.0,
+        variants: Optional[dict[str, bytes]] = None,
+    ) -> bytes:
+        compression = COMPRESSION_NONE
+        if len(body) >= self.compress_threshold:
+            compressed = self._compress(body)
+            # Incompressible bodies are cheaper to store as they are
+            if len(compressed) < len(body):
+                body, compression = compressed, self.compression
+
+        variants = variants or {}
+        parts = [
+            _HEADER.pack(
+                _FORMAT,
+                codec.id,
+                compression,
+                expires_at,
+                delta,
+                last_modified,
+                etag,
+                len(body),
+                len(variants),
+            ),
+            body,
+        ]
+        for encoding, data in variants.items():
+            parts.append(_VARIANT.pack(VARIANT_ENCODINGS[encoding], len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+    def loads(self, raw: Optional[bytes]) -> Optional[CacheEntry]:
+        """Decode a stored entry; None for missing or unrecognised data."""
+        if not raw or len(raw) < _HEADER.size:
+            return None
+        (
+            fmt,
+            codec_id,
+            compression,
+            expires_at,
+            delta,
+            last_modified,
+            etag,
+            body_length,
+            variant_count,
+        ) = _HEADER.unpack_from(raw)
+        codec = _CODECS_BY_ID.get(codec_id)
+        if fmt != _FORMAT or codec is None:
+            return None
+
+        offset = _HEADER.size + body_length
+        body = raw[_HEADER.size : offset]
+        variants = {}
+        for _ in range(variant_count):
+            encoding_id, length = _VARIANT.unpack_from(raw, offset)
+            offset += _VARIANT.size
+            variants[_VARIANTS_BY_ID[encoding_id]] = raw[offset : offset + length]
+            offset += length
+
+        if compression == COMPRESSION_ZSTD:
+            if zstandard is None:
+                return None
+            body = self._decompressor.decompress(body)
+        elif compression == COMPRESSION_ZLIB:
+            body = zlib.decompress(body)
+        elif compression != COMPRESSION_NONE:
+            return None
+        return CacheEntry(
+            body=body,
+            expires_at=expires_at,
+            delta=delta,
+            codec=codec,
+            etag=etag if any(etag) else b"",
+            last_modified=last_modified,
+            variants=variants,
+        )
+
+    def _compress(self, body: bytes) -> bytes:
+        if self.compression == COMPRESSION_ZSTD:
+            return self._compressor.compress(body)
+        return zlib.compress(body, self.level)
+
+
+cache_serializer = CacheSerializer(
+    codec=CODECS[settings.cache_codec],
+    compress_threshold=settings.cache_compress_threshold,
+)
@@ -0,0 +1,105 @@
+"""Payload size and latency of GET /articles with and without `fields=`.
+
+Two modes:
+
+  offline - serializes a synthetic page of articles the way the endpoint
+            does: full ArticleResponse validation vs. the projected column
+            dicts. Measures bytes and serialization time only (no DB).
+  http    - calls a running server for each projection and reports
+            response bytes (uncompressed) and p50/p95 latency, which
+            includes the narrower SELECT.
+
+Examples:
+    python backend/scripts/bench_article_fields.py offline --limit 100
+    python backend/scripts/bench_article_fields.py http --url http://localhost:8000 \\
+        --limit 100 --requests 200
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+
+import httpx
+import orjson
+from pydantic import TypeAdapter
+
+from backend.app.modules.articles.schemas.article import ArticleResponse
+from backend.app.modules.articles.services.article_service import ArticleService
+from backend.scripts.bench_cache_codec import make_article
+
+PROJECTIONS = [None, "summary", "id,title,published_at"]
+
+
+def bench_offline(limit: int, rounds: int):
+    rng = random.Random(7)
+    rows = []
+    for _ in range(limit):
+        article = make_article(rng)
+        article.update(
+            id=uuid4(),
+            published_at=datetime.fromisoformat(article["published_at"]),
+            created_at=datetime.fromisoformat(article["published_at"]),
+            is_deleted=False,
+        )
+        rows.append(article)
+    adapter = TypeAdapter(List[ArticleResponse])
+
+    for fields in PROJECTIONS:
+        projection = ArticleService.resolve_fields(fields)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            if projection:
+                page = [{name: row[name] for name in projection} for row in rows]
+                body = orjson.dumps(page, option=orjson.OPT_UTC_Z)
+            else:
+                body = adapter.dump_json(adapter.validate_python(rows))
+        elapsed = (time.perf_counter() - start) / rounds
+        print(
+            f"{fields or 'full':<24} {len(body):9d} bytes  "
+            f"{elapsed * 1e3:7.3f} ms to serialize {limit} articles"
+        )
+
+
+def bench_http(url: str, limit: int, requests: int):
+    with httpx.Client(base_url=url, timeout=30) as client:
+        for fields in PROJECTIONS:
+            params = {"limit": limit, **({"fields": fields} if fields else {})}
+            latencies, size = [], 0
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = client.get(
+                    "/api/v1/articles/",
+                    params=params,
+                    headers={"Accept-Encoding": "identity"},
+                )
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+                size = len(response.content)
+            latencies.sort()
+            print(
+                f"{fields or 'full':<24} {size:9d} bytes  "
+                f"p50={statistics.median(latencies) * 1e3:7.2f}ms  "
+                f"p95={latencies[int(len(latencies) * 0.95) - 1] * 1e3:7.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="mode", required=True)
+    offline = sub.add_parser("offline")
+    offline.add_argument("--limit", type=int, default=100)
+    offline.add_argument("--rounds", type=int, default=200)
+    http = sub.add_parser("http")
+    http.add_argument("--url", default="http://localhost:8000")
+    http.add_argument("--limit", type=int, default=100)
+    http.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.mode == "offline":
+        bench_offline(args.limit, args.rounds)
+    else:
+        bench_http(args.url, args.limit, args.requests)
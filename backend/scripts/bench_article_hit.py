@@ -0,0 +1,101 @@
+"""Per-request cost of serving a cached article (GET /articles/{id} hit path).
+
+Starts from the bytes read from Redis and ends with a ready Response, for:
+
+  decode    - the previous path: decode the entry, merge live views, then
+              FastAPI's response_model validation/serialization and
+              JSONResponse rendering
+  splice    - the current path: add live views to the stored body's tail
+              and wrap it in a raw Response
+
+Redis and network time are identical for both and excluded.
+
+Example:
+    python backend/scripts/bench_article_hit.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from backend.app.modules.articles.schemas.article import ArticleResponse
+from backend.app.modules.articles.utils.article_cache import (
+    add_views,
+    serialize_article,
+)
+from backend.app.shared.infrastructure.redis.codec import CacheEntry, CacheSerializer
+
+
+def _article(content_bytes: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        title="Markets react cautiously to new measures",
+        content=("Officials said the measures would take effect next month. " * 64)[
+            :content_bytes
+        ],
+        source="reuters",
+        category="business",
+        url="https://reuters.com/news/markets-react",
+        published_at=datetime(2025, 3, 1, tzinfo=timezone.utc),
+        views=1234,
+        is_deleted=False,
+        created_at=datetime(2025, 3, 1, tzinfo=timezone.utc),
+    )
+
+
+async def _decode_path(serializer, raw: bytes, field, live_views: int) -> Response:
+    # Previous format stored the decoded dict; decode it the same way
+    cached = serializer.loads(raw).value
+    merged = {**cached, "views": cached["views"] + live_views}
+    content = await serialize_response(field=field, response_content=merged)
+    return JSONResponse(content)
+
+
+async def _splice_path(serializer, raw: bytes, live_views: int) -> Response:
+    body = serializer.loads(raw).json()
+    return Response(add_views(body, live_views), media_type="application/json")
+
+
+async def main(requests: int, content_bytes: int):
+    serializer = CacheSerializer()
+    article = _article(content_bytes)
+    body = serialize_article(article)
+    stored_dict = serializer.dumps(
+        ArticleResponse.model_validate(article).model_dump(mode="json"), 0.0, 0.0
+    )
+    stored_body = serializer.dumps_entry(CacheEntry(body=body), 0.0, 0.0)
+    field = create_model_field("Response_get_article", ArticleResponse)
+    views = [random.randint(0, 50) for _ in range(requests)]
+
+    results = {}
+    start = time.perf_counter()
+    for n in views:
+        await _decode_path(serializer, stored_dict, field, n)
+    results["decode"] = (time.perf_counter() - start) / requests
+
+    start = time.perf_counter()
+    for n in views:
+        await _splice_path(serializer, stored_body, n)
+    results["splice"] = (time.perf_counter() - start) / requests
+
+    print(f"article body: {len(body)} bytes")
+    for name, per_request in results.items():
+        print(f"{name:<8} {per_request * 1e6:8.2f} us/request")
+    print(f"speedup  {results['decode'] / results['splice']:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--content-bytes", type=int, default=4000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.content_bytes))
@@ -0,0 +1,105 @@
+"""Cost of hydrating a list of article ids from the article cache.
+
+For each list size, compares:
+
+  loop      - the per-id path: one GET per id, and one SET per reloaded miss
+  bulk      - `RedisManager.get_cached_entries` (one MGET) and
+              `RedisManager.cache_entries` (one pipeline)
+
+Reads hit prefilled entries; writes re-cache every entry. The database query
+for misses is the same single `id = ANY(:ids)` query either way and is left
+out. Runs against the configured Redis (keys under `cache:article:bench-`,
+removed afterwards), or in process with --fake (no network: the gap shown
+is per-command overhead only, well below what a real round trip adds).
+
+Example:
+    python backend/scripts/bench_article_hydration.py --sizes 20 100 500
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from backend.app.modules.articles.utils.article_cache import article_cache_entry
+from backend.app.shared.infrastructure.redis.client import RedisManager
+
+
+def _article() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        title="Markets react cautiously to new measures",
+        content="Officials said the measures would take effect next month. " * 30,
+        source="reuters",
+        category="business",
+        url="https://reuters.com/news/markets-react",
+        published_at=datetime(2025, 3, 1, tzinfo=timezone.utc),
+        views=1234,
+        is_deleted=False,
+        created_at=datetime(2025, 3, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2025, 3, 1, tzinfo=timezone.utc),
+    )
+
+
+async def _timed(run, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await run()
+    return (time.perf_counter() - start) / repeat
+
+
+async def bench(size: int, repeat: int) -> dict[str, float]:
+    entries = {f"article:bench-{n}": article_cache_entry(_article()) for n in range(size)}
+    keys = list(entries)
+    await RedisManager.cache_entries(entries, expire=600)
+
+    async def loop_read():
+        for key in keys:
+            await RedisManager.get_cached_entry(key, expire=600)
+
+    async def loop_write():
+        for key, entry in entries.items():
+            await RedisManager.cache_entry(key, entry, expire=600)
+
+    results = {
+        "loop read": await _timed(loop_read, repeat),
+        "bulk read": await _timed(lambda: RedisManager.get_cached_entries(keys), repeat),
+        "loop write": await _timed(loop_write, repeat),
+        "bulk write": await _timed(
+            lambda: RedisManager.cache_entries(entries, expire=600), repeat
+        ),
+    }
+    redis = await RedisManager.get_redis()
+    await redis.unlink(*(f"cache:{key}" for key in keys))
+    return results
+
+
+async def main(sizes: list[int], repeat: int, fake: bool):
+    if fake:
+        from fakeredis import FakeAsyncRedis
+
+        RedisManager._connections["prod"] = FakeAsyncRedis(decode_responses=True)
+
+    try:
+        for size in sizes:
+            results = await bench(size, repeat)
+            print(f"{size} ids")
+            for name, seconds in results.items():
+                print(f"  {name:<11} {seconds * 1e3:8.2f} ms")
+            print(
+                f"  speedup     read {results['loop read'] / results['bulk read']:.1f}x"
+                f", write {results['loop write'] / results['bulk write']:.1f}x"
+            )
+    finally:
+        await RedisManager.close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 500])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--fake", action="store_true", help="use in-process fakeredis")
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat, args.fake))
@@ -0,0 +1,126 @@
+"""Stored size and encode/decode cost of cached article payloads per codec.
+
+Builds a synthetic corpus shaped like scraped articles (title, summary-sized
+metadata and a multi-paragraph body) and reports, for each format, the
+average bytes stored in Redis per entry and the time to write and read one:
+
+  legacy        - orjson envelope as stored before the binary format
+  json          - binary header + orjson body, no compression
+  json+zstd     - as above, compressed above --threshold bytes (default)
+  msgpack       - binary header + msgpack body
+  msgpack+zstd  - as above, compressed
+
+"read" for json includes nothing but header parsing and decompression: the
+body is served as-is. For msgpack it includes re-encoding to JSON.
+
+Example:
+    python backend/scripts/bench_cache_codec.py --articles 2000
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import orjson
+
+from backend.app.shared.infrastructure.redis.codec import (
+    CacheSerializer,
+    JsonCodec,
+    MsgpackCodec,
+)
+
+WORDS = (
+    "the government announced on monday that new measures would be introduced "
+    "to address rising costs across the region while officials said markets "
+    "reacted cautiously after analysts warned of slower growth in the coming "
+    "quarter and residents expressed concern over housing energy and transport "
+    "according to the report published by the ministry of finance earlier this "
+    "week several companies confirmed plans to expand operations despite the "
+    "uncertainty surrounding trade negotiations and interest rates"
+).split()
+CATEGORIES = ["politics", "business", "technology", "sports", "health", "science"]
+SOURCES = ["bbc", "reuters", "apnews", "guardian", "aljazeera"]
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(WORDS, k=rng.randint(8, 24))
+    return " ".join(words).capitalize() + "."
+
+
+def make_article(rng: random.Random) -> dict:
+    published = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(
+        minutes=rng.randint(0, 500_000)
+    )
+    paragraphs = [
+        " ".join(_sentence(rng) for _ in range(rng.randint(3, 7)))
+        for _ in range(rng.randint(4, 14))
+    ]
+    title = " ".join(rng.choices(WORDS, k=rng.randint(6, 12))).title()
+    source = rng.choice(SOURCES)
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "title": title,
+        "content": "\n\n".join(paragraphs),
+        "url": f"https://{source}.com/news/{title.lower().replace(' ', '-')}",
+        "category": rng.choice(CATEGORIES),
+        "source": source,
+        "published_at": published.isoformat(),
+        "views": rng.randint(0, 100_000),
+    }
+
+
+def _legacy(article: dict) -> tuple[int, float, float]:
+    envelope = {"value": article, "expires_at": time.time() + 600, "delta": 0.01}
+    start = time.perf_counter()
+    raw = orjson.dumps(envelope)
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    orjson.dumps(orjson.loads(raw)["value"])
+    return len(raw), encoded, time.perf_counter() - start
+
+
+def _binary(serializer: CacheSerializer, article: dict) -> tuple[int, float, float]:
+    start = time.perf_counter()
+    raw = serializer.dumps(article, time.time() + 600, 0.01)
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    serializer.loads(raw).json()
+    return len(raw), encoded, time.perf_counter() - start
+
+
+def main(articles: int, threshold: int, seed: int):
+    rng = random.Random(seed)
+    corpus = [make_article(rng) for _ in range(articles)]
+
+    formats = {
+        "legacy": _legacy,
+        "json": lambda a, s=CacheSerializer(JsonCodec, 1 << 62): _binary(s, a),
+        "json+zstd": lambda a, s=CacheSerializer(JsonCodec, threshold): _binary(s, a),
+        "msgpack": lambda a, s=CacheSerializer(MsgpackCodec, 1 << 62): _binary(s, a),
+        "msgpack+zstd": lambda a, s=CacheSerializer(MsgpackCodec, threshold): _binary(
+            s, a
+        ),
+    }
+
+    baseline = None
+    print(f"{'format':<14} {'bytes/entry':>12} {'saved':>7} {'write us':>9} {'read us':>8}")
+    for name, encode in formats.items():
+        sizes, writes, reads = zip(*(encode(article) for article in corpus))
+        avg = sum(sizes) / len(sizes)
+        baseline = baseline or avg
+        print(
+            f"{name:<14} {avg:12.0f} {1 - avg / baseline:7.1%} "
+            f"{sum(writes) / len(writes) * 1e6:9.1f} "
+            f"{sum(reads) / len(reads) * 1e6:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--threshold", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    main(args.articles, args.threshold, args.seed)
@@ -0,0 +1,118 @@
+"""Per-request logging cost on the calling (event loop) thread.
+
+Emits the two records RequestLoggingMiddleware produces per request and
+measures how long the caller is blocked, for:
+
+  sync      - formatter + stream handler on the caller (the previous setup,
+              including the response header dict)
+  queue     - AsyncQueueHandler; formatting/writing on the listener thread
+  sampled   - queue pipeline with --sample-rate applied to both events
+
+Output goes to /dev/null so terminal speed does not skew the numbers.
+
+Example:
+    python backend/scripts/bench_logging.py --requests 50000 --sample-rate 0.1
+"""
+
+import argparse
+import logging
+import os
+import queue
+import random
+import time
+from logging.handlers import QueueListener
+
+from backend.app.common.logging.config import AsyncQueueHandler, OrjsonFormatter
+
+HEADERS = {
+    "content-type": "application/json",
+    "content-length": "1534",
+    "x-correlation-id": "0b6f1a8e-7c9b-4f38-9b51-2f4c0f7c8d11",
+    "x-total-count": "42",
+}
+ATTRS = {
+    "path": "/api/v1/articles/",
+    "method": "GET",
+    "client_ip": "10.0.0.12",
+    "correlation_id": "0b6f1a8e-7c9b-4f38-9b51-2f4c0f7c8d11",
+}
+
+
+def _emit_request(logger: logging.Logger, sample_rate: float, with_headers: bool):
+    if sample_rate < 1.0 and random.random() >= sample_rate:
+        return
+    logger.info(
+        "GET request to /api/v1/articles/",
+        extra={"event_type": "request_started", **ATTRS},
+    )
+    extra = {
+        "event_type": "request_completed",
+        "status_code": 200,
+        "status_phrase": "OK",
+        "processing_time": "0.0042s",
+        **ATTRS,
+    }
+    if with_headers:
+        extra["response_headers"] = dict(HEADERS)
+    logger.info("GET /api/v1/articles/ completed: OK", extra=extra)
+
+
+def _measure(name: str, handler: logging.Handler, requests: int, **kwargs) -> float:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        _emit_request(logger, **kwargs)
+    return (time.perf_counter() - start) / requests
+
+
+def main(requests: int, sample_rate: float):
+    devnull = open(os.devnull, "w")
+    formatter = OrjsonFormatter()
+
+    sync_handler = logging.StreamHandler(devnull)
+    sync_handler.setFormatter(formatter)
+
+    sink = logging.StreamHandler(devnull)
+    sink.setFormatter(formatter)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, sink)
+    listener.start()
+
+    try:
+        results = {
+            "sync": _measure(
+                "sync", sync_handler, requests, sample_rate=1.0, with_headers=True
+            ),
+            "queue": _measure(
+                "queue",
+                AsyncQueueHandler(log_queue),
+                requests,
+                sample_rate=1.0,
+                with_headers=False,
+            ),
+            f"sampled({sample_rate:g})": _measure(
+                "sampled",
+                AsyncQueueHandler(log_queue),
+                requests,
+                sample_rate=sample_rate,
+                with_headers=False,
+            ),
+        }
+    finally:
+        listener.stop()
+        devnull.close()
+
+    for name, per_request in results.items():
+        print(f"{name:<14} {per_request * 1e6:8.2f} us/request on the caller")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    args = parser.parse_args()
+    main(args.requests, args.sample_rate)
@@ -0,0 +1,148 @@
+"""Login throughput benchmark.
+
+Two modes:
+
+  hasher  - compares bcrypt verification inline on the event loop against the
+            process pool, without any HTTP/DB overhead.
+  http    - drives POST /api/v1/auth/login on a running server with N
+            concurrent clients and reports throughput, latency and 503s.
+
+Examples:
+    python backend/scripts/bench_login.py hasher --requests 200 --concurrency 32
+    python backend/scripts/bench_login.py http --url http://localhost:8000 \\
+        --username admin_user --password TestPass123! --duration 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from backend.app.common.config.settings import settings
+from backend.app.common.exceptions.http import ServiceUnavailableError
+from backend.app.common.security.hashing import PasswordHasher, build_crypt_context
+
+
+def _report(label: str, latencies: list[float], elapsed: float, rejected: int = 0):
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    print(
+        f"{label:<8} {len(latencies) / elapsed:8.1f} req/s  "
+        f"p50={statistics.median(latencies) * 1000 if latencies else 0:7.1f}ms  "
+        f"p95={p95 * 1000:7.1f}ms  rejected={rejected}"
+    )
+
+
+async def bench_hasher(requests: int, concurrency: int, rounds: int):
+    context = build_crypt_context(rounds)
+    hashed = context.hash("TestPass123!")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(verify) -> tuple[list[float], float, int]:
+        latencies: list[float] = []
+        rejected = 0
+
+        async def one():
+            nonlocal rejected
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await verify()
+                    latencies.append(time.perf_counter() - start)
+                except ServiceUnavailableError:
+                    rejected += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        return latencies, time.perf_counter() - start, rejected
+
+    async def inline():
+        context.verify("TestPass123!", hashed)
+
+    _report("inline", *await run(inline))
+
+    hasher = PasswordHasher(
+        workers=settings.password_hash_workers,
+        max_pending=settings.password_hash_max_pending,
+        rounds=rounds,
+    )
+    hasher.start()
+    try:
+        # Warm up the worker processes before measuring
+        await asyncio.gather(
+            *(hasher.verify_and_update("x", hashed) for _ in range(hasher.workers))
+        )
+        _report(
+            "pool",
+            *await run(lambda: hasher.verify_and_update("TestPass123!", hashed)),
+        )
+        print(f"pool workers={hasher.workers} max_pending={hasher.max_pending}")
+    finally:
+        hasher.shutdown()
+
+
+async def bench_http(
+    url: str, username: str, password: str, concurrency: int, duration: float
+):
+    latencies: list[float] = []
+    rejected = 0
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal rejected, errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.post(
+                "/api/v1/auth/login",
+                data={"username": username, "password": password},
+            )
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+            elif response.status_code == 503:
+                rejected += 1
+            else:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    _report("http", latencies, elapsed, rejected)
+    if errors:
+        print(f"unexpected responses: {errors} (is the login rate limiter enabled?)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    hasher = sub.add_parser("hasher")
+    hasher.add_argument("--requests", type=int, default=200)
+    hasher.add_argument("--concurrency", type=int, default=32)
+    hasher.add_argument("--rounds", type=int, default=settings.bcrypt_rounds)
+
+    http = sub.add_parser("http")
+    http.add_argument("--url", default="http://localhost:8000")
+    http.add_argument("--username", default=settings.initial_admin_username)
+    http.add_argument("--password", default=settings.initial_admin_password)
+    http.add_argument("--concurrency", type=int, default=32)
+    http.add_argument("--duration", type=float, default=20.0)
+
+    args = parser.parse_args()
+    if args.mode == "hasher":
+        asyncio.run(bench_hasher(args.requests, args.concurrency, args.rounds))
+    else:
+        asyncio.run(
+            bench_http(
+                args.url, args.username, args.password, args.concurrency, args.duration
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Request throughput benchmark for the middleware stack.
+
+Drives a trivial endpoint in-process (httpx ASGITransport, no sockets) with
+three configurations:
+
+  bare      - no middleware at all
+  basehttp  - three no-op BaseHTTPMiddleware layers, i.e. the fixed cost the
+              stack paid before it was rewritten as pure ASGI
+  current   - the application's real middleware stack (register_middleware)
+
+Request logging is silenced unless --with-logging is given, so the numbers
+reflect middleware overhead rather than log I/O.
+
+Example:
+    python backend/scripts/bench_middleware.py --requests 5000 --body 512
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.app.core.middleware import register_middleware
+
+
+class _NoopHTTPMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        return await call_next(request)
+
+
+def _build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    if variant == "basehttp":
+        for _ in range(3):
+            app.add_middleware(_NoopHTTPMiddleware)
+    elif variant == "current":
+        register_middleware(app)
+    return app
+
+
+async def _run(app: FastAPI, requests: int, concurrency: int, payload: bytes) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        queue = iter(range(requests))
+
+        async def worker():
+            for _ in queue:
+                response = await client.post(
+                    "/echo",
+                    content=payload,
+                    headers={"Content-Type": "application/json"},
+                )
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+
+async def main(requests: int, concurrency: int, body: int, with_logging: bool):
+    if not with_logging:
+        logging.getLogger("app.request").setLevel(logging.WARNING)
+
+    payload = b'{"username": "bench", "password": "secret", "pad": "%s"}' % (
+        b"x" * body
+    )
+    for variant in ("bare", "basehttp", "current"):
+        app = _build_app(variant)
+        await _run(app, min(requests, 200), concurrency, payload)  # warm up
+        elapsed = await _run(app, requests, concurrency, payload)
+        print(
+            f"{variant:<9} {requests / elapsed:9.0f} req/s  "
+            f"{elapsed / requests * 1e6:8.1f} us/req"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--body", type=int, default=256, help="Padding bytes")
+    parser.add_argument("--with-logging", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.body, args.with_logging))
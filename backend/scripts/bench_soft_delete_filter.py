@@ -0,0 +1,111 @@
+"""Compiled-statement cache hit rate and per-query cost of the soft-delete hook.
+
+Runs the `get_current_user` lookup (user + joined role, with the role's
+selectin relationship loads) repeatedly for:
+
+  none      - no hook (admin sessions)
+  inline    - the previous hook: two new `with_loader_criteria` options with
+              fresh lambdas on every execution, relationship loads included
+  module    - the current hook: module-level options, skipping column and
+              relationship loads (they inherit the criteria)
+
+Each variant gets its own engine, so the cache statistics are separate.
+Uses an in-memory SQLite database by default; pass --url to run against
+PostgreSQL with the schema already migrated.
+
+Example:
+    python backend/scripts/bench_soft_delete_filter.py --queries 5000
+"""
+
+import argparse
+import time
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import joinedload, sessionmaker, with_loader_criteria
+
+from backend.app.main import app  # noqa: F401  (configures every mapper)
+from backend.app.modules.articles.models.article import Article
+from backend.app.modules.users.models.user import User
+from backend.app.shared.db.database import _add_soft_delete_filter
+
+SQLITE_SCHEMA = (
+    "CREATE TABLE roles (name VARCHAR PRIMARY KEY, description TEXT)",
+    "CREATE TABLE permissions (name VARCHAR PRIMARY KEY, description VARCHAR)",
+    "CREATE TABLE role_permission (role_name VARCHAR, permission_name VARCHAR)",
+    "CREATE TABLE users (id CHAR(32) PRIMARY KEY, username VARCHAR, "
+    "email VARCHAR, password VARCHAR, is_deleted BOOLEAN NOT NULL DEFAULT 0, "
+    "deleted_at TIMESTAMP, role_name VARCHAR, created_at TIMESTAMP)",
+    "INSERT INTO roles VALUES ('regular', NULL)",
+    "INSERT INTO users VALUES ('0b6f1a8e7c9b4f389b512f4c0f7c8d11', 'regular_user', "
+    "'regular@email.com', 'x', 0, NULL, 'regular', CURRENT_TIMESTAMP)",
+)
+
+
+def _inline_filter(execute_state):
+    if not execute_state.session.info.get("is_admin", False):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                Article, lambda cls: cls.is_deleted == False, include_aliases=True
+            ),
+            with_loader_criteria(
+                User, lambda cls: cls.is_deleted == False, include_aliases=True
+            ),
+        )
+
+
+VARIANTS = {"none": None, "inline": _inline_filter, "module": _add_soft_delete_filter}
+
+
+def bench(url: str, hook, queries: int) -> tuple[float, float, float]:
+    engine = create_engine(url)
+    if url.startswith("sqlite"):
+        with engine.begin() as conn:
+            for statement in SQLITE_SCHEMA:
+                conn.execute(text(statement))
+
+    hits = misses = 0
+    hook_time = 0.0
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal hits, misses
+        # "cached since ...", "generated in ...", "no key ..."
+        if context._get_cache_stats().startswith("cached"):
+            hits += 1
+        else:
+            misses += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    Session = sessionmaker(bind=engine)
+    if hook is not None:
+
+        def timed(execute_state):
+            nonlocal hook_time
+            start = time.perf_counter()
+            hook(execute_state)
+            hook_time += time.perf_counter() - start
+
+        event.listen(Session, "do_orm_execute", timed)
+
+    start = time.perf_counter()
+    for _ in range(queries):
+        with Session() as db:
+            db.query(User).options(joinedload(User.role)).filter(
+                User.username == "regular_user"
+            ).first()
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    return hits / (hits + misses), elapsed / queries, hook_time / queries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument("--queries", type=int, default=5000)
+    args = parser.parse_args()
+
+    for name, hook in VARIANTS.items():
+        hit_rate, per_query, in_hook = bench(args.url, hook, args.queries)
+        print(
+            f"{name:<8} cache hit rate {hit_rate:7.2%}  "
+            f"{per_query * 1e6:8.1f} us/lookup  {in_hook * 1e6:6.1f} us in hook"
+        )
@@ -1,7 +1,50 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+import time
+from datetime import date
 from uuid import uuid4
+import orjson
+import pytest
+import redis
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
 from fastapi import status
+from redis.asyncio import ConnectionPool
+from sqlalchemy import event, text
 
 from backend.app.db import models
+from backend.app.modules.articles.schemas.article import ArticleFilters
+from backend.app.modules.articles.services.article_service import ArticleService
+from backend.app.modules.articles.services.facet_service import FacetService
+from backend.app.modules.articles.services.partition_service import PartitionService
+from backend.app.modules.articles.services.recommendation_service import (
+    get_personalized_recommendation,
+)
+from backend.app.modules.articles.utils.article_cache import add_views
+from backend.app.modules.articles.utils.search_cache import search_cache_key
+from backend.app.modules.articles.utils.view_utils.view_tracker import ViewTracker
+from backend.app.modules.users.models.user import User
+from backend.app.modules.users.services.preference_service import PreferenceService
+from backend.app.shared.infrastructure.redis.client import (
+    InstrumentedRedis,
+    RedisManager,
+    RoundTrips,
+    redis_round_trips,
+    xfetch_due,
+)
+from backend.app.shared.infrastructure.redis.client_cache import (
+    ClientSideCache,
+    check_support,
+)
+from backend.app.shared.infrastructure.redis.codec import (
+    CacheEntry,
+    CacheSerializer,
+    JsonCodec,
+    MsgpackCodec,
+)
 
 
 def _create_test_article(client, db, headers, title, category, source, views=0):
@@ -289,4 +332,494 @@ def test_admin_can_delete_article(
     # Verify non-existence for regular users
     response = client.get(f"/api/v1/articles/{article['id']}", headers=regular_headers)
     print("response", response.json())
-    assert response.status_code == status.HTTP_404_NOT_FOUND
\ No newline at end of file
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_cached_article_is_served_from_cache(client, moderator_headers, regular_headers):
+    article_id = client.post(
+        "/api/v1/articles/",
+        json={"title": "Cached", "content": "Content", "url": "https://cached.com"},
+        headers=moderator_headers,
+    ).json()["id"]
+
+    first = client.get(f"/api/v1/articles/{article_id}", headers=regular_headers)
+    second = client.get(f"/api/v1/articles/{article_id}", headers=regular_headers)
+    assert first.status_code == second.status_code == status.HTTP_200_OK
+    assert second.json()["title"] == first.json()["title"]
+
+
+def test_xfetch_refreshes_early_only_near_expiry():
+    now = 1_000_000.0
+    # Cheap values far from expiry are never refreshed early
+    assert not any(xfetch_due(now + 600, delta=0.01, now=now) for _ in range(1000))
+    # Unknown compute cost disables early refresh
+    assert not xfetch_due(now + 1, delta=0.0, now=now)
+    # Past the logical expiry a refresh is always due
+    assert xfetch_due(now - 1, delta=0.01, now=now)
+    # Expensive values close to expiry are refreshed most of the time
+    assert sum(xfetch_due(now + 0.1, delta=1.0, now=now) for _ in range(1000)) > 800
+
+
+def test_entries_loaded_in_milliseconds_still_refresh_early():
+    # Expiring in 10ms after a 2ms load; a refresh is due on nearly every read
+    due = 0
+    for _ in range(100):
+        entry = CacheEntry(body=b"{}", expires_at=time.time() + 0.01, delta=0.002)
+        due += RedisManager._check_entry("article:x", entry, 600, None, 1.0) is None
+    assert due > 90
+
+
+def test_client_side_cache_is_bounded_and_invalidated():
+    cache = ClientSideCache(prefixes=["cache:"], max_bytes=4096)
+    cache.ready = True
+    reads = []
+
+    async def fetch():
+        reads.append(1)
+        return "x" * 1000
+
+    async def scenario():
+        for i in range(10):
+            await cache.read(f"cache:article:{i}", fetch, size=len)
+        assert cache.local.size <= 4096
+        assert len(cache.local) < 10
+
+        await cache.read("cache:article:9", fetch, size=len)
+        assert len(reads) == 10  # served from memory
+
+        await cache._invalidate(["invalidate", ["cache:article:9"]])
+        await cache.read("cache:article:9", fetch, size=len)
+        assert len(reads) == 11
+
+        await cache.read("views:1", fetch)  # untracked prefix
+        await cache.read("views:1", fetch)
+        assert len(reads) == 13
+
+    asyncio.run(scenario())
+
+
+def test_client_side_cache_refuses_untested_redis_py(monkeypatch):
+    check_support()
+    monkeypatch.setattr(redis, "__version__", "9.0.0")
+    cache = ClientSideCache(prefixes=["cache:"], max_bytes=4096)
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.start("redis://localhost:6379/0"))
+    # Disabled (no prefixes), nothing is checked
+    asyncio.run(ClientSideCache(prefixes=[], max_bytes=4096).start("redis://x"))
+
+
+def test_cached_article_read_costs_one_redis_round_trip():
+    article_id = uuid4()
+    tracker = ViewTracker()
+    previous = RedisManager._connections.get("prod")
+
+    async def scenario():
+        RedisManager._connections["prod"] = InstrumentedRedis.from_pool(
+            ConnectionPool(connection_class=FakeConnection, server=FakeServer())
+        )
+        await RedisManager.cache_entry(
+            f"article:{article_id}", CacheEntry(body=b'{"views":1}'), expire=600
+        )
+        await RedisManager.increment_counter(f"views:{article_id}", 4)
+
+        round_trips = RoundTrips()
+        token = redis_round_trips.set(round_trips)
+        try:
+            await tracker.increment(article_id)
+            entry, views = await RedisManager.get_cached_entry_and_counter(
+                f"article:{article_id}", f"views:{article_id}", expire=600
+            )
+        finally:
+            redis_round_trips.reset(token)
+        assert round_trips.count == 1
+        assert entry.json() == b'{"views":1}'
+        # Flushed views come from Redis, the latest one from the local buffer
+        assert views + tracker.pending(article_id) == 5
+
+        # Once flushed, the view is counted by Redis alone
+        await tracker._flush()
+        views = await RedisManager.get_counter(f"views:{article_id}")
+        assert views == 5
+        assert tracker.pending(article_id) == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        RedisManager._connections["prod"] = previous
+        tracker.buffer.pop(str(article_id), None)
+
+
+def test_cache_codec_round_trip_keeps_response_body():
+    article = {"id": str(uuid4()), "title": "Codec", "content": "word " * 1000}
+    for codec in (JsonCodec, MsgpackCodec):
+        serializer = CacheSerializer(codec, compress_threshold=256)
+        raw = serializer.dumps(article, expires_at=123.0, delta=0.5)
+        assert len(raw) < len(orjson.dumps(article))  # compressed
+
+        entry = serializer.loads(raw)
+        assert (entry.expires_at, entry.delta) == (123.0, 0.5)
+        assert orjson.loads(entry.json()) == article
+        assert entry.value == article
+
+    # Values cached in the previous (JSON envelope) format read as misses
+    assert serializer.loads(orjson.dumps({"value": article})) is None
+
+
+def test_cached_article_views_are_spliced_into_body():
+    body = orjson.dumps({"title": 'He said ,"views":99', "views": 7})
+    spliced = orjson.loads(add_views(body, 5))
+    assert spliced == {"title": 'He said ,"views":99', "views": 12}
+    assert add_views(body, 0) is body
+
+
+def test_article_conditional_get_returns_304(client, moderator_headers, regular_headers):
+    article_id = client.post(
+        "/api/v1/articles/",
+        json={"title": "Etag", "content": "Content", "url": "https://etag.com"},
+        headers=moderator_headers,
+    ).json()["id"]
+
+    first = client.get(f"/api/v1/articles/{article_id}", headers=regular_headers)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    by_etag = client.get(
+        f"/api/v1/articles/{article_id}",
+        headers={**regular_headers, "If-None-Match": etag},
+    )
+    assert by_etag.status_code == status.HTTP_304_NOT_MODIFIED
+    assert by_etag.headers["ETag"] == etag
+    assert not by_etag.content
+
+    by_date = client.get(
+        f"/api/v1/articles/{article_id}",
+        headers={
+            **regular_headers,
+            "If-Modified-Since": first.headers["Last-Modified"],
+        },
+    )
+    assert by_date.status_code == status.HTTP_304_NOT_MODIFIED
+
+    client.patch(
+        f"/api/v1/articles/{article_id}",
+        json={"content": "Changed"},
+        headers=moderator_headers,
+    )
+    changed = client.get(
+        f"/api/v1/articles/{article_id}",
+        headers={**regular_headers, "If-None-Match": etag},
+    )
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["ETag"] != etag
+
+
+def test_article_list_conditional_get(client, moderator_headers, regular_headers):
+    client.post(
+        "/api/v1/articles/",
+        json={"title": "List", "content": "Content", "url": "https://list.com"},
+        headers=moderator_headers,
+    )
+    first = client.get("/api/v1/articles/", headers=regular_headers)
+    assert first.headers["Cache-Control"].startswith("public")
+
+    again = client.get(
+        "/api/v1/articles/",
+        headers={**regular_headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert again.status_code == status.HTTP_304_NOT_MODIFIED
+    assert again.headers["X-Total-Count"] == first.headers["X-Total-Count"]
+
+
+def test_article_list_field_projection(client, moderator_headers, regular_headers):
+    client.post(
+        "/api/v1/articles/",
+        json={"title": "Sparse", "content": "Long body", "url": "https://sparse.com"},
+        headers=moderator_headers,
+    )
+
+    response = client.get("/api/v1/articles/?fields=summary", headers=regular_headers)
+    assert response.status_code == status.HTTP_200_OK
+    article = response.json()[0]
+    assert "content" not in article
+    assert {"id", "title", "source", "published_at"} <= article.keys()
+
+    response = client.get(
+        "/api/v1/articles/?fields=title,id", headers=regular_headers
+    )
+    assert list(response.json()[0]) == ["title", "id"]
+
+
+def test_article_list_rejects_unknown_fields(client, regular_headers):
+    response = client.get("/api/v1/articles/?fields=title,secret", headers=regular_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "secret" in response.json()["detail"]
+
+
+def test_admin_export_streams_ndjson_and_resumes(
+    client, admin_headers, moderator_headers, regular_headers
+):
+    for n in range(3):
+        client.post(
+            "/api/v1/articles/",
+            json={"title": f"Export {n}", "content": "Body", "url": f"https://export.com/{n}"},
+            headers=moderator_headers,
+        )
+
+    forbidden = client.get("/api/v1/articles/export", headers=regular_headers)
+    assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+
+    response = client.get("/api/v1/articles/export?fields=title", headers=admin_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["title"] for row in rows] == ["Export 0", "Export 1", "Export 2"]
+    assert set(rows[0]) == {"title", "created_at", "id"}
+
+    cursor = f"{rows[0]['created_at']},{rows[0]['id']}"
+    resumed = client.get(
+        "/api/v1/articles/export", params={"after": cursor}, headers=admin_headers
+    )
+    assert [json.loads(line)["title"] for line in resumed.text.splitlines()] == [
+        "Export 1",
+        "Export 2",
+    ]
+
+
+def test_admin_export_csv_gzip(client, admin_headers, moderator_headers):
+    client.post(
+        "/api/v1/articles/",
+        json={"title": "Csv", "content": "Body", "url": "https://csv.com"},
+        headers=moderator_headers,
+    )
+
+    response = client.get(
+        "/api/v1/articles/export?format=csv&gzip=true&fields=title",
+        headers=admin_headers,
+    )
+    assert response.headers["Content-Type"] == "application/gzip"
+    assert "articles.csv.gz" in response.headers["Content-Disposition"]
+    rows = list(csv.reader(io.StringIO(gzip.decompress(response.content).decode())))
+    assert rows[0] == ["title", "created_at", "id"]
+    assert rows[1][0] == "Csv"
+
+    invalid = client.get("/api/v1/articles/export?after=yesterday", headers=admin_headers)
+    assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_duplicate_article_url_conflicts(client, moderator_headers):
+    article = {"title": "Once", "content": "Body", "url": "https://once.com"}
+    first = client.post("/api/v1/articles/", json=article, headers=moderator_headers)
+    assert first.status_code == status.HTTP_201_CREATED
+
+    # Different month, so a different partition: still rejected
+    again = client.post(
+        "/api/v1/articles/",
+        json={**article, "published_at": "2020-01-15T00:00:00Z"},
+        headers=moderator_headers,
+    )
+    assert again.status_code == status.HTTP_409_CONFLICT
+
+
+def test_article_list_facets(client, db, moderator_headers, regular_headers):
+    _create_test_article(client, db, moderator_headers, "Chips", "tech", "wire.com")
+    _create_test_article(client, db, moderator_headers, "Cloud", "tech", "daily.com")
+    _create_test_article(client, db, moderator_headers, "Goal", "sports", "wire.com")
+
+    response = client.get(
+        "/api/v1/articles/?category=tech&facets=true&limit=1", headers=regular_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 1
+    assert response.headers["X-Total-Count"] == "2"
+    assert response.json()["facets"] == {
+        "total": 2,
+        "category": {"tech": 2},
+        "source": {"wire.com": 1, "daily.com": 1},
+    }
+
+    # Unfiltered facets are as of the last materialized view refresh, the
+    # page total is not
+    response = client.get("/api/v1/articles/?facets=true", headers=regular_headers)
+    assert response.json()["facets"]["total"] == 0
+    assert response.headers["X-Total-Count"] == "3"
+    FacetService.refresh(db)
+    response = client.get("/api/v1/articles/?facets=true", headers=regular_headers)
+    assert response.json()["facets"] == {
+        "total": 3,
+        "category": {"tech": 2, "sports": 1},
+        "source": {"wire.com": 2, "daily.com": 1},
+    }
+
+
+def test_article_list_pages_are_cached_until_a_write(
+    client, db, moderator_headers, regular_headers
+):
+    first = _create_test_article(client, db, moderator_headers, "First", "tech", "a.com")
+    response = client.get("/api/v1/articles/?category=tech", headers=regular_headers)
+    assert [a["id"] for a in response.json()] == [first["id"]]
+
+    # Changes behind the API's back are not seen: the page is cached
+    db.execute(text("UPDATE articles SET category = 'misc'"))
+    db.commit()
+    response = client.get("/api/v1/articles/?category=tech", headers=regular_headers)
+    assert [a["id"] for a in response.json()] == [first["id"]]
+
+    # Any article write starts a new generation of cached pages
+    _create_test_article(client, db, moderator_headers, "Second", "tech", "b.com")
+    response = client.get("/api/v1/articles/?category=tech", headers=regular_headers)
+    assert [a["title"] for a in response.json()] == ["Second"]
+    assert response.headers["X-Total-Count"] == "1"
+
+
+def test_faceted_and_plain_article_lists_share_page_totals(
+    client, db, moderator_headers, regular_headers
+):
+    for title in ("One", "Two"):
+        _create_test_article(client, db, moderator_headers, title, "tech", "a.com")
+
+    # The faceted request fills the page; the (unrefreshed) view counts none
+    faceted = client.get("/api/v1/articles/?facets=true", headers=regular_headers)
+    assert faceted.json()["facets"]["total"] == 0
+    plain = client.get("/api/v1/articles/", headers=regular_headers)
+    assert faceted.headers["X-Total-Count"] == plain.headers["X-Total-Count"] == "2"
+
+
+def test_article_list_hydrates_partially_cached_pages_in_order(
+    client, db, moderator_headers, regular_headers
+):
+    for views, title in enumerate(["Low", "Mid", "High"]):
+        _create_test_article(client, db, moderator_headers, title, "tech", "a.com", views)
+    mid = db.query(Article.id).filter(Article.title == "Mid").scalar()
+    # Only the middle article is in the article cache before the listing
+    client.get(f"/api/v1/articles/{mid}", headers=regular_headers)
+
+    response = client.get("/api/v1/articles/?sort_by=views", headers=regular_headers)
+    assert [a["title"] for a in response.json()] == ["High", "Mid", "Low"]
+
+
+def test_projected_article_list_pages_are_cached_as_rows(
+    client, db, moderator_headers, regular_headers
+):
+    _create_test_article(client, db, moderator_headers, "Sparse", "tech", "a.com")
+    first = client.get("/api/v1/articles/?fields=summary", headers=regular_headers)
+
+    # Served from the cached rows, byte for byte, without hydrating articles
+    db.execute(text("UPDATE articles SET title = 'Changed'"))
+    db.commit()
+    again = client.get("/api/v1/articles/?fields=summary", headers=regular_headers)
+    assert again.content == first.content
+    assert again.headers["ETag"] == first.headers["ETag"]
+    assert "content" not in again.json()[0]
+
+
+def test_search_cache_key_is_canonical():
+    key = search_cache_key(3, ArticleFilters(category="tech", source="x"), 0, 10)
+    assert key == search_cache_key(3, ArticleFilters(source="x", category="tech"), 0, 10)
+    assert key.startswith("search:3:")
+    assert key != search_cache_key(4, ArticleFilters(category="tech", source="x"), 0, 10)
+    assert key != search_cache_key(3, ArticleFilters(category="tech", source="x"), 10, 10)
+    assert key != search_cache_key(
+        3, ArticleFilters(category="tech", source="x"), 0, 10, ("id", "title")
+    )
+
+
+def test_partition_maintenance_moves_default_rows(client, db, moderator_headers):
+    # No monthly partitions exist yet, so this lands in the default partition
+    client.post(
+        "/api/v1/articles/",
+        json={
+            "title": "Parked",
+            "content": "Body",
+            "url": "https://parked.com",
+            "published_at": "2031-02-10T08:00:00Z",
+        },
+        headers=moderator_headers,
+    )
+
+    result = PartitionService.maintain(db, today=date(2031, 1, 20), months_ahead=1)
+    assert result["created"] == ["articles_2031_01", "articles_2031_02"]
+    assert db.execute(text("SELECT count(*) FROM articles_default")).scalar() == 0
+    assert db.execute(text("SELECT title FROM articles_2031_02")).scalar() == "Parked"
+    # The bounds CHECK only served the attach
+    assert not db.execute(
+        text("SELECT conname FROM pg_constraint WHERE conname LIKE '%_bounds'")
+    ).all()
+
+    # Idempotent, and date-range searches only touch the matching partition
+    assert PartitionService.maintain(db, today=date(2031, 1, 20), months_ahead=1) == {
+        "created": [],
+        "detached": [],
+    }
+    plan = "\n".join(
+        db.execute(
+            text(
+                "EXPLAIN SELECT * FROM articles WHERE published_at "
+                "BETWEEN '2031-02-01' AND '2031-02-20'"
+            )
+        ).scalars()
+    )
+    assert "articles_2031_02" in plan and "articles_2031_01" not in plan
+
+    result = PartitionService.maintain(
+        db, today=date(2031, 4, 1), months_ahead=0, retention_months=1
+    )
+    assert result["detached"] == ["articles_2031_01", "articles_2031_02"]
+    # The URL is free again once its partition is detached
+    assert ArticleService._claim_urls(db, ["https://parked.com"])
+    db.rollback()
+    db.execute(text("DROP TABLE articles_2031_01, articles_2031_02"))
+    db.commit()
+
+
+def _explain_queries(db, run) -> list[str]:
+    """Plans of the SELECTs `run` sends, soft-delete criteria included."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    # A handful of rows would always be seq-scanned; ask whether the index can serve
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    connection = db.connection()
+    return [
+        "\n".join(row[0] for row in connection.exec_driver_sql(f"EXPLAIN {sql}", params))
+        for sql, params in captured
+    ]
+
+
+def test_live_article_queries_use_partial_indexes(db, client, moderator_headers):
+    client.post(
+        "/api/v1/articles/",
+        json={"title": "Indexed", "content": "Body", "url": "https://indexed.com", "category": "tech"},
+        headers=moderator_headers,
+    )
+    user_id = db.query(User.id).filter(User.username == "regular_user").scalar()
+
+    plans = _explain_queries(
+        db,
+        lambda: ArticleService.search_articles(
+            db, ArticleFilters(sort_by="published_at", order="desc")
+        ),
+    )
+    assert any("ix_articles_live_published_at" in plan for plan in plans)
+
+    plans = _explain_queries(
+        db, lambda: get_personalized_recommendation(db, user_id)
+    )
+    assert "ix_articles_live_popular" in plans[-1]
+
+    db.rollback()
+    PreferenceService.update_preferences(db, user_id, {"preferred_categories": ["tech"]})
+    plans = _explain_queries(
+        db, lambda: get_personalized_recommendation(db, user_id)
+    )
+    assert "ix_articles_live_category_popular" in plans[-1]
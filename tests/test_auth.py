@@ -1,4 +1,18 @@
+import asyncio
+
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
 from fastapi import status
+from passlib.hash import bcrypt
+from redis.asyncio import ConnectionPool
+
+from backend.app.common.config.settings import settings
+from backend.app.common.security.revocation import BloomFilter, TokenRevocationList
+from backend.app.modules.users.models.user import User
+from backend.app.shared.infrastructure.redis.client import (
+    InstrumentedRedis,
+    RedisManager,
+)
 
 
 def test_successful_signup(client):
@@ -30,6 +44,19 @@ def test_login_success(client):
     assert "access_token" in response.json()
 
 
+def test_login_rehashes_outdated_password(client, db):
+    user = db.query(User).filter(User.username == "admin_user").first()
+    user.password = bcrypt.using(rounds=4).hash("TestPass123!")
+    db.commit()
+
+    credentials = {"username": "admin_user", "password": "TestPass123!"}
+    response = client.post("/api/v1/auth/login", data=credentials)
+    assert response.status_code == status.HTTP_200_OK
+
+    db.refresh(user)
+    assert bcrypt.from_string(user.password).rounds == settings.bcrypt_rounds
+
+
 def test_login_invalid_credentials(client):
     credentials = {"username": "admin_user", "password": "wrongpassword"}
     response = client.post("/api/v1/auth/login", data=credentials)
@@ -52,3 +79,49 @@ def test_expired_token(client, admin_headers):
         "/api/v1/users/", headers={"Authorization": f"Bearer {expired_token}"}
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_revocation_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    revoked = [f"jti-{i}" for i in range(1000)]
+    for jti in revoked:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in revoked)
+    false_hits = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_hits / 10000 < 0.03
+
+
+def test_revocation_false_positive_rate_counts_unrevoked_lookups():
+    revocations = TokenRevocationList(capacity=1000, error_rate=0.01)
+    revocations.ready = True
+    previous = RedisManager._connections.get("prod")
+
+    async def scenario():
+        redis = InstrumentedRedis.from_pool(
+            ConnectionPool(connection_class=FakeConnection, server=FakeServer())
+        )
+        RedisManager._connections["prod"] = redis
+        await redis.set("blacklist:revoked", "true")
+        # "ghost" is in the filter but not in Redis: a false positive
+        revocations.filter.add("revoked")
+        revocations.filter.add("ghost")
+
+        assert await revocations.is_revoked("revoked")
+        assert not await revocations.is_revoked("ghost")
+        for i in range(8):
+            assert not await revocations.is_revoked(f"valid-{i}")
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        RedisManager._connections["prod"] = previous
+
+    stats = revocations.stats()
+    assert (stats["lookups"], stats["filter_hits"], stats["false_positives"]) == (
+        10,
+        2,
+        1,
+    )
+    # One false positive among the nine tokens that are not revoked
+    assert stats["false_positive_rate"] == 1 / 9
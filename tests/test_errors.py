@@ -1,3 +1,4 @@
+import logging
 import pytest
 from uuid import uuid4
 from fastapi import status
@@ -11,6 +12,7 @@ from backend.app.common.exceptions.http import (
     ThirdPartyServiceError,
     DatabaseError,
     BadRequestError,
+    ServiceUnavailableError,
 )
 
 def test_not_found_error():
@@ -78,4 +80,14 @@ def test_bad_request_error():
     response = error.to_dict()
     assert response["status"] == status.HTTP_400_BAD_REQUEST
     assert response["code"] == "bad_request"
-    assert response["detail"] == "Invalid query parameter"
\ No newline at end of file
+    assert response["detail"] == "Invalid query parameter"
+
+def test_service_unavailable_error(caplog):
+    with caplog.at_level(logging.WARNING):
+        error = ServiceUnavailableError(retry_after=1)
+    response = error.to_dict()
+    assert response["status"] == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response["retry_after"] == 1
+    assert error.headers == {"Retry-After": "1"}
+    # Load shedding is expected under load, not an error
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
@@ -1,9 +1,21 @@
 import json
+import time
+from types import SimpleNamespace
+
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.testclient import TestClient
 
+from backend.app.common.config.settings import settings
+from backend.app.common.middleware.compression import CompressionMiddleware
+from backend.app.common.middleware.read_your_writes import ReadYourWritesMiddleware
 
-from backend.app.middleware.sanitization import SanitizationMiddleware
+from backend.app.common.middleware.sanitization import (
+    SanitizationMiddleware,
+    get_redacted_headers,
+    get_sanitized_body,
+)
+from backend.app.shared.db.routing import mark_committed, read_your_writes
 
 # We create a separate FastAPI test app here because middleware stores
 # sanitized data in `request.state`, which is not directly accessible
@@ -13,15 +25,17 @@ from backend.app.middleware.sanitization import SanitizationMiddleware
 app = FastAPI()
 
 
-backend.app.add_middleware(SanitizationMiddleware)
+app.add_middleware(SanitizationMiddleware, max_body_bytes=1024)
 
 
-# Create a test endpoint that returns the sanitized data stored in request.state
-@backend.app.post("/test/sanitization")
+# Create a test endpoint that returns the sanitized data kept for logging.
+# The body is read first: the middleware only observes what the app consumes.
+@app.post("/test/sanitization")
 async def get_sanitization_info(request: Request):
+    await request.body()
     return {
-        "redacted_headers": getattr(request.state, "redacted_headers", {}),
-        "sanitized_body": getattr(request.state, "sanitized_body", None),
+        "redacted_headers": get_redacted_headers(request),
+        "sanitized_body": get_sanitized_body(request),
     }
 
 
@@ -92,7 +106,249 @@ def test_sanitization_non_json_body():
     assert response.json()["sanitized_body"] is None
 
 
+def test_sanitization_skips_non_json_content_type():
+    """Bodies are only kept for JSON content types"""
+    response = client.post(
+        "/test/sanitization",
+        content=b'{"password": "secret"}',
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.json()["sanitized_body"] is None
+
+
+def test_sanitization_skips_bodies_over_cap():
+    """Large payloads are passed through but never kept for logging"""
+    payload = {"password": "secret", "blob": "x" * 4096}
+    response = client.post("/test/sanitization", json=payload)
+    assert response.status_code == 200
+    assert response.json()["sanitized_body"] is None
+
+
 def test_correlation_id_propagation(client):
     response = client.get("/api/v1/articles/")
     assert "X-Correlation-ID" in response.headers
     assert len(response.headers["X-Correlation-ID"]) == 36
+
+
+def test_metrics_endpoint_reports_route_latency(client):
+    client.get("/api/v1/articles/")
+    assert client.get("/metrics").status_code == 401
+    assert (
+        client.get("/metrics", headers={"X-API-Key": "wrong"}).status_code == 401
+    )
+
+    key = settings.metrics_api_key or settings.api_key
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {key}"})
+    assert response.status_code == 200
+    assert 'route="/api/v1/articles/"' in response.text
+    assert "http_request_duration_seconds_bucket" in response.text
+
+
+def test_pool_metrics_track_checkouts_and_overflow():
+    from sqlalchemy import create_engine
+
+    from backend.app.common.metrics.registry import render_metrics
+    from backend.app.shared.db.instrumentation import (
+        InstrumentedQueuePool,
+        instrument_engine,
+    )
+
+    engine = instrument_engine(
+        create_engine(
+            "sqlite://", poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=2
+        ),
+        "test",
+    )
+
+    def sample(metric):
+        for line in render_metrics()[0].decode().splitlines():
+            if line.startswith(f'{metric}{{pool="test"}}'):
+                return float(line.split()[-1])
+
+    first, second = engine.connect(), engine.connect()
+    assert sample("db_pool_connections_in_use") == 2
+    assert sample("db_pool_overflow_connections") == 1
+    assert sample("db_connection_age_seconds_count") == 2
+    assert sample("db_pool_checkout_wait_seconds_count") == 2
+
+    first.close()
+    second.close()
+    assert sample("db_pool_connections_in_use") == 0
+    assert sample("db_pool_overflow_connections") == 0
+
+    # A disposed engine's new pool keeps reporting under the same name
+    engine.dispose()
+    engine.connect().close()
+    assert sample("db_pool_checkout_wait_seconds_count") == 3
+
+
+compression_app = FastAPI()
+compression_app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+
+@compression_app.get("/test/compression/{size}")
+async def sized_payload(size: int):
+    return {"content": "x" * size}
+
+
+@compression_app.get("/test/compression-etag")
+async def tagged_payload():
+    return JSONResponse({"content": "x" * 4096}, headers={"ETag": '"abc"'})
+
+
+@compression_app.get("/test/compression-stream")
+async def streamed_payload():
+    async def lines():
+        for i in range(100):
+            yield json.dumps({"line": i, "content": "y" * 100}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+compression_client = TestClient(compression_app)
+
+
+def test_compression_negotiates_preferred_encoding():
+    response = compression_client.get(
+        "/test/compression/4096", headers={"Accept-Encoding": "gzip, br, zstd"}
+    )
+    assert response.headers["content-encoding"] == "zstd"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < 4096
+    assert response.json()["content"] == "x" * 4096
+
+    response = compression_client.get(
+        "/test/compression/4096", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["content"] == "x" * 4096
+
+
+def test_compression_weakens_strong_etags():
+    encoded = compression_client.get(
+        "/test/compression-etag", headers={"Accept-Encoding": "gzip"}
+    )
+    assert encoded.headers["etag"] == 'W/"abc"'
+
+    identity = compression_client.get(
+        "/test/compression-etag", headers={"Accept-Encoding": "identity"}
+    )
+    assert identity.headers["etag"] == '"abc"'
+
+
+def test_compression_skips_small_and_unaccepted_responses():
+    small = compression_client.get(
+        "/test/compression/10", headers={"Accept-Encoding": "gzip"}
+    )
+    assert "content-encoding" not in small.headers
+
+    identity = compression_client.get(
+        "/test/compression/4096", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in identity.headers
+
+
+def test_compression_streams_chunked_responses():
+    response = compression_client.get(
+        "/test/compression-stream", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    lines = response.text.splitlines()
+    assert len(lines) == 100
+    assert json.loads(lines[-1])["line"] == 99
+
+
+def test_precompressed_article_variants_decode_with_live_views():
+    import gzip
+
+    import zstandard
+
+    from backend.app.modules.articles.utils.article_cache import render_article
+    from backend.app.shared.infrastructure.redis.codec import CacheEntry
+    from backend.app.common.http.compression import compress_prefix
+
+    prefix = b'{"title":"Cached","content":"' + b"z" * 2000 + b'"'
+    entry = CacheEntry(
+        body=prefix + b',"views":5}',
+        variants={enc: compress_prefix(prefix, enc) for enc in ("gzip", "zstd")},
+    )
+
+    body, encoding = render_article(entry, 3, "gzip")
+    assert encoding == "gzip"
+    assert json.loads(gzip.decompress(body))["views"] == 8
+
+    body, encoding = render_article(entry, 3, "zstd, gzip")
+    assert encoding == "zstd"
+    # One frame: a plain decompressor (which stops after the first) reads it all
+    decompressed = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    assert json.loads(decompressed)["views"] == 8
+
+    body, encoding = render_article(entry, 0, "")
+    assert encoding is None and body == entry.body
+
+
+sticky_app = FastAPI()
+sticky_app.add_middleware(ReadYourWritesMiddleware, window=5)
+
+
+@sticky_app.post("/test/write")
+def committing_write():
+    # Sync route: runs in a worker thread with a copy of the request context
+    mark_committed(SimpleNamespace(info={"wrote": True}))
+    return {}
+
+
+@sticky_app.get("/test/read")
+def replica_read():
+    return {"sticky": read_your_writes.get().sticky}
+
+
+def test_read_your_writes_pins_reads_after_a_commit():
+    sticky_client = TestClient(sticky_app)
+    assert sticky_client.get("/test/read").json() == {"sticky": False}
+    assert "set-cookie" not in sticky_client.get("/test/read").headers
+
+    response = sticky_client.post("/test/write")
+    assert "db_sticky=" in response.headers["set-cookie"]
+    assert sticky_client.get("/test/read").json() == {"sticky": True}
+
+    # Expired deadlines are ignored even if the client keeps the cookie
+    sticky_client.cookies.set("db_sticky", "1")
+    assert sticky_client.get("/test/read").json() == {"sticky": False}
+
+    # Clients that keep no cookies echo the header instead
+    header_client = TestClient(sticky_app)
+    deadline = response.headers["x-db-sticky"]
+    read = header_client.get("/test/read", headers={"X-DB-Sticky": deadline})
+    assert read.json() == {"sticky": True}
+    # Deadlines further away than the window are not trusted
+    far = f"{time.time() + 3600:.3f}"
+    read = header_client.get("/test/read", headers={"X-DB-Sticky": far})
+    assert read.json() == {"sticky": False}
+
+
+def test_metrics_count_redis_round_trips_per_request():
+    from prometheus_client import REGISTRY
+
+    from backend.app.common.middleware.metrics import MetricsMiddleware
+    from backend.app.shared.infrastructure.redis.client import redis_round_trips
+
+    counted_app = FastAPI()
+    counted_app.add_middleware(MetricsMiddleware)
+
+    @counted_app.get("/test/round-trips")
+    async def round_trips():
+        # Stands in for two Redis calls (a command and a pipeline)
+        redis_round_trips.get().count += 2
+        return {}
+
+    def observed(name):
+        return REGISTRY.get_sample_value(
+            f"redis_round_trips_per_request_{name}", {"route": "/test/round-trips"}
+        ) or 0
+
+    before = observed("sum"), observed("count")
+    TestClient(counted_app).get("/test/round-trips")
+    assert (observed("sum"), observed("count")) == (before[0] + 2, before[1] + 1)
+    assert redis_round_trips.get() is None
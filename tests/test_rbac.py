@@ -171,4 +171,20 @@ def test_create_duplicate_permission(client, admin_headers):
         headers=admin_headers,
     )
     assert response.status_code == 409
-    assert "conflict" in response.json()["code"]
\ No newline at end of file
+    assert "conflict" in response.json()["code"]
+
+
+def test_cache_stats_requires_admin(client, regular_headers):
+    response = client.get("/api/v1/admin/cache-stats", headers=regular_headers)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_cache_stats_does_not_list_keys(client, admin_headers):
+    response = client.get(
+        "/api/v1/admin/cache-stats?limit=5", headers=admin_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert "all_keys" not in data
+    assert len(data["prefixes"]) <= 5
+    assert data["sampled_keys"] <= data["total_keys"] or data["total_keys"] == 0